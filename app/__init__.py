@@ -1,16 +1,30 @@
 from flask import Flask, render_template
-from app.extensions import db, migrate, jwt
+from app.extensions import db, migrate, jwt, principal_cache, response_cache, dashboard_cache, instrumentation, metrics, tenancy
 from app.config import Config
-from app.database import get_sync_engine
+from app.database import engine_options
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
     
+    # Pool and driver tuning for the Flask-SQLAlchemy engine, unless set explicitly
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config))
+    
+    # Per-request timings and N+1 detection, first so they cover the other hooks
+    instrumentation.init_app(app)
+    
     # Initialize extensions
     db.init_app(app)
+    tenancy.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
+    principal_cache.init_app(app, 'PRINCIPAL_CACHE', codec=_principal_codec())
+    response_cache.init_app(app)
+    dashboard_cache.init_app(app, 'DASHBOARD_SUMMARY')
+    metrics.init_app(app)
+    
+    from app.auth.utils import password_hasher
+    password_hasher.init_app(app)
     
     # Register blueprints
     from app.api import bp as api_bp
@@ -19,6 +33,10 @@ def create_app(config_class=Config):
     from app.auth import bp as auth_bp
     app.register_blueprint(auth_bp, url_prefix='/auth')
     
+    # Register CLI commands
+    from app.commands import register_commands
+    register_commands(app)
+    
     @app.route('/health')
     def health_check():
         return {'status': 'healthy'}
@@ -27,4 +45,26 @@ def create_app(config_class=Config):
     def landing_page():
         return render_template('index.html')
     
-    return app
\ No newline at end of file
+    return app
+
+def _principal_codec():
+    # Imported through the auth package: app.services.auth_service and the
+    # auth blueprint's routes import each other
+    import app.auth
+    from app.services.auth_service import PRINCIPAL_CODEC
+    return PRINCIPAL_CODEC
+
+def warm_up(app):
+    """
+    Do the one-off work a fresh process would otherwise do on its first requests
+    
+    Configures the ORM mappers and compiles every template, so that with
+    gunicorn's preload_app it happens once in the master and the forked
+    workers share the result instead of repeating it. Opens no database
+    connections.
+    """
+    from sqlalchemy.orm import configure_mappers
+    configure_mappers()
+    
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
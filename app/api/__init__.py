@@ -3,4 +3,4 @@ from flask import Blueprint
 bp = Blueprint('api', __name__)
 
 # Import routes after creating the blueprint to avoid circular imports
-from app.api import tenants, users, goals, initiatives, customers, ideas, feedback, comments
\ No newline at end of file
+from app.api import tenants, users, goals, initiatives, customers, ideas, feedback, comments, search, export, dashboard
\ No newline at end of file
@@ -0,0 +1,99 @@
+from flask import request, jsonify, current_app
+from app.api import bp
+from app.models import Comment
+from app.extensions import db
+from flask_jwt_extended import jwt_required
+from app.services.auth_service import AuthService
+from app.services.comment_service import CommentService, COMMENTABLE_ENTITIES
+from app.pagination import parse_page_args
+from app.serializers import COMMENT_SERIALIZER, json_response
+import uuid
+
+@bp.route('/comments', methods=['GET'])
+@jwt_required()
+def get_comments():
+    current_user = AuthService.get_current_user()
+    
+    entity_type = request.args.get('entity_type')
+    if entity_type not in COMMENTABLE_ENTITIES:
+        return jsonify({'error': f"Invalid entity_type. Must be one of: {', '.join(COMMENTABLE_ENTITIES)}"}), 400
+    
+    # Comma-separated ids, e.g. ?entity_id=a,b,c (duplicates ignored, order kept)
+    try:
+        entity_ids = list(dict.fromkeys(
+            uuid.UUID(value.strip()) for value in request.args.get('entity_id', '').split(',') if value.strip()
+        ))
+    except ValueError:
+        return jsonify({'error': 'Invalid entity_id format'}), 400
+    if not entity_ids:
+        return jsonify({'error': 'Missing required parameter: entity_id'}), 400
+    
+    max_entities = current_app.config['COMMENTS_MAX_ENTITIES']
+    if len(entity_ids) > max_entities:
+        return jsonify({'error': f'At most {max_entities} entity ids per request'}), 400
+    
+    try:
+        cursor, limit = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # A cursor continues one thread; follow a thread's next_cursor with its entity_id alone
+    if cursor and len(entity_ids) > 1:
+        return jsonify({'error': 'A cursor can only be used with a single entity_id'}), 400
+    
+    # Tenant isolation goes through the commented entities
+    found = CommentService.find_entities(current_user.tenant_id, entity_type, entity_ids)
+    missing = [str(entity_id) for entity_id in entity_ids if entity_id not in found]
+    if missing:
+        return jsonify({'error': f"{entity_type.capitalize()} not found: {', '.join(missing)}"}), 404
+    
+    try:
+        threads = CommentService.load_threads(entity_type, entity_ids, limit, cursor)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return json_response({
+        'threads': [
+            {
+                'entity_id': entity_id,
+                'comments': COMMENT_SERIALIZER.many(threads[entity_id][0]),
+                'next_cursor': threads[entity_id][1]
+            }
+            for entity_id in entity_ids
+        ]
+    })
+
+@bp.route('/comments', methods=['POST'])
+@jwt_required()
+def create_comment():
+    current_user = AuthService.get_current_user()
+    data = request.get_json() or {}
+    
+    # Validate required fields
+    for field in ('entity_type', 'entity_id', 'content'):
+        if not data.get(field):
+            return jsonify({'error': f'Missing required field: {field}'}), 400
+    
+    entity_type = data['entity_type']
+    if entity_type not in COMMENTABLE_ENTITIES:
+        return jsonify({'error': f"Invalid entity_type. Must be one of: {', '.join(COMMENTABLE_ENTITIES)}"}), 400
+    
+    try:
+        entity_id = uuid.UUID(str(data['entity_id']))
+    except ValueError:
+        return jsonify({'error': 'Invalid entity_id format'}), 400
+    
+    if not CommentService.find_entities(current_user.tenant_id, entity_type, [entity_id]):
+        return jsonify({'error': f'{entity_type.capitalize()} not found'}), 404
+    
+    comment = Comment(
+        user_id=current_user.id,
+        content=data['content'],
+        entity_type=entity_type,
+        entity_id=entity_id
+    )
+    
+    db.session.add(comment)
+    db.session.commit()
+    
+    return json_response(COMMENT_SERIALIZER.one(comment), 201)
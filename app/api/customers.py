@@ -0,0 +1,70 @@
+from flask import request, jsonify
+from app.api import bp
+from app.models import Customer
+from app.extensions import db
+from flask_jwt_extended import jwt_required
+from app.services.auth_service import AuthService
+from app.services.customer_service import CustomerService
+from app.pagination import Keyset, parse_page_args
+from app.serializers import CUSTOMER_SERIALIZER, json_response
+from sqlalchemy import func, literal_column
+
+# Revenue sorts NULL as 0 so the keyset comparison never meets a NULL. The 0 is
+# inlined rather than bound so the expression matches idx_customers_tenant_revenue.
+SORT_REVENUE = func.coalesce(Customer.revenue, literal_column('0')).label('sort_revenue')
+
+# Sort orders for the list, each backed by an index on (tenant_id, <keys>):
+# name -> (keyset, extra sort columns to select alongside the customer)
+CUSTOMER_SORTS = {
+    'revenue': (Keyset(SORT_REVENUE.desc(), Customer.id), [SORT_REVENUE]),
+    'status': (Keyset(Customer.status, Customer.id), []),
+}
+
+VALID_STATUSES = ['active', 'inactive', 'prospect']
+
+@bp.route('/customers', methods=['GET'])
+@jwt_required()
+def get_customers():
+    current_user = AuthService.get_current_user()
+    
+    sort = request.args.get('sort', 'revenue')
+    if sort not in CUSTOMER_SORTS:
+        return jsonify({'error': f"Invalid sort. Must be one of: {', '.join(CUSTOMER_SORTS)}"}), 400
+    keyset, sort_columns = CUSTOMER_SORTS[sort]
+    
+    # Sort keys are selected too, so the next cursor can be built from the last row
+    query = CustomerService.select_with_stats(current_user.tenant_id, *sort_columns)
+    
+    # Optional status filter
+    status = request.args.get('status')
+    if status:
+        if status not in VALID_STATUSES:
+            return jsonify({'error': f"Invalid status. Must be one of: {', '.join(VALID_STATUSES)}"}), 400
+        query = query.where(Customer.status == status)
+    
+    try:
+        cursor, limit = parse_page_args(request.args)
+        query = keyset.apply(query, cursor, limit)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    customers, next_cursor = keyset.page(db.session.execute(query).all(), limit)
+    
+    return json_response({
+        'customers': CUSTOMER_SERIALIZER.many(customers),
+        'next_cursor': next_cursor
+    })
+
+@bp.route('/customers/<uuid:customer_id>', methods=['GET'])
+@jwt_required()
+def get_customer(customer_id):
+    current_user = AuthService.get_current_user()
+    
+    # Tenant isolation is part of the lookup, so other tenants' customers are simply not found
+    customer = db.session.execute(
+        CustomerService.select_with_stats(current_user.tenant_id).where(Customer.id == customer_id)
+    ).first()
+    if customer is None:
+        return jsonify({'error': 'Customer not found'}), 404
+    
+    return json_response(CUSTOMER_SERIALIZER.one(customer))
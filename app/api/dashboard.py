@@ -0,0 +1,17 @@
+from flask import jsonify
+from app.api import bp
+from flask_jwt_extended import jwt_required
+from app.services.auth_service import AuthService
+from app.services.dashboard_service import DashboardService
+from app.serializers import json_response
+
+@bp.route('/dashboard/summary', methods=['GET'])
+@jwt_required()
+def get_dashboard_summary():
+    current_user = AuthService.get_current_user()
+    
+    summary = DashboardService.get_summary(current_user.tenant_id)
+    if summary is None:
+        return jsonify({'error': 'Tenant not found'}), 404
+    
+    return json_response(summary)
@@ -0,0 +1,47 @@
+from flask import request, jsonify, current_app, stream_with_context
+from app.api import bp
+from app.extensions import db
+from flask_jwt_extended import jwt_required
+from app.services.auth_service import AuthService
+from app.services.export_service import ExportService, EXPORT_RESOURCES, EXPORT_FORMATS
+from app.instrumentation import allow_query_repeats
+
+@bp.route('/export/<resource>', methods=['GET'])
+@jwt_required()
+def export_resource(resource):
+    current_user = AuthService.get_current_user()
+    
+    if resource not in EXPORT_RESOURCES:
+        return jsonify({'error': f"Invalid resource. Must be one of: {', '.join(EXPORT_RESOURCES)}"}), 404
+    
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f"Invalid format. Must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
+    
+    compress = request.args.get('gzip', 'false').lower() in ('1', 'true', 'yes')
+    mimetype, extension, _, _ = EXPORT_FORMATS[fmt]
+    filename = f'{resource}.{extension}'
+    if compress:
+        mimetype, filename = 'application/gzip', f'{filename}.gz'
+    
+    # Release the session's connection (and transaction) before streaming;
+    # each chunk of the export is read on its own short-lived connection
+    db.session.close()
+    
+    # One keyset query per chunk, by design; the request's metrics stay live
+    # while stream_with_context runs the chunks
+    allow_query_repeats()
+    
+    body = ExportService.stream(
+        current_user.tenant_id,
+        resource,
+        fmt,
+        chunk_rows=current_app.config['EXPORT_CHUNK_ROWS'],
+        compress=compress
+    )
+    
+    return current_app.response_class(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
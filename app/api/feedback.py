@@ -0,0 +1,32 @@
+from flask import request, jsonify, current_app
+from werkzeug.wsgi import get_input_stream
+from app.api import bp
+from flask_jwt_extended import jwt_required
+from app.services.auth_service import AuthService
+from app.services.feedback_service import FeedbackService
+from app.instrumentation import allow_query_repeats
+
+@bp.route('/feedback/ingest', methods=['POST'])
+@jwt_required()
+def ingest_feedback():
+    current_user = AuthService.get_current_user()
+    
+    # Read the raw body incrementally; request.stream would enforce
+    # MAX_CONTENT_LENGTH, which is meant for uploads buffered in memory
+    stream = get_input_stream(request.environ, max_content_length=None)
+    
+    # One set of statements per batch, by design
+    allow_query_repeats()
+    
+    result = FeedbackService.ingest_stream(
+        current_user.tenant_id,
+        stream,
+        batch_size=current_app.config['FEEDBACK_INGEST_BATCH_SIZE'],
+        max_line_bytes=current_app.config['FEEDBACK_INGEST_MAX_LINE_BYTES'],
+        max_errors=current_app.config['FEEDBACK_INGEST_MAX_ERRORS']
+    )
+    
+    if not result['lines']:
+        return jsonify({'error': 'Request body is empty'}), 400
+    
+    return jsonify(result), 201 if result['created'] else 400
@@ -1,33 +1,50 @@
-from flask import request, jsonify
+from flask import request, jsonify, current_app, abort
 from app.api import bp
 from app.models import Goal
 from app.extensions import db
 from flask_jwt_extended import jwt_required
 from app.services.auth_service import AuthService
-from datetime import datetime
+from app.services.goal_service import GoalService
+from app.pagination import Keyset, parse_page_args
+from app.serializers import GOAL_SERIALIZER, json_response
+from app.response_cache import cached_response
+from app.etags import collection_etag, not_modified, with_etag
+from sqlalchemy import select
+
+GOAL_KEYSET = Keyset(Goal.created_at, Goal.id)
 
 @bp.route('/goals', methods=['GET'])
 @jwt_required()
+@cached_response('goals')
 def get_goals():
     current_user = AuthService.get_current_user()
     
-    # Build query with tenant isolation
-    goals = Goal.query.filter_by(tenant_id=current_user.tenant_id).all()
-    
-    return jsonify({
-        'goals': [
-            {
-                'id': str(goal.id),
-                'title': goal.title,
-                'description': goal.description,
-                'target_date': goal.target_date.isoformat() if goal.target_date else None,
-                'status': goal.status,  
-                'created_at': goal.created_at.isoformat(),
-                'updated_at': goal.updated_at.isoformat(),
-                'initiative_count': goal.initiatives.count()
-            } for goal in goals
-        ]
-    })
+    # Answer polls for unchanged data without loading any rows
+    etag = collection_etag(Goal, current_user.tenant_id)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    try:
+        # Sparse fieldset, e.g. ?fields=id,title,status
+        serializer = GOAL_SERIALIZER.only(request.args.get('fields'))
+        cursor, limit = parse_page_args(request.args)
+        
+        # Select only the requested columns (plus the sort keys) with tenant isolation
+        query = (
+            select(*serializer.columns(Goal, *GOAL_KEYSET.keys))
+            .where(Goal.tenant_id == current_user.tenant_id)
+        )
+        query = GOAL_KEYSET.apply(query, cursor, limit)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    goals, next_cursor = GOAL_KEYSET.page(db.session.execute(query).all(), limit)
+    
+    return with_etag(json_response({
+        'goals': serializer.many(goals),
+        'next_cursor': next_cursor
+    }), etag)
 
 @bp.route('/goals', methods=['POST'])
 @jwt_required()
@@ -35,92 +52,64 @@ def create_goal():
     current_user = AuthService.get_current_user()
     data = request.get_json() or {}
     
-    # Validate required fields
-    if 'title' not in data:
-        return jsonify({'error': 'Missing required field: title'}), 400
-    
-    # Process target_date if provided
-    target_date = None
-    if 'target_date' in data and data['target_date']:
-        try:
-            target_date = datetime.strptime(data['target_date'], '%Y-%m-%d').date()
-        except ValueError:
-            return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+    values, error = GoalService.validate_new_goal(data)
+    if error:
+        return jsonify({'error': error}), 400
     
     # Create goal
-    goal = Goal(
-        tenant_id=current_user.tenant_id,
-        title=data['title'],
-        description=data.get('description', ''),
-        target_date=target_date,
-        status=data.get('status', 'In Progress')  # Handle status
-    )
+    goal = Goal(tenant_id=current_user.tenant_id, **values)
     
     db.session.add(goal)
     db.session.commit()
     
-    return jsonify({
-        'id': str(goal.id),
-        'title': goal.title,
-        'description': goal.description,
-        'target_date': goal.target_date.isoformat() if goal.target_date else None,
-        'status': goal.status,  # Include status
-        'created_at': goal.created_at.isoformat(),
-        'updated_at': goal.updated_at.isoformat()
-    }), 201
+    return json_response(GOAL_SERIALIZER.one(goal), 201)
 
-@bp.route('/goals/<uuid:goal_id>', methods=['PUT'])
+@bp.route('/goals/bulk', methods=['POST'])
 @jwt_required()
-def update_goal(goal_id):
+def bulk_create_goals():
     current_user = AuthService.get_current_user()
-    goal = Goal.query.get_or_404(goal_id)
+    data = request.get_json() or {}
     
-    # Check tenant isolation
-    AuthService.ensure_user_tenant_match(current_user, goal)
+    rows = data.get('goals') if isinstance(data, dict) else None
+    if not isinstance(rows, list) or not rows:
+        return jsonify({'error': 'Missing required field: goals'}), 400
     
-    data = request.get_json() or {}
+    max_rows = current_app.config['BULK_MAX_ROWS']
+    if len(rows) > max_rows:
+        return jsonify({'error': f'At most {max_rows} goals per request'}), 400
     
-    # Update fields if provided
-    if 'title' in data:
-        goal.title = data['title']
+    result = GoalService.bulk_create(current_user.tenant_id, rows)
     
-    if 'description' in data:
-        goal.description = data['description']
+    return jsonify(result), 201 if result['created'] else 400
+
+@bp.route('/goals/<uuid:goal_id>', methods=['PUT'])
+@jwt_required()
+def update_goal(goal_id):
+    current_user = AuthService.get_current_user()
+    data = request.get_json() or {}
     
-    if 'target_date' in data:
-        if data['target_date'] is None:
-            goal.target_date = None
-        else:
-            try:
-                goal.target_date = datetime.strptime(data['target_date'], '%Y-%m-%d').date()
-            except ValueError:
-                return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+    values, error = GoalService.validate_goal_update(data)
+    if error:
+        return jsonify({'error': error}), 400
     
-    if 'status' in data:
-        goal.status = data['status']  # Update status if provided
+    # One UPDATE ... RETURNING, scoped to the tenant; the response is built from the returned row
+    goal = Goal.query.update_for_tenant(goal_id, current_user.tenant_id, values, GOAL_SERIALIZER.columns(Goal))
+    if goal is None:
+        abort(404)
     
     db.session.commit()
     
-    return jsonify({
-        'id': str(goal.id),
-        'title': goal.title,
-        'description': goal.description,
-        'target_date': goal.target_date.isoformat() if goal.target_date else None,
-        'status': goal.status,  # Include status
-        'created_at': goal.created_at.isoformat(),
-        'updated_at': goal.updated_at.isoformat()
-    })
+    return json_response(GOAL_SERIALIZER.one(goal))
 
 @bp.route('/goals/<uuid:goal_id>', methods=['DELETE'])
 @jwt_required()
 def delete_goal(goal_id):
     current_user = AuthService.get_current_user()
-    goal = Goal.query.get_or_404(goal_id)
     
-    # Check tenant isolation
-    AuthService.ensure_user_tenant_match(current_user, goal)
+    # One DELETE ... RETURNING id; initiatives are unlinked by the goal_id foreign key
+    if not Goal.query.delete_for_tenant(goal_id, current_user.tenant_id):
+        abort(404)
     
-    db.session.delete(goal)
     db.session.commit()
     
     return '', 204
\ No newline at end of file
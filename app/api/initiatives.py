@@ -1,28 +1,54 @@
-from flask import request, jsonify
+from flask import request, jsonify, current_app, abort
 from app.api import bp
 from app.models import Initiative, Goal
 from app.extensions import db
 from flask_jwt_extended import jwt_required
 from app.services.auth_service import AuthService
+from app.services.initiative_service import InitiativeService
+from app.pagination import Keyset, parse_page_args
+from app.serializers import INITIATIVE_SERIALIZER, json_response
+from app.response_cache import cached_response
+from app.etags import collection_etag, item_etag, not_modified, with_etag
+from sqlalchemy import select
 import uuid
 
+# Same order as before (highest priority first, then oldest), with id as tiebreaker
+INITIATIVE_KEYSET = Keyset(Initiative.priority.desc(), Initiative.created_at, Initiative.id)
+
 @bp.route('/initiatives', methods=['GET'])
 @jwt_required()
+@cached_response('initiatives')
 def get_initiatives():
     current_user = AuthService.get_current_user()
     
+    # Answer polls for unchanged data without loading any rows
+    etag = collection_etag(Initiative, current_user.tenant_id)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
     # Optional query parameters
     goal_id = request.args.get('goal_id')
     status = request.args.get('status')
     
-    # Build query with tenant isolation
-    query = Initiative.query.filter_by(tenant_id=current_user.tenant_id)
+    try:
+        # Sparse fieldset, e.g. ?fields=id,title,status,priority
+        serializer = INITIATIVE_SERIALIZER.only(request.args.get('fields'))
+        cursor, limit = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # Select only the requested columns (plus the sort keys) with tenant isolation
+    query = (
+        select(*serializer.columns(Initiative, *INITIATIVE_KEYSET.keys))
+        .where(Initiative.tenant_id == current_user.tenant_id)
+    )
     
     # Apply filters if provided
     if goal_id:
         try:
             goal_uuid = uuid.UUID(goal_id)
-            query = query.filter_by(goal_id=goal_uuid)
+            query = query.where(Initiative.goal_id == goal_uuid)
         except ValueError:
             return jsonify({'error': 'Invalid goal_id format'}), 400
     
@@ -30,46 +56,35 @@ def get_initiatives():
         valid_statuses = ['active', 'planned', 'completed']
         if status not in valid_statuses:
             return jsonify({'error': f"Invalid status. Must be one of: {', '.join(valid_statuses)}"}), 400
-        query = query.filter_by(status=status)
+        query = query.where(Initiative.status == status)
     
     # Order by priority (highest first) and then by creation date
-    initiatives = query.order_by(Initiative.priority.desc(), Initiative.created_at).all()
-    
-    return jsonify({
-        'initiatives': [
-            {
-                'id': str(initiative.id),
-                'title': initiative.title,
-                'description': initiative.description,
-                'status': initiative.status,
-                'priority': initiative.priority,
-                'goal_id': str(initiative.goal_id) if initiative.goal_id else None,
-                'created_at': initiative.created_at.isoformat(),
-                'updated_at': initiative.updated_at.isoformat()
-            } for initiative in initiatives
-        ]
-    })
+    try:
+        query = INITIATIVE_KEYSET.apply(query, cursor, limit)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    initiatives, next_cursor = INITIATIVE_KEYSET.page(db.session.execute(query).all(), limit)
+    
+    return with_etag(json_response({
+        'initiatives': serializer.many(initiatives),
+        'next_cursor': next_cursor
+    }), etag)
 
 @bp.route('/initiatives/<uuid:initiative_id>', methods=['GET'])
 @jwt_required()
 def get_initiative(initiative_id):
     current_user = AuthService.get_current_user()
     
-    initiative = Initiative.query.get_or_404(initiative_id)
-    
-    # Check tenant isolation
-    AuthService.ensure_user_tenant_match(current_user, initiative)
-    
-    return jsonify({
-        'id': str(initiative.id),
-        'title': initiative.title,
-        'description': initiative.description,
-        'status': initiative.status,
-        'priority': initiative.priority,
-        'goal_id': str(initiative.goal_id) if initiative.goal_id else None,
-        'created_at': initiative.created_at.isoformat(),
-        'updated_at': initiative.updated_at.isoformat()
-    })
+    # Checks existence and tenant isolation from the row's version alone
+    etag = item_etag(Initiative, initiative_id, current_user)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    initiative = Initiative.query.get_for_tenant_or_404(initiative_id, current_user.tenant_id)
+    
+    return with_etag(json_response(INITIATIVE_SERIALIZER.one(initiative)), etag)
 
 @bp.route('/initiatives', methods=['POST'])
 @jwt_required()
@@ -77,135 +92,74 @@ def create_initiative():
     current_user = AuthService.get_current_user()
     data = request.get_json() or {}
     
-    # Validate required fields
-    required_fields = ['title', 'status', 'priority']
-    for field in required_fields:
-        if field not in data:
-            return jsonify({'error': f'Missing required field: {field}'}), 400
+    values, error = InitiativeService.validate_new_initiative(data)
+    if error:
+        return jsonify({'error': error}), 400
     
-    # Validate status
-    valid_statuses = ['active', 'planned', 'completed']
-    if data['status'] not in valid_statuses:
-        return jsonify({'error': f"Invalid status. Must be one of: {', '.join(valid_statuses)}"}), 400
-    
-    # Validate priority
-    try:
-        priority = int(data['priority'])
-        if not 1 <= priority <= 5:
-            return jsonify({'error': 'Priority must be between 1 and 5'}), 400
-    except (ValueError, TypeError):
-        return jsonify({'error': 'Priority must be an integer between 1 and 5'}), 400
-    
-    # Check goal if provided
-    goal = None
-    if 'goal_id' in data and data['goal_id']:
-        try:
-            goal_id = uuid.UUID(data['goal_id'])
-            goal = Goal.query.get(goal_id)
-            if not goal:
-                return jsonify({'error': 'Goal not found'}), 404
-            
-            # Ensure goal is from the same tenant
-            AuthService.ensure_user_tenant_match(current_user, goal)
-        except ValueError:
-            return jsonify({'error': 'Invalid goal_id format'}), 400
+    # Check goal if provided (only its id is read, within the tenant)
+    if values['goal_id'] and not Goal.query.exists_for_tenant(values['goal_id'], current_user.tenant_id):
+        return jsonify({'error': 'Goal not found'}), 404
     
     # Create initiative
-    initiative = Initiative(
-        tenant_id=current_user.tenant_id,
-        title=data['title'],
-        description=data.get('description', ''),
-        status=data['status'],
-        priority=priority,
-        goal_id=goal.id if goal else None
-    )
+    initiative = Initiative(tenant_id=current_user.tenant_id, **values)
     
     db.session.add(initiative)
     db.session.commit()
     
-    return jsonify({
-        'id': str(initiative.id),
-        'title': initiative.title,
-        'description': initiative.description,
-        'status': initiative.status,
-        'priority': initiative.priority,
-        'goal_id': str(initiative.goal_id) if initiative.goal_id else None,
-        'created_at': initiative.created_at.isoformat(),
-        'updated_at': initiative.updated_at.isoformat()
-    }), 201
+    return json_response(INITIATIVE_SERIALIZER.one(initiative), 201)
 
-@bp.route('/initiatives/<uuid:initiative_id>', methods=['PUT'])
+@bp.route('/initiatives/bulk', methods=['POST'])
 @jwt_required()
-def update_initiative(initiative_id):
+def bulk_create_initiatives():
     current_user = AuthService.get_current_user()
-    initiative = Initiative.query.get_or_404(initiative_id)
+    data = request.get_json() or {}
     
-    # Check tenant isolation
-    AuthService.ensure_user_tenant_match(current_user, initiative)
+    rows = data.get('initiatives') if isinstance(data, dict) else None
+    if not isinstance(rows, list) or not rows:
+        return jsonify({'error': 'Missing required field: initiatives'}), 400
     
-    data = request.get_json() or {}
+    max_rows = current_app.config['BULK_MAX_ROWS']
+    if len(rows) > max_rows:
+        return jsonify({'error': f'At most {max_rows} initiatives per request'}), 400
     
-    # Update fields if provided
-    if 'title' in data:
-        initiative.title = data['title']
+    result = InitiativeService.bulk_create(current_user.tenant_id, rows)
     
-    if 'description' in data:
-        initiative.description = data['description']
+    return jsonify(result), 201 if result['created'] else 400
+
+@bp.route('/initiatives/<uuid:initiative_id>', methods=['PUT'])
+@jwt_required()
+def update_initiative(initiative_id):
+    current_user = AuthService.get_current_user()
+    data = request.get_json() or {}
     
-    if 'status' in data:
-        valid_statuses = ['active', 'planned', 'completed']
-        if data['status'] not in valid_statuses:
-            return jsonify({'error': f"Invalid status. Must be one of: {', '.join(valid_statuses)}"}), 400
-        initiative.status = data['status']
+    values, error = InitiativeService.validate_initiative_update(data)
+    if error:
+        return jsonify({'error': error}), 400
     
-    if 'priority' in data:
-        try:
-            priority = int(data['priority'])
-            if not 1 <= priority <= 5:
-                return jsonify({'error': 'Priority must be between 1 and 5'}), 400
-            initiative.priority = priority
-        except (ValueError, TypeError):
-            return jsonify({'error': 'Priority must be an integer between 1 and 5'}), 400
-    
-    if 'goal_id' in data:
-        if data['goal_id'] is None:
-            initiative.goal_id = None
-        else:
-            try:
-                goal_id = uuid.UUID(data['goal_id'])
-                goal = Goal.query.get(goal_id)
-                if not goal:
-                    return jsonify({'error': 'Goal not found'}), 404
-                
-                # Ensure goal is from the same tenant
-                AuthService.ensure_user_tenant_match(current_user, goal)
-                initiative.goal_id = goal.id
-            except ValueError:
-                return jsonify({'error': 'Invalid goal_id format'}), 400
+    # A new goal must belong to the tenant (only its id is read)
+    if values.get('goal_id') and not Goal.query.exists_for_tenant(values['goal_id'], current_user.tenant_id):
+        return jsonify({'error': 'Goal not found'}), 404
+    
+    # One UPDATE ... RETURNING, scoped to the tenant; the response is built from the returned row
+    initiative = Initiative.query.update_for_tenant(
+        initiative_id, current_user.tenant_id, values, INITIATIVE_SERIALIZER.columns(Initiative)
+    )
+    if initiative is None:
+        abort(404)
     
     db.session.commit()
     
-    return jsonify({
-        'id': str(initiative.id),
-        'title': initiative.title,
-        'description': initiative.description,
-        'status': initiative.status,
-        'priority': initiative.priority,
-        'goal_id': str(initiative.goal_id) if initiative.goal_id else None,
-        'created_at': initiative.created_at.isoformat(),
-        'updated_at': initiative.updated_at.isoformat()
-    })
+    return json_response(INITIATIVE_SERIALIZER.one(initiative))
 
 @bp.route('/initiatives/<uuid:initiative_id>', methods=['DELETE'])
 @jwt_required()
 def delete_initiative(initiative_id):
     current_user = AuthService.get_current_user()
-    initiative = Initiative.query.get_or_404(initiative_id)
     
-    # Check tenant isolation
-    AuthService.ensure_user_tenant_match(current_user, initiative)
+    # One DELETE ... RETURNING id; ideas, feedback links and comments are handled by the database
+    if not Initiative.query.delete_for_tenant(initiative_id, current_user.tenant_id):
+        abort(404)
     
-    db.session.delete(initiative)
     db.session.commit()
     
     return '', 204
\ No newline at end of file
@@ -0,0 +1,34 @@
+from flask import request, jsonify
+from app.api import bp
+from flask_jwt_extended import jwt_required
+from app.services.auth_service import AuthService
+from app.services.search_service import SearchService, SEARCH_ENTITIES
+from app.pagination import parse_page_args
+from app.serializers import json_response
+
+@bp.route('/search', methods=['GET'])
+@jwt_required()
+def search():
+    current_user = AuthService.get_current_user()
+    
+    query = (request.args.get('q') or '').strip()
+    if not query:
+        return jsonify({'error': 'Missing required parameter: q'}), 400
+    
+    # Optional comma-separated entity types, e.g. ?types=idea,feedback
+    types = [name.strip() for name in request.args.get('types', '').split(',') if name.strip()]
+    types = types or list(SEARCH_ENTITIES)
+    unknown = [name for name in types if name not in SEARCH_ENTITIES]
+    if unknown:
+        return jsonify({'error': f"Invalid types. Must be among: {', '.join(SEARCH_ENTITIES)}"}), 400
+    
+    try:
+        cursor, limit = parse_page_args(request.args)
+        results, next_cursor = SearchService.search(current_user.tenant_id, query, types, cursor, limit)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return json_response({
+        'results': results,
+        'next_cursor': next_cursor
+    })
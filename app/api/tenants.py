@@ -0,0 +1,43 @@
+from flask import jsonify, url_for
+from app.api import bp
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.auth_service import AuthService
+from app.services.tenant_deletion_service import TenantDeletionService
+from app.serializers import TENANT_DELETION_SERIALIZER, json_response
+
+@bp.route('/tenants/<uuid:tenant_id>', methods=['DELETE'])
+@jwt_required()
+def delete_tenant(tenant_id):
+    # Only an admin of the tenant can offboard it
+    current_user = AuthService.verify_admin_role()
+    if current_user.tenant_id != tenant_id:
+        return jsonify({'error': 'Not authorized'}), 403
+    
+    deletion = TenantDeletionService.request_deletion(tenant_id, current_user.id)
+    if deletion is None:
+        return jsonify({'error': 'Tenant not found'}), 404
+    
+    # Runs on a background thread in batches; a repeated request resumes a
+    # job that failed or whose process died, and otherwise just reports it
+    if deletion.status != 'completed':
+        TenantDeletionService.start_background(deletion.id)
+    
+    response = json_response(TENANT_DELETION_SERIALIZER.one(deletion), 202)
+    response.headers['Location'] = url_for('api.get_tenant_deletion', tenant_id=tenant_id)
+    return response
+
+@bp.route('/tenants/<uuid:tenant_id>/deletion', methods=['GET'])
+@jwt_required()
+def get_tenant_deletion(tenant_id):
+    deletion = TenantDeletionService.get(tenant_id)
+    
+    # The admin who asked can follow the job to the end, after their own user
+    # is deleted with the tenant; anyone else has to be a user of the tenant
+    if deletion is None or str(deletion.requested_by) != get_jwt_identity():
+        current_user = AuthService.get_current_user()
+        if current_user.tenant_id != tenant_id:
+            return jsonify({'error': 'Not authorized'}), 403
+        if deletion is None:
+            return jsonify({'error': 'No deletion requested for this tenant'}), 404
+    
+    return json_response(TENANT_DELETION_SERIALIZER.one(deletion))
@@ -2,53 +2,50 @@ from flask import request, jsonify
 from app.api import bp
 from app.models.user import User
 from app.extensions import db
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+from app.services.auth_service import AuthService
+from app.auth.utils import password_hasher, PasswordHasherBusy
+from app.pagination import Keyset, parse_page_args
+from app.serializers import USER_SERIALIZER, USER_UPDATE_SERIALIZER, json_response
 import uuid
 
+USER_KEYSET = Keyset(User.created_at, User.id)
+
 @bp.route('/users', methods=['GET'])
 @jwt_required()
 def get_users():
-    current_user_id = get_jwt_identity()
-    current_user = User.query.get_or_404(current_user_id)
+    current_user = AuthService.get_current_user()
     
     # Only fetch users from the same tenant
-    users = User.query.filter_by(tenant_id=current_user.tenant_id).all()
-    
-    return jsonify({
-        'users': [
-            {
-                'id': str(user.id),
-                'email': user.email,
-                'role': user.role,
-                'created_at': user.created_at.isoformat()
-            } for user in users
-        ]
+    query = User.query.filter_by(tenant_id=current_user.tenant_id)
+    
+    try:
+        cursor, limit = parse_page_args(request.args)
+        query = USER_KEYSET.apply(query, cursor, limit)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    users, next_cursor = USER_KEYSET.page(query.all(), limit)
+    
+    return json_response({
+        'users': USER_SERIALIZER.many(users),
+        'next_cursor': next_cursor
     })
 
 @bp.route('/users/<uuid:user_id>', methods=['GET'])
 @jwt_required()
 def get_user(user_id):
-    current_user_id = get_jwt_identity()
-    current_user = User.query.get_or_404(current_user_id)
-    
-    user = User.query.get_or_404(user_id)
+    current_user = AuthService.get_current_user()
     
-    # Check if user belongs to the same tenant
-    if user.tenant_id != current_user.tenant_id:
-        return jsonify({'error': 'Not authorized'}), 403
+    # Only users of the same tenant are found
+    user = User.query.get_for_tenant_or_404(user_id, current_user.tenant_id)
     
-    return jsonify({
-        'id': str(user.id),
-        'email': user.email,
-        'role': user.role,
-        'created_at': user.created_at.isoformat()
-    })
+    return json_response(USER_SERIALIZER.one(user))
 
 @bp.route('/users', methods=['POST'])
 @jwt_required()
 def create_user():
-    current_user_id = get_jwt_identity()
-    current_user = User.query.get_or_404(current_user_id)
+    current_user = AuthService.get_current_user()
     
     # Check if current user has admin role
     if current_user.role != 'admin':
@@ -63,7 +60,6 @@ def create_user():
             return jsonify({'error': f'Missing required field: {field}'}), 400
     
     # Use AuthService to register user
-    from app.services.auth_service import AuthService
     result, status_code = AuthService.register_user(
         tenant_id=current_user.tenant_id,
         email=data['email'],
@@ -73,13 +69,8 @@ def create_user():
     
     # If successful, return just the user data without tokens
     if status_code == 201 and 'user' in result:
-        user_data = result['user']
-        return jsonify({
-            'id': user_data['id'],
-            'email': user_data['email'],
-            'role': user_data['role'],
-            'created_at': User.query.get(uuid.UUID(user_data['id'])).created_at.isoformat()
-        }), 201
+        user = db.session.get(User, uuid.UUID(result['user']['id']))
+        return json_response(USER_SERIALIZER.one(user), 201)
     
     # Otherwise return the error
     return jsonify(result), status_code
@@ -87,13 +78,10 @@ def create_user():
 @bp.route('/users/<uuid:user_id>', methods=['PUT'])
 @jwt_required()
 def update_user(user_id):
-    current_user_id = get_jwt_identity()
-    current_user = User.query.get_or_404(current_user_id)
+    current_user = AuthService.get_current_user()
     
-    # Check if user being updated belongs to the same tenant
-    user = User.query.get_or_404(user_id)
-    if user.tenant_id != current_user.tenant_id:
-        return jsonify({'error': 'Not authorized'}), 403
+    # Only users of the same tenant are found
+    user = User.query.get_for_tenant_or_404(user_id, current_user.tenant_id)
     
     # Only admin or the user themselves can update user info
     if current_user.role != 'admin' and current_user.id != user.id:
@@ -120,32 +108,30 @@ def update_user(user_id):
         user.role = data['role']
     
     if 'password' in data:
-        user.set_password(data['password'])
+        try:
+            user.password_hash = password_hasher.hash(data['password'])
+        except PasswordHasherBusy:
+            return jsonify({'error': 'Too many concurrent password changes, please retry'}), 503, {'Retry-After': '1'}
     
     db.session.commit()
     
-    return jsonify({
-        'id': str(user.id),
-        'email': user.email,
-        'role': user.role,
-        'updated_at': user.updated_at.isoformat()
-    })
+    # Role and email are cached in the user's principal
+    if 'role' in data or 'email' in data:
+        AuthService.invalidate_principal(user.id)
+    
+    return json_response(USER_UPDATE_SERIALIZER.one(user))
 
 @bp.route('/users/<uuid:user_id>', methods=['DELETE'])
 @jwt_required()
 def delete_user(user_id):
-    current_user_id = get_jwt_identity()
-    current_user = User.query.get_or_404(current_user_id)
+    current_user = AuthService.get_current_user()
     
     # Only admin can delete users
     if current_user.role != 'admin':
         return jsonify({'error': 'Admin role required'}), 403
     
-    user = User.query.get_or_404(user_id)
-    
-    # Check if user belongs to the same tenant
-    if user.tenant_id != current_user.tenant_id:
-        return jsonify({'error': 'Not authorized'}), 403
+    # Only users of the same tenant are found
+    user = User.query.get_for_tenant_or_404(user_id, current_user.tenant_id)
     
     # Prevent admins from deleting themselves
     if user.id == current_user.id:
@@ -153,5 +139,6 @@ def delete_user(user_id):
     
     db.session.delete(user)
     db.session.commit()
+    AuthService.invalidate_principal(user.id)
     
     return '', 204
\ No newline at end of file
@@ -1,9 +1,13 @@
 # app/auth/routes.py
-from flask import request, jsonify, render_template, make_response, redirect, current_app
+from flask import request, jsonify, render_template, make_response, redirect, current_app, abort
 from app.auth import bp
 from app.models.user import User
 from app.models.tenant import Tenant
 from app.extensions import db, jwt
+from app.services.auth_service import AuthService
+from app.services.dashboard_service import DashboardService
+from app.auth.utils import password_hasher, PasswordHasherBusy
+from app.tenancy import set_current_tenant, unscoped
 from flask_jwt_extended import (
     create_access_token,
     create_refresh_token,
@@ -33,14 +37,33 @@ def login():
     # Find user by email within the tenant if tenant was found
     user = None
     if tenant:
+        set_current_tenant(tenant.id)
         user = User.query.filter_by(email=data['email'], tenant_id=tenant.id).first()
     else:
-        # Fallback to finding user by email only if no domain was provided
-        user = User.query.filter_by(email=data['email']).first()
+        # Fallback to finding user by email only if no domain was provided;
+        # the tenant is not known yet, so this lookup spans all of them
+        with unscoped():
+            user = User.query.filter_by(email=data['email']).first()
+        if user is not None:
+            set_current_tenant(user.tenant_id)
     
-    if not user or not user.check_password(data['password']):
+    # Verify on the bounded hashing pool rather than the request thread
+    try:
+        valid = user is not None and password_hasher.verify(user.password_hash, data['password'])
+    except PasswordHasherBusy:
+        return jsonify({'error': 'Too many concurrent logins, please retry'}), 503, {'Retry-After': '1'}
+    
+    if not valid:
         # Use vague error message for security
         return jsonify({'error': 'Invalid email or password'}), 401
+    
+    # Upgrade hashes made with older hashing parameters while the password is at hand
+    try:
+        if password_hasher.needs_rehash(user.password_hash):
+            user.password_hash = password_hasher.hash(data['password'])
+            db.session.commit()
+    except PasswordHasherBusy:
+        pass  # The old hash still works; upgrade on a later login
         
     # Get tenant information if not already retrieved
     if not tenant:
@@ -104,22 +127,23 @@ def register_page():
 @bp.route('/dashboard', methods=['GET'])
 @jwt_required()
 def dashboard():
-    user_id = get_jwt_identity()  # String (user_id)
     claims = get_jwt()  # Full JWT payload
-    user = User.query.get_or_404(uuid.UUID(user_id))
-    tenant = Tenant.query.get_or_404(uuid.UUID(claims['tenant_id']))
+    user = AuthService.get_current_user()
     
     # Validate tenant_id consistency
-    if user.tenant_id != tenant.id:
+    if str(user.tenant_id) != claims['tenant_id']:
         return jsonify({'error': 'Tenant mismatch'}), 403
     
-    # Fetch goals for the current tenant
-    from app.models.goal import Goal
-    goals = Goal.query.filter_by(tenant_id=tenant.id).all()
+    # Tenant, counts and recent activity come from the (cached) summary,
+    # read concurrently with the page's list when not cached
+    summary, goals = DashboardService.load_page(user.tenant_id, 'goals')
+    if summary is None:
+        abort(404)
     
     return render_template('dashboard/goals.html', 
                           user=user, 
-                          tenant=tenant,
+                          tenant=summary['tenant'],
+                          summary=summary,
                           goals=goals,
                           active_section='goals')
 
@@ -133,7 +157,6 @@ def register_tenant():
         if field not in data:
             return jsonify({'error': f'Missing required field: {field}'}), 400
     
-    from app.services.auth_service import AuthService
     result, status_code = AuthService.register_tenant(
         domain_name=data['domain_name'],
         email=data['email'],
@@ -166,9 +189,8 @@ def register_tenant():
 @bp.route('/register-user', methods=['POST'])
 @jwt_required()
 def register_user():
-    user_id = get_jwt_identity()  # String (user_id)
     claims = get_jwt()  # Full JWT payload
-    current_user = User.query.get_or_404(uuid.UUID(user_id))
+    current_user = AuthService.get_current_user()
     
     # Validate tenant_id from JWT
     if str(current_user.tenant_id) != claims['tenant_id']:
@@ -187,7 +209,6 @@ def register_user():
             return jsonify({'error': f'Missing required field: {field}'}), 400
     
     # Use AuthService to register user
-    from app.services.auth_service import AuthService
     result, status_code = AuthService.register_user(
         tenant_id=current_user.tenant_id,
         email=data['email'],
@@ -206,65 +227,68 @@ def logout():
 @bp.route('/initiatives', methods=['GET'])
 @jwt_required()
 def initiatives():
-    user_id = get_jwt_identity()  # String (user_id)
     claims = get_jwt()  # Full JWT payload
-    user = User.query.get_or_404(uuid.UUID(user_id))
-    tenant = Tenant.query.get_or_404(uuid.UUID(claims['tenant_id']))
+    user = AuthService.get_current_user()
     
     # Validate tenant_id consistency
-    if user.tenant_id != tenant.id:
+    if str(user.tenant_id) != claims['tenant_id']:
         return jsonify({'error': 'Tenant mismatch'}), 403
     
-    # In a real application, you would fetch initiatives from the database
-    # For now, we'll just render the template with empty data
-    initiatives = []
+    # Tenant, counts and recent activity come from the (cached) summary,
+    # read concurrently with the page's list when not cached
+    summary, initiatives = DashboardService.load_page(user.tenant_id, 'initiatives')
+    if summary is None:
+        abort(404)
     
     return render_template('dashboard/initiatives.html', 
                           user=user, 
-                          tenant=tenant,
+                          tenant=summary['tenant'],
+                          summary=summary,
                           initiatives=initiatives,
                           active_section='initiatives')
 
 @bp.route('/feedback', methods=['GET'])
 @jwt_required()
 def feedback():
-    user_id = get_jwt_identity()  # String (user_id)
     claims = get_jwt()  # Full JWT payload
-    user = User.query.get_or_404(uuid.UUID(user_id))
-    tenant = Tenant.query.get_or_404(uuid.UUID(claims['tenant_id']))
+    user = AuthService.get_current_user()
     
     # Validate tenant_id consistency
-    if user.tenant_id != tenant.id:
+    if str(user.tenant_id) != claims['tenant_id']:
         return jsonify({'error': 'Tenant mismatch'}), 403
     
-    # In a real application, you would fetch feedback from the database
-    # For now, we'll just render the template with empty data
-    feedback = []
+    # Tenant, counts and recent activity come from the (cached) summary,
+    # read concurrently with the page's list when not cached
+    summary, feedback = DashboardService.load_page(user.tenant_id, 'feedback')
+    if summary is None:
+        abort(404)
     
     return render_template('dashboard/feedback.html', 
                           user=user, 
-                          tenant=tenant,
+                          tenant=summary['tenant'],
+                          summary=summary,
                           feedback=feedback,
                           active_section='feedback')
 
 @bp.route('/ideas', methods=['GET'])
 @jwt_required()
 def ideas():
-    user_id = get_jwt_identity()  # String (user_id)
     claims = get_jwt()  # Full JWT payload
-    user = User.query.get_or_404(uuid.UUID(user_id))
-    tenant = Tenant.query.get_or_404(uuid.UUID(claims['tenant_id']))
+    user = AuthService.get_current_user()
     
     # Validate tenant_id consistency
-    if user.tenant_id != tenant.id:
+    if str(user.tenant_id) != claims['tenant_id']:
         return jsonify({'error': 'Tenant mismatch'}), 403
     
-    # In a real application, you would fetch ideas from the database
-    # For now, we'll just render the template with empty data
-    ideas = []
+    # Tenant, counts and recent activity come from the (cached) summary,
+    # read concurrently with the page's list when not cached
+    summary, ideas = DashboardService.load_page(user.tenant_id, 'ideas')
+    if summary is None:
+        abort(404)
     
     return render_template('dashboard/ideas.html', 
                           user=user, 
-                          tenant=tenant,
+                          tenant=summary['tenant'],
+                          summary=summary,
                           ideas=ideas,
                           active_section='ideas')
\ No newline at end of file
@@ -0,0 +1,80 @@
+# app/auth/utils.py
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when no hashing slot frees up within PASSWORD_HASH_QUEUE_TIMEOUT"""
+
+
+class PasswordHasher:
+    """
+    Runs password hashing on a small, bounded thread pool.
+
+    Hashing is deliberately CPU-heavy. hashlib releases the GIL while it
+    works, so running it on a pool of PASSWORD_HASH_MAX_WORKERS threads caps
+    how many cores logins and registrations can take per worker process,
+    however many request threads arrive at once; the rest wait for a slot
+    (up to PASSWORD_HASH_QUEUE_TIMEOUT) instead of starving other requests.
+
+    PASSWORD_HASH_METHOD is the werkzeug method new hashes use (e.g.
+    'scrypt:32768:8:1' or 'pbkdf2:sha256:600000'); hashes made with other
+    parameters are upgraded on the next successful login.
+    """
+
+    def __init__(self):
+        self.method = None
+        self.max_workers = 2
+        self.queue_timeout = 5
+        self._method_prefix = None
+        self._executor = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.method = app.config['PASSWORD_HASH_METHOD']
+        self.max_workers = app.config['PASSWORD_HASH_MAX_WORKERS']
+        self.queue_timeout = app.config['PASSWORD_HASH_QUEUE_TIMEOUT']
+        self._method_prefix = None
+
+    def _get_executor(self):
+        # Created lazily, and again after a fork: a forked worker inherits
+        # the executor object but none of its threads
+        if self._executor is None or self._executor_pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._executor_pid != os.getpid():
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='password-hash')
+                    self._executor_pid = os.getpid()
+        return self._executor
+
+    def run(self, fn, *args):
+        """Run fn(*args) on the hashing pool and wait for its result"""
+        future = self._get_executor().submit(fn, *args)
+        try:
+            return future.result(timeout=self.queue_timeout)
+        except FutureTimeoutError:
+            # Drop it if it has not started; a running hash just finishes unobserved
+            future.cancel()
+            raise PasswordHasherBusy()
+
+    def hash(self, password):
+        """Hash a password with the configured method"""
+        if self.method:
+            return self.run(generate_password_hash, password, self.method)
+        return self.run(generate_password_hash, password)
+
+    def verify(self, password_hash, password):
+        """Check a password against a stored hash"""
+        return self.run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """Whether a stored hash was made with other than the configured method and parameters"""
+        if self._method_prefix is None:
+            # Let werkzeug fill in default parameters (e.g. 'scrypt' -> 'scrypt:32768:8:1')
+            self._method_prefix = self.hash('').split('$', 1)[0]
+        return password_hash.split('$', 1)[0] != self._method_prefix
+
+
+password_hasher = PasswordHasher()
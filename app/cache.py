@@ -0,0 +1,119 @@
+# app/cache.py
+import threading
+import time
+from collections import OrderedDict
+from app.metrics import record_cache_lookup
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries expire after a TTL.
+
+    Used for per-process caches of small, hot values. Entries are not shared
+    between gunicorn workers, so the TTL bounds how stale a worker can be
+    after another one invalidates a key; init_app can instead put the entries
+    on a shared Redis server, where an invalidation reaches every worker.
+
+    Parameters:
+    - maxsize: Maximum number of entries before the least recently used is evicted
+    - ttl: Seconds an entry stays valid after it is set
+    """
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.name = None
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._shared = None
+        self._codec = None
+
+    def init_app(self, app, prefix, codec=None):
+        """
+        Read <prefix>_MAX_SIZE, <prefix>_TTL and <prefix>_URL from the app config
+
+        With <prefix>_URL set (a redis:// URL), entries are kept on that server
+        under '<prefix>:<key>' and shared by all workers, so delete() takes
+        effect everywhere at once. codec is then a (dumps, loads) pair turning
+        values into bytes and back. Lookups are counted in /metrics under the
+        lowercased prefix.
+        """
+        self.name = prefix.lower()
+        self.maxsize = app.config.get(f'{prefix}_MAX_SIZE', self.maxsize)
+        self.ttl = app.config.get(f'{prefix}_TTL', self.ttl)
+        self.clear()
+
+        url = app.config.get(f'{prefix}_URL')
+        self._shared = None
+        if url:
+            if codec is None:
+                raise ValueError(f'{prefix}_URL is set but the cache has no codec for its values')
+            import redis
+            self._shared = redis.Redis.from_url(url)
+            self._codec = codec
+
+    def _shared_key(self, key):
+        return f'{self.name}:{key}'
+
+    def _get_shared(self, key, default):
+        value = self._shared.get(self._shared_key(key))
+        hit = value is not None
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        record_cache_lookup(self.name, hit)
+        return self._codec[1](value) if hit else default
+
+    def get(self, key, default=None):
+        if self._shared is not None:
+            return self._get_shared(key, default)
+        with self._lock:
+            entry = self._data.get(key)
+            hit = False
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    hit = True
+                else:
+                    del self._data[key]
+            if not hit:
+                self.misses += 1
+        if self.name:
+            record_cache_lookup(self.name, hit)
+        return value if hit else default
+
+    def set(self, key, value, ttl=None):
+        if self._shared is not None:
+            self._shared.set(self._shared_key(key), self._codec[0](value), ex=self.ttl if ttl is None else ttl)
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        if self._shared is not None:
+            self._shared.delete(self._shared_key(key))
+            return
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """Return hit/miss counters and the current number of entries"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data)}
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,102 @@
+# app/commands.py
+import time
+import uuid
+import click
+
+
+def register_commands(app):
+    """Register the maintenance CLI commands on the Flask app"""
+
+    @app.cli.command('repair-counters')
+    @click.option('--tenant-id', default=None, help='Only repair counters for this tenant.')
+    def repair_counters(tenant_id):
+        """Recompute denormalized rollup counters from their child rows."""
+        from app.services.counter_service import CounterService
+        from app.tenancy import unscoped
+
+        # Runs across tenants (or for one, by an explicit filter) under row-level security too
+        with unscoped():
+            repaired = CounterService.recompute_counters(uuid.UUID(tenant_id) if tenant_id else None)
+        for name, count in repaired.items():
+            click.echo(f'{name}: {count} row(s) repaired')
+
+    @app.cli.command('seed')
+    @click.option('--rows', default=1000000, show_default=True, help='Approximate total rows across all tables.')
+    @click.option('--tenants', default=1000, show_default=True, help='Number of tenants (Zipf-sized: a few huge, many tiny).')
+    @click.option('--seed', 'seed_value', default=1, show_default=True, help='Random seed; the same seed gives the same data.')
+    @click.option('--password', default='password', show_default=True, help='Password of every generated user.')
+    @click.option('--domain-prefix', default='seed', show_default=True, help='Tenants get domains <prefix>-<n>.example.com.')
+    def seed(rows, tenants, seed_value, password, domain_prefix):
+        """Load a large synthetic dataset with COPY (PostgreSQL only)."""
+        from app.extensions import db
+        from app.auth.utils import password_hasher
+        from app.models import Tenant
+        from app.services.seed_service import SeedService
+
+        if db.engine.dialect.name != 'postgresql':
+            raise click.ClickException('flask seed loads data with COPY and needs PostgreSQL')
+        if Tenant.query.filter(Tenant.domain_name.like(f'{domain_prefix}-%.example.com')).first():
+            raise click.ClickException(f'Tenants {domain_prefix}-*.example.com already exist; pick another --domain-prefix')
+
+        started = time.monotonic()
+        done = {'rows': 0, 'reported': 0}
+
+        def progress(table, count):
+            done['rows'] += count
+            if done['rows'] - done['reported'] >= 1000000:
+                done['reported'] = done['rows']
+                click.echo(f"{done['rows']} rows loaded ({time.monotonic() - started:.0f}s)")
+
+        loaded = SeedService.load(seed_value, rows, tenants, password_hasher.hash(password), domain_prefix, progress)
+        for table, count in loaded.items():
+            click.echo(f'{table}: {count} row(s)')
+        click.echo(f'{sum(loaded.values())} rows in {time.monotonic() - started:.0f}s')
+
+    @app.cli.command('delete-tenant')
+    @click.argument('tenant_id')
+    def delete_tenant(tenant_id):
+        """Offboard a tenant: delete all its data in batches, in the foreground."""
+        from app.services.tenant_deletion_service import TenantDeletionService
+
+        deletion = TenantDeletionService.request_deletion(uuid.UUID(tenant_id))
+        if deletion is None:
+            raise click.ClickException(f'Tenant {tenant_id} not found')
+        if deletion.status == 'completed':
+            click.echo(f'{deletion.domain_name} was already deleted')
+            return
+        _run_deletion(deletion)
+
+    @app.cli.command('resume-tenant-deletions')
+    def resume_tenant_deletions():
+        """Finish tenant deletions that failed or whose process died."""
+        from app.services.tenant_deletion_service import TenantDeletionService
+
+        deletions = TenantDeletionService.resumable()
+        if not deletions:
+            click.echo('No tenant deletions to resume')
+        for deletion in deletions:
+            _run_deletion(deletion)
+
+    def _run_deletion(deletion):
+        from app.services.tenant_deletion_service import TenantDeletionService
+
+        domain_name, deletion_id = deletion.domain_name, deletion.id
+        started = time.monotonic()
+        done = {'reported': 0}
+
+        def progress(table, count):
+            done[table] = done.get(table, 0) + count
+            total = sum(value for key, value in done.items() if key != 'reported')
+            if total - done['reported'] >= 100000:
+                done['reported'] = total
+                click.echo(f'{domain_name}: {total} rows deleted, now in {table} ({time.monotonic() - started:.0f}s)')
+
+        status = TenantDeletionService.run(deletion_id, progress)
+        if status is None:
+            raise click.ClickException(f'{domain_name}: deletion is complete or running in another process')
+        done.pop('reported')
+        for table, count in done.items():
+            click.echo(f'{table}: {count} row(s)')
+        click.echo(f'{domain_name}: {status} in {time.monotonic() - started:.0f}s')
+        if status == 'failed':
+            raise click.ClickException(f'{domain_name}: deletion failed; rerun resume-tenant-deletions to continue')
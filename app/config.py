@@ -7,6 +7,15 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection pool and driver settings (see app.database.engine_options)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'false').lower() in ('1', 'true', 'yes')
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))  # Seconds, -1 to disable
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))  # 0 disables the timeout
+    DB_PREPARED_STATEMENTS = os.environ.get('DB_PREPARED_STATEMENTS', 'false').lower() in ('1', 'true', 'yes')
+    DB_PREPARE_THRESHOLD = int(os.environ.get('DB_PREPARE_THRESHOLD', 5))  # Executions before psycopg prepares
+    
     # Security
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
@@ -18,12 +27,93 @@ class Config:
     JWT_COOKIE_SAMESITE = 'Lax'                  # Prevents CSRF in most cases
     JWT_COOKIE_CSRF_PROTECT = False              # Disable CSRF for simplicity (enable if needed)
     
+    # Password hashing pool (per worker process); PASSWORD_HASH_METHOD is a werkzeug
+    # method such as 'scrypt:32768:8:1' or 'pbkdf2:sha256:600000' (unset = werkzeug default)
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD') or None
+    PASSWORD_HASH_MAX_WORKERS = int(os.environ.get('PASSWORD_HASH_MAX_WORKERS', 2))  # Concurrent hashes
+    PASSWORD_HASH_QUEUE_TIMEOUT = float(os.environ.get('PASSWORD_HASH_QUEUE_TIMEOUT', 5))  # Seconds to wait for a slot
+    
+    # Authenticated principal cache. Per worker process by default, where a
+    # role change or user deletion only reaches the other workers when their
+    # entry expires, so the TTL is kept short; with PRINCIPAL_CACHE_URL (redis://)
+    # it is shared and invalidated in every worker at once
+    PRINCIPAL_CACHE_URL = os.environ.get('PRINCIPAL_CACHE_URL') or None
+    PRINCIPAL_CACHE_TTL = int(os.environ.get('PRINCIPAL_CACHE_TTL', 60 if PRINCIPAL_CACHE_URL else 5))  # Seconds
+    PRINCIPAL_CACHE_MAX_SIZE = int(os.environ.get('PRINCIPAL_CACHE_MAX_SIZE', 10000))
+    
+    # List response cache: 'memory' (per worker), 'redis' (shared by workers) or 'none'
+    RESPONSE_CACHE_BACKEND = os.environ.get('RESPONSE_CACHE_BACKEND', 'none').lower()
+    RESPONSE_CACHE_URL = os.environ.get('RESPONSE_CACHE_URL', 'redis://localhost:6379/0')
+    RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', 30))  # Seconds
+    RESPONSE_CACHE_MAX_SIZE = int(os.environ.get('RESPONSE_CACHE_MAX_SIZE', 5000))  # Entries, memory backend only
+    
+    # Request instrumentation: Server-Timing header and a JSON log line per request
+    REQUEST_METRICS = os.environ.get('REQUEST_METRICS', 'true').lower() in ('1', 'true', 'yes')
+    
+    # Prometheus metrics at /metrics (aggregated across gunicorn workers
+    # through PROMETHEUS_MULTIPROC_DIR, which gunicorn.conf.py sets)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    
+    # N+1 detection: report requests running one statement more than this many
+    # times (0 disables); QUERY_REPEAT_ACTION is 'warn' (log) or 'raise'
+    QUERY_REPEAT_THRESHOLD = int(os.environ.get('QUERY_REPEAT_THRESHOLD', 0))
+    QUERY_REPEAT_ACTION = os.environ.get('QUERY_REPEAT_ACTION', 'warn').lower()
+    
+    # Also enforce tenant isolation with PostgreSQL row-level security: each
+    # transaction sets app.tenant_id for the policies in db-init/rls/, and
+    # cross-tenant work (sign-in by email, registration checks, maintenance
+    # commands) switches to the BYPASSRLS role created there
+    TENANT_RLS = os.environ.get('TENANT_RLS', 'false').lower() in ('1', 'true', 'yes')
+    TENANT_RLS_BYPASS_ROLE = os.environ.get('TENANT_RLS_BYPASS_ROLE') or 'echo_rls_bypass'
+    
+    # Tenant offboarding: rows deleted per short transaction, and an optional
+    # pause between batches to spare replicas and other tenants' queries
+    TENANT_DELETION_BATCH_SIZE = int(os.environ.get('TENANT_DELETION_BATCH_SIZE', 1000))
+    TENANT_DELETION_PAUSE_MS = int(os.environ.get('TENANT_DELETION_PAUSE_MS', 0))
+    # How often each process's deletion thread looks for unfinished jobs to
+    # resume (failed, stopped at shutdown, or left by a dead process); 0 only
+    # looks when the thread starts
+    TENANT_DELETION_RESUME_SECONDS = int(os.environ.get('TENANT_DELETION_RESUME_SECONDS') or 60)
+    
     # Application
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max upload
+    BULK_MAX_ROWS = int(os.environ.get('BULK_MAX_ROWS', 5000))  # Rows per bulk create request
+    
+    # Streaming NDJSON feedback ingestion (not bound by MAX_CONTENT_LENGTH)
+    FEEDBACK_INGEST_BATCH_SIZE = int(os.environ.get('FEEDBACK_INGEST_BATCH_SIZE', 1000))  # Rows per INSERT/commit
+    FEEDBACK_INGEST_MAX_LINE_BYTES = int(os.environ.get('FEEDBACK_INGEST_MAX_LINE_BYTES', 64 * 1024))
+    FEEDBACK_INGEST_MAX_ERRORS = int(os.environ.get('FEEDBACK_INGEST_MAX_ERRORS', 100))  # Errors listed in the response
+    
+    # Pagination (keyset cursors on list endpoints)
+    PAGINATION_DEFAULT_LIMIT = int(os.environ.get('PAGINATION_DEFAULT_LIMIT', 50))
+    PAGINATION_MAX_LIMIT = int(os.environ.get('PAGINATION_MAX_LIMIT', 200))
+    
+    # Tenant data export: rows read per short transaction while streaming
+    EXPORT_CHUNK_ROWS = int(os.environ.get('EXPORT_CHUNK_ROWS', 5000))
+    
+    # Entities whose comment threads can be fetched in one request
+    COMMENTS_MAX_ENTITIES = int(os.environ.get('COMMENTS_MAX_ENTITIES', 100))
+    
+    # Rows shown per list on the server-rendered dashboard pages
+    DASHBOARD_LIST_LIMIT = int(os.environ.get('DASHBOARD_LIST_LIMIT', 100))
+    
+    # Dashboard summary (counts and recent activity), cached per tenant and worker
+    DASHBOARD_RECENT_LIMIT = int(os.environ.get('DASHBOARD_RECENT_LIMIT', 10))
+    DASHBOARD_SUMMARY_TTL = int(os.environ.get('DASHBOARD_SUMMARY_TTL', 10))  # Seconds
+    DASHBOARD_SUMMARY_MAX_SIZE = int(os.environ.get('DASHBOARD_SUMMARY_MAX_SIZE', 10000))
 
 class DevelopmentConfig(Config):
     DEBUG = True
     JWT_COOKIE_SECURE = False  # Allow non-HTTPS in development
+    QUERY_REPEAT_THRESHOLD = int(os.environ.get('QUERY_REPEAT_THRESHOLD', 10))
+
+class TestingConfig(Config):
+    TESTING = True
+    JWT_COOKIE_SECURE = False
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL') or os.environ.get('DATABASE_URL')
+    # Fail the offending statement, so an N+1 query fails the test that hits it
+    QUERY_REPEAT_THRESHOLD = int(os.environ.get('QUERY_REPEAT_THRESHOLD', 10))
+    QUERY_REPEAT_ACTION = 'raise'
 
 class ProductionConfig(Config):
     DEBUG = False
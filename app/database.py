@@ -1,53 +1,176 @@
+import asyncio
+import contextvars
+import os
+import threading
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine
 from flask import current_app
 from psycopg import ClientCursor
 from psycopg import AsyncClientCursor
+from app.metrics import InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
+
+# Process-wide engine registry, so every caller shares one connection pool
+# per database/settings combination instead of building a new engine per call
+_engines = {}
+_engines_lock = threading.Lock()
+
+# Event loop shared by all async database work in this process. Async engines
+# pool connections that are bound to the loop that opened them, so every
+# coroutine must run on this one loop rather than a fresh loop per request.
+_loop = None
+_loop_pid = None
+_loop_lock = threading.Lock()
+
+def engine_options(config, is_async=False):
+    """
+    Build SQLAlchemy engine options from the DB_* settings in the app config.
+
+    By default psycopg3 uses ClientCursor (client-side parameter binding), which
+    is compatible with transaction-mode poolers such as PgBouncer. With
+    DB_PREPARED_STATEMENTS enabled, parameters are bound server-side and psycopg
+    prepares a statement once it has run DB_PREPARE_THRESHOLD times on a
+    connection, so repeated tenant-scoped queries skip re-planning.
+
+    Args:
+        config: Flask config mapping
+        is_async: Build options for an async engine
+
+    Returns:
+        Dict of keyword arguments for create_engine / create_async_engine
+    """
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() != 'postgresql':
+        return {}
+
+    connect_args = {}
+    if config['DB_PREPARED_STATEMENTS']:
+        connect_args['prepare_threshold'] = config['DB_PREPARE_THRESHOLD']
+    else:
+        connect_args['cursor_factory'] = AsyncClientCursor if is_async else ClientCursor
+
+    if config['DB_STATEMENT_TIMEOUT_MS']:
+        connect_args['options'] = f"-c statement_timeout={int(config['DB_STATEMENT_TIMEOUT_MS'])}"
+
+    options = {
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_pre_ping': config['DB_POOL_PRE_PING'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+        'connect_args': connect_args,
+    }
+    if config['METRICS_ENABLED']:
+        # Pools that report checkout time and usage to /metrics
+        options['poolclass'] = InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool
+    return options
+
+def _get_engine(kind, factory, db_uri, options):
+    key = (kind, db_uri, repr(sorted(options.items())))
+    engine = _engines.get(key)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = factory(db_uri, **options)
+                _engines[key] = engine
+    return engine
 
 def get_sync_engine(app=None):
     """
-    Creates a synchronous SQLAlchemy engine using psycopg3.
-    
+    Returns the shared synchronous SQLAlchemy engine using psycopg3.
+
     Args:
         app: Flask application instance (optional)
-        
+
     Returns:
         SQLAlchemy Engine instance configured for psycopg3
     """
     if app is None:
         app = current_app
-        
+
     # Get database URI from app config
     db_uri = app.config['SQLALCHEMY_DATABASE_URI']
-    
-    # Create engine with client-side parameter binding for better performance
-    engine = create_engine(
-        db_uri,
-        connect_args={"cursor_factory": ClientCursor},
-    )
-    
-    return engine
+
+    return _get_engine('sync', create_engine, db_uri, engine_options(app.config))
 
 def get_async_engine(app=None):
     """
-    Creates an asynchronous SQLAlchemy engine using psycopg3.
-    
+    Returns the shared asynchronous SQLAlchemy engine using psycopg3.
+
     Args:
         app: Flask application instance (optional)
-        
+
     Returns:
         Async SQLAlchemy Engine instance configured for psycopg3
     """
     if app is None:
         app = current_app
-        
+
     # Get database URI from app config
     db_uri = app.config['SQLALCHEMY_DATABASE_URI']
-    
-    # Create async engine with client-side parameter binding
-    engine = create_async_engine(
-        db_uri,
-        connect_args={"cursor_factory": AsyncClientCursor},
-    )
-    
-    return engine
\ No newline at end of file
+
+    return _get_engine('async', create_async_engine, db_uri, engine_options(app.config, is_async=True))
+
+def _get_event_loop():
+    global _loop, _loop_pid
+    if _loop is None or _loop_pid != os.getpid():
+        with _loop_lock:
+            if _loop is None or _loop_pid != os.getpid():
+                # A forked child inherits the loop object but not its thread,
+                # nor usable connections in the async pools
+                for key in [key for key in _engines if key[0] == 'async']:
+                    del _engines[key]
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='async-db', daemon=True).start()
+                _loop, _loop_pid = loop, os.getpid()
+    return _loop
+
+def run_async(coro, timeout=None):
+    """
+    Run a coroutine on the process-wide database event loop and wait for it.
+
+    Lets synchronous Flask views use the async engine; the calling thread
+    blocks until the coroutine finishes.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before giving up (optional)
+
+    Returns:
+        The coroutine's result
+    """
+    # Carry the caller's context variables (e.g. the request's metrics) over
+    # to the loop thread, where the coroutine would otherwise see none of them
+    return asyncio.run_coroutine_threadsafe(_in_context(coro, contextvars.copy_context()), _get_event_loop()).result(timeout)
+
+async def _in_context(coro, context):
+    for var, value in context.items():
+        var.set(value)
+    return await coro
+
+def dispose_engines(app=None):
+    """
+    Drop the connection pools this process inherited from its parent.
+
+    Call in a forked child (e.g. gunicorn's post_fork with preload_app):
+    sockets opened before the fork are shared with the parent, so the child
+    must open its own. The inherited connections are left for the parent to
+    close (close=False) rather than shut down from the child.
+
+    Args:
+        app: Flask application whose Flask-SQLAlchemy engines to reset (optional)
+    """
+    if app is not None:
+        from app.extensions import db
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+
+    with _engines_lock:
+        for key, engine in list(_engines.items()):
+            if key[0] == 'sync':
+                engine.dispose(close=False)
+            else:
+                # Async pools are bound to the parent's event loop; they are
+                # rebuilt on the child's loop when next used
+                del _engines[key]
@@ -0,0 +1,71 @@
+# app/etags.py
+import hashlib
+from flask import request, current_app, abort
+from sqlalchemy import select, func
+from app.extensions import db
+
+
+def make_etag(*parts):
+    """Hash the given version parts into an opaque ETag value"""
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _query_key():
+    # Filters, cursor, limit and fields all change the body for the same data
+    return sorted(request.args.items(multi=True))
+
+
+def collection_etag(model, tenant_id):
+    """
+    ETag for a tenant's collection of `model` as listed by the current request
+
+    The version is the row count plus the latest updated_at, read with one
+    aggregate that an index on (tenant_id, updated_at) answers without touching
+    the table. Inserts and updates move max(updated_at), deletes change the count.
+
+    Parameters:
+    - model: Model class with tenant_id and updated_at columns
+    - tenant_id: UUID of the current user's tenant
+
+    Returns the ETag string
+    """
+    count, last_updated = db.session.execute(
+        select(func.count(), func.max(model.updated_at)).where(model.tenant_id == tenant_id)
+    ).one()
+    return make_etag(model.__tablename__, tenant_id, count, last_updated, _query_key())
+
+
+def item_etag(model, item_id, user):
+    """
+    ETag for a single row, read without loading the row itself
+
+    The tenant is part of the lookup, so a row of another tenant aborts with
+    404 just like a missing one (as TenantQuery.get_for_tenant_or_404 does).
+
+    Returns the ETag string
+    """
+    updated_at = db.session.execute(
+        select(model.updated_at).where(model.id == item_id, model.tenant_id == user.tenant_id)
+    ).first()
+    if updated_at is None:
+        abort(404)
+    return make_etag(model.__tablename__, item_id, updated_at[0])
+
+
+def not_modified(etag):
+    """
+    Build a 304 response if the request's If-None-Match matches the ETag
+
+    Returns the response, or None if the client's copy is stale
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+
+def with_etag(response, etag):
+    """Attach the (weak) ETag to a response and return it"""
+    response.set_etag(etag, weak=True)
+    return response
@@ -1,7 +1,18 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
+from app.cache import TTLCache
+from app.response_cache import ResponseCache
+from app.instrumentation import Instrumentation
+from app.metrics import Metrics
+from app.tenancy import TenantQuery, Tenancy
 
-db = SQLAlchemy()
+db = SQLAlchemy(query_class=TenantQuery)
 migrate = Migrate()
-jwt = JWTManager()
\ No newline at end of file
+jwt = JWTManager()
+principal_cache = TTLCache()
+response_cache = ResponseCache()
+dashboard_cache = TTLCache()
+instrumentation = Instrumentation()
+metrics = Metrics()
+tenancy = Tenancy()
\ No newline at end of file
@@ -0,0 +1,211 @@
+# app/instrumentation.py
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from flask import request, g
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import orjson
+
+logger = logging.getLogger('app.requests')
+
+# Metrics of the request being handled in this thread (or greenlet); copied
+# into async database tasks by app.database.run_async
+_current = ContextVar('request_metrics', default=None)
+
+
+class RepeatedQueryError(Exception):
+    """Raised when a request runs one statement more than QUERY_REPEAT_THRESHOLD times"""
+
+
+class RequestMetrics:
+    """Timings and SQL statement counts collected for one request"""
+    
+    def __init__(self, repeat_threshold, repeat_action):
+        self.started_at = time.perf_counter()
+        self.statements = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.repeat_threshold = repeat_threshold
+        self.repeat_action = repeat_action
+        self.repeats_allowed = False
+        self.shapes = Counter()
+    
+    def repeated(self):
+        """Statements run more than the repeat threshold, with their counts"""
+        if not self.repeat_threshold or self.repeats_allowed:
+            return {}
+        return {statement: count for statement, count in self.shapes.items() if count > self.repeat_threshold}
+
+
+def current_metrics():
+    """Metrics of the current request, or None outside an instrumented request"""
+    return _current.get()
+
+
+def allow_query_repeats():
+    """
+    Exempt the current request from the repeated statement check
+    
+    For endpoints that run one statement per batch on purpose, such as
+    streaming ingestion.
+    """
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.repeats_allowed = True
+
+
+@contextmanager
+def serialization_timer():
+    """Add the time spent in the block to the current request's serialization time"""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serialize_time += time.perf_counter() - start
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, timing jsonify() into the request metrics"""
+    
+    def dumps(self, obj, **kwargs):
+        with serialization_timer():
+            return super().dumps(obj, **kwargs)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    metrics = _current.get()
+    if metrics is None:
+        return
+    
+    # The statement text has its parameters bound separately, so it
+    # identifies the shape of the query
+    metrics.statements += 1
+    metrics.shapes[statement] += 1
+    if (
+        metrics.repeat_action == 'raise'
+        and metrics.repeat_threshold
+        and not metrics.repeats_allowed
+        and metrics.shapes[statement] > metrics.repeat_threshold
+    ):
+        raise RepeatedQueryError(
+            f'Statement run more than {metrics.repeat_threshold} times in one request '
+            f'(likely an N+1 query): {statement}'
+        )
+    conn.info.setdefault('instrumentation_started_at', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    metrics = _current.get()
+    started = conn.info.get('instrumentation_started_at')
+    if metrics is None or not started:
+        return
+    metrics.db_time += time.perf_counter() - started.pop()
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    started = connection.info.get('instrumentation_started_at') if connection is not None else None
+    if started:
+        started.pop()
+
+
+class Instrumentation:
+    """
+    Per-request performance metrics and N+1 query detection.
+    
+    With REQUEST_METRICS enabled, every request records its SQL statement
+    count, total database time (including statements run on the async
+    engine), JSON serialization time and total time, and reports them in a
+    Server-Timing header and one JSON log line on the 'app.requests' logger.
+    
+    With QUERY_REPEAT_THRESHOLD set, a request running the same statement
+    more than that many times is reported: QUERY_REPEAT_ACTION 'warn' logs
+    the statements at the end of the request, 'raise' fails the statement
+    with RepeatedQueryError (meant for development and tests).
+    """
+    
+    _listening = False
+    
+    def __init__(self):
+        self.enabled = False
+        self.repeat_threshold = 0
+        self.repeat_action = 'warn'
+    
+    def init_app(self, app):
+        self.enabled = app.config['REQUEST_METRICS']
+        self.repeat_threshold = app.config['QUERY_REPEAT_THRESHOLD']
+        self.repeat_action = app.config['QUERY_REPEAT_ACTION']
+        if self.repeat_action not in ('warn', 'raise'):
+            raise ValueError(f'Unknown QUERY_REPEAT_ACTION: {self.repeat_action!r}')
+        
+        # Also collected for the Prometheus metrics (app.metrics), which read them
+        if not self.enabled and not self.repeat_threshold and not app.config['METRICS_ENABLED']:
+            return
+        
+        if not Instrumentation._listening:
+            event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+            event.listen(Engine, 'handle_error', _handle_error)
+            Instrumentation._listening = True
+        
+        # Creating app.logger installs Flask's default handler on the 'app'
+        # logger, which 'app.requests' propagates to
+        app.logger
+        if logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+        
+        app.json = TimedJSONProvider(app)
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+    
+    def _start(self):
+        g.request_metrics_token = _current.set(RequestMetrics(self.repeat_threshold, self.repeat_action))
+    
+    def _finish(self, response):
+        metrics = _current.get()
+        if metrics is None:
+            return response
+        
+        total = time.perf_counter() - metrics.started_at
+        
+        repeated = metrics.repeated()
+        if repeated:
+            logger.warning(orjson.dumps({
+                'event': 'repeated_queries',
+                'method': request.method,
+                'path': request.path,
+                'threshold': metrics.repeat_threshold,
+                'statements': [{'count': count, 'statement': statement} for statement, count in repeated.items()],
+            }).decode())
+        
+        if self.enabled:
+            response.headers['Server-Timing'] = (
+                f'db;dur={metrics.db_time * 1000:.2f};desc="{metrics.statements} statements", '
+                f'serialize;dur={metrics.serialize_time * 1000:.2f}, '
+                f'total;dur={total * 1000:.2f}'
+            )
+            logger.info(orjson.dumps({
+                'event': 'request',
+                'method': request.method,
+                'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                'db_statements': metrics.statements,
+                'db_ms': round(metrics.db_time * 1000, 3),
+                'serialize_ms': round(metrics.serialize_time * 1000, 3),
+                'total_ms': round(total * 1000, 3),
+            }).decode())
+        return response
+    
+    def _teardown(self, exception):
+        token = g.pop('request_metrics_token', None)
+        if token is not None:
+            _current.reset(token)
@@ -0,0 +1,188 @@
+# app/metrics.py
+import os
+import threading
+import time
+from flask import request, current_app
+from prometheus_client import (
+    CollectorRegistry, Counter, Gauge, Histogram, REGISTRY,
+    CONTENT_TYPE_LATEST, generate_latest, multiprocess
+)
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Set by Metrics.init_app; recording is a no-op while disabled
+_enabled = False
+
+REQUEST_LATENCY = Histogram(
+    'echo_request_duration_seconds',
+    'Request latency by endpoint, method and status code',
+    ['endpoint', 'method', 'status']
+)
+REQUEST_QUERIES = Histogram(
+    'echo_request_db_statements',
+    'SQL statements run per request, by endpoint',
+    ['endpoint'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144)
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    'echo_db_pool_checkout_seconds',
+    'Time to check a connection out of the pool, including any wait for a free one',
+    ['pool'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    'echo_db_pool_checkout_timeouts_total',
+    'Checkouts that gave up waiting for a free connection',
+    ['pool']
+)
+POOL_IN_USE = Gauge(
+    'echo_db_pool_connections_in_use',
+    'Connections checked out of the pool',
+    ['pool'],
+    multiprocess_mode='livesum'
+)
+POOL_OVERFLOW = Gauge(
+    'echo_db_pool_overflow_connections',
+    'Connections open beyond the pool size',
+    ['pool'],
+    multiprocess_mode='livesum'
+)
+JWT_FAILURES = Counter(
+    'echo_jwt_failures_total',
+    'Requests rejected for a missing, invalid or expired JWT',
+    ['reason']
+)
+CACHE_LOOKUPS = Counter(
+    'echo_cache_lookups_total',
+    'Cache lookups by cache and result (hit or miss)',
+    ['cache', 'result']
+)
+
+
+def record_cache_lookup(cache, hit):
+    """Count a lookup in one of the caches (hit ratio = hit / (hit + miss))"""
+    if _enabled:
+        CACHE_LOOKUPS.labels(cache, 'hit' if hit else 'miss').inc()
+
+
+class _InstrumentedPool:
+    """
+    Pool mixin recording checkout time, connections in use and overflow.
+
+    Gauges are moved by deltas rather than set, so every pool of a kind in a
+    process (and, with livesum, every live worker) adds up.
+    """
+
+    pool_label = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reported_overflow = 0
+        self._metrics_lock = threading.Lock()
+
+    def _report_overflow(self):
+        with self._metrics_lock:
+            overflow = max(self.overflow(), 0)
+            POOL_OVERFLOW.labels(self.pool_label).inc(overflow - self._reported_overflow)
+            self._reported_overflow = overflow
+
+    def connect(self):
+        if not _enabled:
+            return super().connect()
+
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.labels(self.pool_label).inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.labels(self.pool_label).observe(time.perf_counter() - start)
+        POOL_IN_USE.labels(self.pool_label).inc()
+        self._report_overflow()
+        return connection
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        if _enabled:
+            POOL_IN_USE.labels(self.pool_label).dec()
+            self._report_overflow()
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    pool_label = 'sync'
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    pool_label = 'async'
+
+
+class Metrics:
+    """
+    Prometheus metrics, served at /metrics.
+
+    Under gunicorn every worker keeps its own counters, so with
+    PROMETHEUS_MULTIPROC_DIR set (gunicorn.conf.py sets it) each worker
+    writes them to files in that directory and /metrics sums the files of
+    all workers, whichever one answers the scrape. Request latency and
+    statement counts come from the request instrumentation
+    (app.instrumentation); pool metrics need the instrumented pool classes,
+    which app.database.engine_options selects while METRICS_ENABLED is set.
+    """
+
+    def init_app(self, app):
+        global _enabled
+        _enabled = app.config['METRICS_ENABLED']
+        if not _enabled:
+            return
+
+        app.after_request(self._record_request)
+        app.add_url_rule('/metrics', 'metrics', self._export)
+        self._count_jwt_failures()
+
+    @staticmethod
+    def _record_request(response):
+        from app.instrumentation import current_metrics
+
+        metrics = current_metrics()
+        endpoint = request.endpoint or 'unmatched'
+        if metrics is None or endpoint == 'metrics':
+            return response
+
+        REQUEST_LATENCY.labels(endpoint, request.method, str(response.status_code)).observe(
+            time.perf_counter() - metrics.started_at
+        )
+        REQUEST_QUERIES.labels(endpoint).observe(metrics.statements)
+        return response
+
+    @staticmethod
+    def _export():
+        if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        return current_app.response_class(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+    @staticmethod
+    def _count_jwt_failures():
+        # Count, then answer with flask-jwt-extended's default responses
+        from app.extensions import jwt
+        from flask_jwt_extended.default_callbacks import (
+            default_expired_token_callback, default_invalid_token_callback, default_unauthorized_callback
+        )
+
+        @jwt.unauthorized_loader
+        def missing_token(reason):
+            JWT_FAILURES.labels('missing').inc()
+            return default_unauthorized_callback(reason)
+
+        @jwt.invalid_token_loader
+        def invalid_token(reason):
+            JWT_FAILURES.labels('invalid').inc()
+            return default_invalid_token_callback(reason)
+
+        @jwt.expired_token_loader
+        def expired_token(jwt_header, jwt_data):
+            JWT_FAILURES.labels('expired').inc()
+            return default_expired_token_callback(jwt_header, jwt_data)
@@ -2,10 +2,11 @@ from app.models.tenant import Tenant
 from app.models.user import User
 from app.models.goal import Goal
 from app.models.initiative import Initiative
-from app.models.customer import Customer
+from app.models.customer import Customer, CustomerStats
 from app.models.idea import Idea, ideas_customers
 from app.models.feedback import Feedback, feedback_customers, feedback_initiatives
 from app.models.comment import Comment
+from app.models.tenant_deletion import TenantDeletion
 
 # This allows importing all models from the models package
 __all__ = [
@@ -14,10 +15,12 @@ __all__ = [
     'Goal',
     'Initiative',
     'Customer',
+    'CustomerStats',
     'Idea',
     'ideas_customers',
     'Feedback',
     'feedback_customers',
     'feedback_initiatives',
-    'Comment'
+    'Comment',
+    'TenantDeletion'
 ]
\ No newline at end of file
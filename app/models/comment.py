@@ -46,5 +46,9 @@ class Comment(db.Model):
             viewonly=True
         )
     
+    @property
+    def author_email(self):
+        return self.user.email
+    
     def __repr__(self):
         return f'<Comment {self.id} on {self.entity_type} {self.entity_id}>'
\ No newline at end of file
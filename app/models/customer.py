@@ -17,6 +17,19 @@ class Customer(db.Model):
     tenant = db.relationship('Tenant', back_populates='customers')
     ideas = db.relationship('Idea', secondary='ideas_customers', back_populates='customers')
     feedback = db.relationship('Feedback', secondary='feedback_customers', back_populates='customers')
+    stats = db.relationship('CustomerStats', uselist=False, viewonly=True)
     
     def __repr__(self):
-        return f'<Customer {self.name}>'
\ No newline at end of file
+        return f'<Customer {self.name}>'
+
+class CustomerStats(db.Model):
+    __tablename__ = 'customer_stats'
+    
+    # One row per customer, maintained by DB triggers on customers and the junction tables
+    customer_id = db.Column(db.UUID(as_uuid=True), db.ForeignKey('customers.id', ondelete='CASCADE'), primary_key=True)
+    tenant_id = db.Column(db.UUID(as_uuid=True), db.ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False)
+    idea_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    feedback_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    
+    def __repr__(self):
+        return f'<CustomerStats {self.customer_id}>'
@@ -11,6 +11,7 @@ class Goal(db.Model):
     description = db.Column(db.Text)
     target_date = db.Column(db.Date)
     status = db.Column(db.String(20), nullable=False, default='In Progress') 
+    initiative_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Maintained by DB trigger
     created_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow)
     updated_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -13,6 +13,10 @@ class Initiative(db.Model):
     description = db.Column(db.Text)
     status = db.Column(db.String(20), nullable=False)
     priority = db.Column(db.Integer, nullable=False)
+    # Rollup counters maintained by DB triggers
+    idea_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    feedback_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    comment_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     created_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow)
     updated_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -11,13 +11,15 @@ class Tenant(db.Model):
     created_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow)
     updated_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    # Relationships
-    users = db.relationship('User', back_populates='tenant', cascade='all, delete-orphan')
-    goals = db.relationship('Goal', back_populates='tenant', cascade='all, delete-orphan')
-    initiatives = db.relationship('Initiative', back_populates='tenant', cascade='all, delete-orphan')
-    customers = db.relationship('Customer', back_populates='tenant', cascade='all, delete-orphan')
-    ideas = db.relationship('Idea', back_populates='tenant', cascade='all, delete-orphan')
-    feedback = db.relationship('Feedback', back_populates='tenant', cascade='all, delete-orphan')
+    # Relationships. passive_deletes leaves child rows to the ON DELETE CASCADE
+    # foreign keys instead of loading them to delete one by one; offboarding
+    # goes through TenantDeletionService, which deletes them in batches first
+    users = db.relationship('User', back_populates='tenant', cascade='all, delete-orphan', passive_deletes=True)
+    goals = db.relationship('Goal', back_populates='tenant', cascade='all, delete-orphan', passive_deletes=True)
+    initiatives = db.relationship('Initiative', back_populates='tenant', cascade='all, delete-orphan', passive_deletes=True)
+    customers = db.relationship('Customer', back_populates='tenant', cascade='all, delete-orphan', passive_deletes=True)
+    ideas = db.relationship('Idea', back_populates='tenant', cascade='all, delete-orphan', passive_deletes=True)
+    feedback = db.relationship('Feedback', back_populates='tenant', cascade='all, delete-orphan', passive_deletes=True)
     
     def __repr__(self):
         return f'<Tenant {self.domain_name}>'
\ No newline at end of file
@@ -0,0 +1,22 @@
+from app.extensions import db
+import uuid
+from datetime import datetime
+
+class TenantDeletion(db.Model):
+    """Offboarding job of one tenant; kept after the tenant itself is gone"""
+    __tablename__ = 'tenant_deletions'
+    
+    id = db.Column(db.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = db.Column(db.UUID(as_uuid=True), nullable=False, unique=True)  # No foreign key: outlives the tenant
+    domain_name = db.Column(db.String(255), nullable=False)
+    requested_by = db.Column(db.UUID(as_uuid=True))
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, completed, failed
+    current_table = db.Column(db.String(50))
+    rows_deleted = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)  # Heartbeat while running
+    completed_at = db.Column(db.DateTime(timezone=True))
+    
+    def __repr__(self):
+        return f'<TenantDeletion {self.domain_name} {self.status}>'
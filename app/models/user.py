@@ -22,6 +22,8 @@ class User(db.Model):
     __table_args__ = (
         db.UniqueConstraint('tenant_id', 'email', name='unique_tenant_email'),
         db.CheckConstraint("role IN ('user', 'admin')", name='check_valid_role'),
+        # Login without a domain and registration look users up by email alone
+        db.Index('idx_users_email', 'email'),
     )
     
     def set_password(self, password):
@@ -0,0 +1,142 @@
+# app/pagination.py
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from flask import current_app
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+
+
+def parse_page_args(args):
+    """
+    Read the `cursor` and `limit` query parameters of a list endpoint
+
+    Parameters:
+    - args: The request's query arguments (request.args)
+
+    Returns a tuple of (cursor, limit); raises ValueError on a bad limit
+    """
+    default_limit = current_app.config['PAGINATION_DEFAULT_LIMIT']
+    max_limit = current_app.config['PAGINATION_MAX_LIMIT']
+
+    limit = args.get('limit', default_limit)
+    try:
+        limit = int(limit)
+    except (ValueError, TypeError):
+        raise ValueError(f'Limit must be an integer between 1 and {max_limit}')
+    if not 1 <= limit <= max_limit:
+        raise ValueError(f'Limit must be an integer between 1 and {max_limit}')
+
+    return args.get('cursor') or None, limit
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    raise TypeError(f'Cannot encode {type(value).__name__} in a cursor')
+
+
+def _decode_value(value, python_type):
+    if value is None:
+        return None
+    if python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+class Keyset:
+    """
+    Keyset (seek) pagination over a fixed sort order.
+
+    Each page is fetched with a WHERE clause that starts right after the last
+    row of the previous page, so the database walks the matching index instead
+    of counting past an OFFSET. The last sort column must be unique (the
+    primary key) so that ties never skip or repeat rows.
+
+    Parameters:
+    - columns: Model attributes, optionally wrapped in .desc()/.asc()
+    """
+
+    def __init__(self, *columns):
+        self.columns = []
+        for column in columns:
+            descending = False
+            if isinstance(column, UnaryExpression):
+                descending = column.modifier is operators.desc_op
+                column = column.element
+            self.columns.append((column, column.key, descending))
+
+    @property
+    def keys(self):
+        """Attribute names of the sort columns, which each page row must carry"""
+        return [key for _, key, _ in self.columns]
+
+    @property
+    def order_by(self):
+        return [column.desc() if descending else column.asc()
+                for column, _, descending in self.columns]
+
+    def encode(self, row):
+        """Build the opaque cursor pointing just after the given row"""
+        values = [getattr(row, key) for _, key, _ in self.columns]
+        data = json.dumps(values, default=_encode_value, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+    def decode(self, cursor):
+        """Decode a cursor into sort values; raises ValueError if malformed"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError
+            return [_decode_value(value, column.type.python_type)
+                    for value, (column, _, _) in zip(values, self.columns)]
+        except (ValueError, TypeError, NotImplementedError):
+            raise ValueError('Invalid cursor')
+
+    def _after(self, values):
+        # Expand (a, b, c) > (x, y, z) so that each column can sort in its
+        # own direction: a > x OR (a = x AND (b > y OR (b = y AND c > z)))
+        condition = None
+        for (column, _, descending), value in reversed(list(zip(self.columns, values))):
+            past = column < value if descending else column > value
+            condition = past if condition is None else or_(past, and_(column == value, condition))
+        return condition
+
+    def after(self, cursor):
+        """WHERE condition selecting the rows after `cursor`; raises ValueError if malformed"""
+        return self._after(self.decode(cursor))
+
+    def apply(self, query, cursor, limit):
+        """
+        Restrict a query to the page following `cursor`
+
+        Parameters:
+        - query: Query or Select to paginate (already tenant-filtered)
+        - cursor: Cursor returned by a previous page, or None for the first page
+        - limit: Page size
+
+        Returns the query ordered and limited to one row past the page, which
+        is how page() detects whether another page exists
+        """
+        if cursor:
+            query = query.filter(self.after(cursor))
+        return query.order_by(*self.order_by).limit(limit + 1)
+
+    def page(self, rows, limit):
+        """
+        Split the rows of an applied query into the page and its next cursor
+
+        Returns a tuple of (rows, next_cursor); next_cursor is None on the last page
+        """
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, self.encode(rows[-1])
+        return rows, None
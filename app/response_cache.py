@@ -0,0 +1,277 @@
+# app/response_cache.py
+import hashlib
+import threading
+from functools import wraps
+from flask import request, current_app
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter
+from app.cache import TTLCache
+from app.metrics import record_cache_lookup
+from app.tenancy import current_tenant
+
+# Cached list responses that change when a model's rows change. Initiatives
+# appear in goal counts and vice versa, and ideas, feedback and comments feed
+# the initiative rollup counters. Comments have no tenant_id; their writes are
+# attributed to the tenant of the request's user (see _tenant_ids).
+DEPENDENT_RESOURCES = {
+    'Goal': ('goals', 'initiatives', 'dashboard'),
+    'Initiative': ('initiatives', 'goals', 'dashboard'),
+    'Idea': ('initiatives', 'dashboard'),
+    'Feedback': ('initiatives', 'dashboard'),
+    'Comment': ('initiatives',),
+}
+
+# Callbacks run with (tenant_id, resource) for every invalidation, so other
+# caches can reuse the write tracking below
+_invalidation_callbacks = []
+
+
+def on_invalidate(callback):
+    """Register callback(tenant_id, resource) to run after commits that change the resource (decorator)"""
+    _invalidation_callbacks.append(callback)
+    return callback
+
+# Generation key used when a write's tenant cannot be determined
+ALL_TENANTS = '*'
+
+
+class InProcessBackend:
+    """
+    Cache backend local to one worker process (LRU + TTL).
+
+    Parameters:
+    - maxsize: Maximum number of cached responses
+    - ttl: Seconds a cached response stays valid
+    """
+
+    def __init__(self, maxsize, ttl):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Generations are kept outside the LRU: evicting one would reset it
+        # and could resurrect responses cached under an older generation
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, value, ttl):
+        self._entries.set(key, value, ttl)
+
+    def get_generations(self, keys):
+        return [self._generations.get(key, 0) for key in keys]
+
+    def incr(self, key):
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def stats(self):
+        return self._entries.stats()
+
+
+class RedisBackend:
+    """
+    Cache backend shared by all workers through a Redis-protocol server.
+
+    Parameters:
+    - url: redis:// URL of the server
+    - client: Pre-built client with the redis-py interface (e.g. for tests
+      against a local stand-in); takes precedence over url
+    """
+
+    def __init__(self, url=None, client=None):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        value = self.client.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is None:
+            return None
+        etag, _, body = value.partition(b'\n')
+        return etag.decode(), body
+
+    def set(self, key, value, ttl):
+        etag, body = value
+        self.client.set(key, etag.encode() + b'\n' + body, ex=ttl)
+
+    def get_generations(self, keys):
+        return [int(value or 0) for value in self.client.mget(keys)]
+
+    def incr(self, key):
+        self.client.incr(key)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class ResponseCache:
+    """
+    Tenant-scoped cache for list responses.
+
+    Entries are keyed by tenant, resource and the normalized query args, plus
+    the current generation of that (tenant, resource) pair. Invalidation bumps
+    the generation, which orphans every cached variant at once; orphans then
+    age out through the LRU bound and TTL. Generations are bumped from
+    SQLAlchemy session events after commit, so routes never invalidate by hand.
+    """
+
+    def __init__(self):
+        self.backend = None
+        self.ttl = 30
+
+    def init_app(self, app):
+        backend = app.config['RESPONSE_CACHE_BACKEND']
+        self.ttl = app.config['RESPONSE_CACHE_TTL']
+        if backend == 'memory':
+            self.backend = InProcessBackend(app.config['RESPONSE_CACHE_MAX_SIZE'], self.ttl)
+        elif backend == 'redis':
+            self.backend = RedisBackend(app.config['RESPONSE_CACHE_URL'])
+        elif backend in (None, '', 'none'):
+            self.backend = None
+        else:
+            raise ValueError(f'Unknown RESPONSE_CACHE_BACKEND: {backend}')
+
+    @property
+    def enabled(self):
+        return self.backend is not None
+
+    @staticmethod
+    def _generation_keys(tenant_id, resource):
+        return [f'gen:{tenant_id}:{resource}', f'gen:{ALL_TENANTS}:{resource}']
+
+    def key(self, tenant_id, resource, args):
+        """Cache key for a response to the given tenant, resource and query args"""
+        tenant_gen, global_gen = self.backend.get_generations(self._generation_keys(tenant_id, resource))
+        args_hash = hashlib.sha1(repr(sorted(args.items(multi=True))).encode()).hexdigest()
+        return f'resp:{tenant_id}:{resource}:{tenant_gen}.{global_gen}:{args_hash}'
+
+    def invalidate(self, tenant_id, resource):
+        """Evict every cached response for a tenant's resource (all tenants if tenant_id is None)"""
+        if self.backend is not None:
+            self.backend.incr(self._generation_keys(ALL_TENANTS if tenant_id is None else tenant_id, resource)[0])
+
+    def stats(self):
+        return self.backend.stats() if self.backend is not None else {}
+
+
+def cached_response(resource):
+    """
+    Serve a tenant-scoped list view from the response cache
+
+    Successful responses are stored with their ETag; a hit is answered
+    without touching the database (as a 304 when If-None-Match matches).
+
+    Parameters:
+    - resource: Resource name used for keys and invalidation (e.g. 'goals')
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            from app.extensions import response_cache
+            from app.services.auth_service import AuthService
+
+            if not response_cache.enabled:
+                return view(*args, **kwargs)
+
+            tenant_id = AuthService.get_current_user().tenant_id
+            key = response_cache.key(tenant_id, resource, request.args)
+            entry = response_cache.backend.get(key)
+            record_cache_lookup('response', entry is not None)
+            if entry is not None:
+                etag, body = entry
+                if request.if_none_match.contains_weak(etag):
+                    response = current_app.response_class(status=304)
+                else:
+                    response = current_app.response_class(body, mimetype='application/json')
+                response.set_etag(etag, weak=True)
+                return response
+
+            response = current_app.make_response(view(*args, **kwargs))
+            etag, _ = response.get_etag()
+            if response.status_code == 200 and etag:
+                response_cache.backend.set(key, (etag, response.get_data()), response_cache.ttl)
+            return response
+        return wrapper
+    return decorator
+
+
+def _statement_tenant_ids(statement, parameters):
+    """Tenants touched by an ORM-enabled INSERT/UPDATE/DELETE statement, or {None} if unknown"""
+    if parameters:
+        rows = parameters if isinstance(parameters, list) else [parameters]
+        tenant_ids = {row.get('tenant_id') for row in rows}
+        if None not in tenant_ids:
+            return tenant_ids
+
+    # Look for "tenant_id = <bound value>" in the WHERE clause
+    whereclause = getattr(statement, 'whereclause', None)
+    if whereclause is not None:
+        for element in visitors.iterate(whereclause):
+            if (isinstance(element, BinaryExpression)
+                    and getattr(element.left, 'key', None) == 'tenant_id'
+                    and isinstance(element.right, BindParameter)):
+                return {element.right.value}
+    return {None}
+
+
+def _tenant_ids(tenant_ids):
+    # A write whose rows carry no tenant (comments) comes from the current
+    # request's user, who can only write in their own tenant. Outside a
+    # request (CLI, background jobs) it stays unknown: every tenant.
+    if None in tenant_ids and current_tenant() is not None:
+        return (tenant_ids - {None}) | {current_tenant()}
+    return tenant_ids
+
+
+def _pending(session):
+    return session.info.setdefault('response_cache_pending', set())
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_flushed_changes(session, flush_context):
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        resources = DEPENDENT_RESOURCES.get(type(obj).__name__)
+        if resources:
+            tenant_id, = _tenant_ids({getattr(obj, 'tenant_id', None)})
+            _pending(session).update((tenant_id, resource) for resource in resources)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_bulk_changes(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    resources = DEPENDENT_RESOURCES.get(mapper.class_.__name__) if mapper is not None else None
+    if resources:
+        tenant_ids = _tenant_ids(_statement_tenant_ids(orm_execute_state.statement, orm_execute_state.parameters))
+        _pending(orm_execute_state.session).update(
+            (tenant_id, resource) for tenant_id in tenant_ids for resource in resources
+        )
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_changes(session):
+    from app.extensions import response_cache
+
+    pending = session.info.pop('response_cache_pending', None)
+    if pending:
+        for tenant_id, resource in pending:
+            response_cache.invalidate(tenant_id, resource)
+            for callback in _invalidation_callbacks:
+                callback(tenant_id, resource)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_rolled_back_changes(session):
+    session.info.pop('response_cache_pending', None)
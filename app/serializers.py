@@ -0,0 +1,115 @@
+# app/serializers.py
+from decimal import Decimal
+from operator import attrgetter
+from flask import current_app
+from app.instrumentation import serialization_timer
+import orjson
+
+
+def _default(value):
+    # orjson encodes UUID, date and datetime itself; Decimal is the only
+    # column type left, rendered as a string like Flask's JSON provider does
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps(payload):
+    """Encode a payload to JSON bytes"""
+    return orjson.dumps(payload, default=_default)
+
+
+def json_response(payload, status=200):
+    """Build a JSON response from a payload, encoded with orjson"""
+    with serialization_timer():
+        body = dumps(payload)
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+class Serializer:
+    """
+    Converts model rows to JSON-ready dicts.
+
+    Built once per model at import time. Works on ORM instances and Core
+    Row objects alike, since both expose columns as attributes. Values are
+    left as UUID/date/datetime objects for the encoder to handle.
+
+    Parameters:
+    - fields: Attribute names to include, in output order
+    """
+
+    def __init__(self, *fields):
+        self.fields = fields
+        getter = attrgetter(*fields)
+        # attrgetter returns a bare value rather than a tuple for one field
+        self._values = getter if len(fields) > 1 else (lambda row: (getter(row),))
+        self._subsets = {}
+
+    def only(self, fields_param):
+        """
+        Narrow the serializer to a sparse fieldset
+
+        Parameters:
+        - fields_param: Comma-separated field names from the `fields` query
+          parameter, or None/empty for all fields
+
+        Returns a Serializer over the requested fields (in this serializer's
+        order); raises ValueError on unknown fields
+        """
+        if not fields_param:
+            return self
+        requested = {name.strip() for name in fields_param.split(',') if name.strip()}
+        unknown = requested.difference(self.fields)
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                             f"Must be among: {', '.join(self.fields)}")
+        if not requested:
+            return self
+        key = tuple(name for name in self.fields if name in requested)
+        subset = self._subsets.get(key)
+        if subset is None:
+            subset = self._subsets[key] = Serializer(*key)
+        return subset
+
+    def columns(self, model, *extra):
+        """Model columns to SELECT for these fields plus any extra attribute names"""
+        names = list(self.fields) + [name for name in extra if name not in self.fields]
+        return [getattr(model, name) for name in names]
+
+    def one(self, row):
+        return dict(zip(self.fields, self._values(row)))
+
+    def many(self, rows):
+        fields, values = self.fields, self._values
+        return [dict(zip(fields, values(row))) for row in rows]
+
+
+GOAL_SERIALIZER = Serializer(
+    'id', 'title', 'description', 'target_date', 'status', 'initiative_count',
+    'created_at', 'updated_at'
+)
+
+INITIATIVE_SERIALIZER = Serializer(
+    'id', 'title', 'description', 'status', 'priority', 'goal_id',
+    'idea_count', 'feedback_count', 'comment_count', 'created_at', 'updated_at'
+)
+
+USER_SERIALIZER = Serializer('id', 'email', 'role', 'created_at')
+
+# PUT /users/<id> has always answered with updated_at in place of created_at
+USER_UPDATE_SERIALIZER = Serializer('id', 'email', 'role', 'updated_at')
+
+CUSTOMER_SERIALIZER = Serializer(
+    'id', 'name', 'revenue', 'status', 'idea_count', 'feedback_count',
+    'created_at', 'updated_at'
+)
+
+TENANT_DELETION_SERIALIZER = Serializer(
+    'id', 'tenant_id', 'domain_name', 'status', 'current_table', 'rows_deleted', 'error',
+    'created_at', 'updated_at', 'completed_at'
+)
+
+COMMENT_SERIALIZER = Serializer(
+    'id', 'entity_type', 'entity_id', 'user_id', 'author_email', 'content',
+    'created_at', 'updated_at'
+)
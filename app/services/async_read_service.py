@@ -0,0 +1,88 @@
+# app/services/async_read_service.py
+from app.models import Goal, Initiative, Idea, Feedback
+from app.tenancy import scope_connection
+from sqlalchemy import select
+import asyncio
+
+
+class AsyncReadService:
+    """
+    Read-only data access on the async engine.
+
+    Independent reads are issued concurrently, each on its own pooled
+    connection, so a page waits for its slowest query instead of the sum of
+    all of them. Results are plain rows (attribute access by column name),
+    not ORM instances.
+    """
+
+    @staticmethod
+    def goals_query(tenant_id, limit):
+        return (
+            select(*Goal.__table__.c)
+            .where(Goal.tenant_id == tenant_id)
+            .order_by(Goal.created_at, Goal.id)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def initiatives_query(tenant_id, limit):
+        return (
+            select(*Initiative.__table__.c)
+            .where(Initiative.tenant_id == tenant_id)
+            .order_by(Initiative.priority.desc(), Initiative.created_at, Initiative.id)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def ideas_query(tenant_id, limit):
+        return (
+            select(*Idea.__table__.c)
+            .where(Idea.tenant_id == tenant_id)
+            .order_by(Idea.created_at.desc(), Idea.id)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def feedback_query(tenant_id, limit):
+        return (
+            select(*Feedback.__table__.c)
+            .where(Feedback.tenant_id == tenant_id)
+            .order_by(Feedback.created_at.desc(), Feedback.id)
+            .limit(limit)
+        )
+
+    @staticmethod
+    async def _fetch(engine, stmt):
+        async with engine.connect() as conn:
+            # run_async carries the request's tenant over to this loop thread
+            await conn.run_sync(scope_connection)
+            result = await conn.execute(stmt)
+            return result.all()
+
+    @staticmethod
+    async def gather(engine, queries):
+        """
+        Run several SELECTs concurrently
+
+        Parameters:
+        - engine: AsyncEngine to run on
+        - queries: Dict of name -> SELECT statement
+
+        Returns a dict of name -> rows
+        """
+        names = list(queries)
+        results = await asyncio.gather(*(
+            AsyncReadService._fetch(engine, queries[name]) for name in names
+        ))
+        return dict(zip(names, results))
+
+    @staticmethod
+    def section_query(section, tenant_id, limit):
+        """SELECT behind one dashboard section ('goals', 'initiatives', 'ideas', 'feedback')"""
+        builders = {
+            'goals': AsyncReadService.goals_query,
+            'initiatives': AsyncReadService.initiatives_query,
+            'ideas': AsyncReadService.ideas_query,
+            'feedback': AsyncReadService.feedback_query,
+        }
+        return builders[section](tenant_id, limit)
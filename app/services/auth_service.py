@@ -1,11 +1,30 @@
 # app/services/auth_service.py
 from app.models import User, Tenant
-from app.extensions import db
-from flask_jwt_extended import get_jwt_identity, create_access_token, create_refresh_token
+from app.extensions import db, principal_cache
+from app.auth.utils import password_hasher, PasswordHasherBusy
+from app.tenancy import set_current_tenant, unscoped
+from flask_jwt_extended import get_jwt_identity, get_jwt, create_access_token, create_refresh_token
 from flask import abort, jsonify
+from collections import namedtuple
+import orjson
 import uuid
 import re
 
+# The parts of a user that authorization checks need. Cached per user id so
+# protected routes do not have to load the users row on every request.
+Principal = namedtuple('Principal', ['id', 'tenant_id', 'email', 'role'])
+
+
+def _dump_principal(principal):
+    return orjson.dumps([str(principal.id), str(principal.tenant_id), principal.email, principal.role])
+
+def _load_principal(data):
+    user_id, tenant_id, email, role = orjson.loads(data)
+    return Principal(id=uuid.UUID(user_id), tenant_id=uuid.UUID(tenant_id), email=email, role=role)
+
+# How principals are stored when the cache is shared (PRINCIPAL_CACHE_URL)
+PRINCIPAL_CODEC = (_dump_principal, _load_principal)
+
 class AuthService:
     @staticmethod
     def register_tenant(domain_name, email, password, plan_tier='basic'):
@@ -27,11 +46,19 @@ class AuthService:
             return {'error': validation_errors}, 400
         
         # Check if email is already in use across all tenants
-        if User.query.filter_by(email=email).first():
+        with unscoped():
+            email_in_use = User.query.filter_by(email=email).first() is not None
+        if email_in_use:
             return {'error': 'Email already in use'}, 400
         
         # Check if tenant exists by domain_name
         tenant = Tenant.query.filter_by(domain_name=domain_name).first()
+        if not tenant:
+            # Hash before writing anything, on the bounded hashing pool
+            try:
+                password_hash = password_hasher.hash(password)
+            except PasswordHasherBusy:
+                return {'error': 'Too many concurrent registrations, please retry'}, 503
         
         if tenant:
             # Domain exists, register a new user under this tenant (default role: 'user')
@@ -49,13 +76,14 @@ class AuthService:
             )
             db.session.add(tenant)
             db.session.flush()  # Generate tenant ID
+            set_current_tenant(tenant.id)
             
             user = User(
                 tenant_id=tenant.id,
                 email=email,
-                role='admin'  # First user of a new tenant is admin
+                role='admin',  # First user of a new tenant is admin
+                password_hash=password_hash
             )
-            user.set_password(password)
             db.session.add(user)
             
             db.session.commit()
@@ -102,6 +130,7 @@ class AuthService:
         tenant = Tenant.query.get(tenant_id)
         if not tenant:
             return {'error': 'Tenant not found'}, 404
+        set_current_tenant(tenant_id)
             
         # Check if email already exists within tenant
         if User.query.filter_by(tenant_id=tenant_id, email=email).first():
@@ -112,13 +141,19 @@ class AuthService:
         if role not in valid_roles:
             return {'error': f"Invalid role. Must be one of: {', '.join(valid_roles)}"}, 400
             
+        # Hash on the bounded hashing pool
+        try:
+            password_hash = password_hasher.hash(password)
+        except PasswordHasherBusy:
+            return {'error': 'Too many concurrent registrations, please retry'}, 503
+        
         # Create new user
         user = User(
             tenant_id=tenant_id,
             email=email,
-            role=role
+            role=role,
+            password_hash=password_hash
         )
-        user.set_password(password)
         
         db.session.add(user)
         db.session.commit()
@@ -159,7 +194,12 @@ class AuthService:
     
     @staticmethod
     def get_current_user():
-        """Get the currently authenticated user from JWT token"""
+        """
+        Get the currently authenticated user from JWT token
+        
+        Returns a Principal (id, tenant_id, email, role) served from the
+        principal cache when possible; the users row is only loaded on a miss.
+        """
         user_id = get_jwt_identity()
         if not user_id:
             abort(401, description="Authentication required")
@@ -168,12 +208,36 @@ class AuthService:
             user_uuid = uuid.UUID(user_id)
         except ValueError:
             abort(401, description="Invalid authentication token")
+        
+        principal = principal_cache.get(user_uuid)
+        if principal is None:
+            # Under row-level security the users row is only visible within
+            # its tenant, so scope the lookup to the token's
+            try:
+                set_current_tenant(uuid.UUID(get_jwt()['tenant_id']))
+            except (KeyError, ValueError):
+                abort(401, description="Invalid authentication token")
             
-        user = User.query.get(user_uuid)
-        if not user:
-            abort(401, description="User not found")
+            user = User.query.get(user_uuid)
+            if not user:
+                abort(401, description="User not found")
             
-        return user
+            principal = Principal(id=user.id, tenant_id=user.tenant_id, email=user.email, role=user.role)
+            principal_cache.set(user_uuid, principal)
+        
+        # Scopes the request's transactions when row-level security is on
+        set_current_tenant(principal.tenant_id)
+        return principal
+    
+    @staticmethod
+    def invalidate_principal(user_id):
+        """
+        Drop a user's cached principal after their role or email changes or they are deleted
+        
+        With a shared principal cache this reaches every worker; otherwise the
+        other workers keep the old principal for up to PRINCIPAL_CACHE_TTL.
+        """
+        principal_cache.delete(user_id)
     
     @staticmethod
     def verify_tenant_access(tenant_id):
@@ -201,7 +265,7 @@ class AuthService:
         Ensure a user belongs to the same tenant as an entity or tenant ID
         
         Parameters:
-        - user: User model instance
+        - user: User model instance or Principal
         - entity_or_tenant_id: Either a UUID object/string of a tenant ID or
                               an entity object with a tenant_id attribute
         
@@ -0,0 +1,84 @@
+# app/services/comment_service.py
+from app.models import Comment, User, Idea, Feedback, Initiative
+from app.extensions import db
+from app.pagination import Keyset
+from sqlalchemy import select, func
+from itertools import groupby
+
+# Entity types a comment can be attached to, and their models
+COMMENTABLE_ENTITIES = {
+    'idea': Idea,
+    'feedback': Feedback,
+    'initiative': Initiative,
+}
+
+# Oldest first within a thread, with id as tiebreaker
+COMMENT_KEYSET = Keyset(Comment.created_at, Comment.id)
+
+class CommentService:
+    @staticmethod
+    def find_entities(tenant_id, entity_type, entity_ids):
+        """
+        Check which of the given entities exist in the tenant
+        
+        Comments carry no tenant_id of their own; their tenant is that of the
+        entity they are attached to, so every comment access starts here.
+        
+        Parameters:
+        - tenant_id: UUID of the current user's tenant
+        - entity_type: Key of COMMENTABLE_ENTITIES
+        - entity_ids: UUIDs of the entities
+        
+        Returns the set of ids that belong to the tenant
+        """
+        model = COMMENTABLE_ENTITIES[entity_type]
+        return set(db.session.execute(
+            select(model.id).where(model.tenant_id == tenant_id, model.id.in_(entity_ids))
+        ).scalars())
+    
+    @staticmethod
+    def load_threads(entity_type, entity_ids, limit, cursor=None):
+        """
+        Load the first page of comments of many entities in one query
+        
+        A single IN query on (entity_type, entity_id) fetches every thread;
+        a row_number() window caps each thread at one row past the page, and
+        the author email is joined in instead of loading User objects.
+        
+        Parameters:
+        - entity_type: Key of COMMENTABLE_ENTITIES
+        - entity_ids: UUIDs of entities already checked with find_entities
+        - limit: Comments per thread
+        - cursor: Cursor of the next page, only meaningful for a single entity
+        
+        Returns a dict of entity_id -> (comments, next_cursor); raises
+        ValueError on a bad cursor
+        """
+        position = func.row_number().over(
+            partition_by=Comment.entity_id,
+            order_by=COMMENT_KEYSET.order_by
+        ).label('position')
+        
+        query = (
+            select(
+                Comment.id, Comment.entity_type, Comment.entity_id, Comment.user_id,
+                User.email.label('author_email'), Comment.content,
+                Comment.created_at, Comment.updated_at, position
+            )
+            .join(User, User.id == Comment.user_id)
+            .where(Comment.entity_type == entity_type, Comment.entity_id.in_(entity_ids))
+        )
+        if cursor:
+            query = query.where(COMMENT_KEYSET.after(cursor))
+        
+        ranked = query.subquery()
+        rows = db.session.execute(
+            select(ranked)
+            .where(ranked.c.position <= limit + 1)
+            .order_by(ranked.c.entity_id, ranked.c.position)
+        ).all()
+        
+        threads = {entity_id: ([], None) for entity_id in entity_ids}
+        for entity_id, thread in groupby(rows, key=lambda row: row.entity_id):
+            threads[entity_id] = COMMENT_KEYSET.page(list(thread), limit)
+        return threads
@@ -0,0 +1,91 @@
+# app/services/counter_service.py
+from app.models import (Goal, Initiative, Idea, Comment, Customer, CustomerStats,
+                        feedback_initiatives, ideas_customers, feedback_customers)
+from app.extensions import db
+from sqlalchemy import select, insert, update, func
+
+
+class CounterService:
+    @staticmethod
+    def recompute_counters(tenant_id=None):
+        """
+        Recompute the denormalized rollup counters from their child rows.
+
+        The counters are kept up to date by database triggers; this is the
+        repair path for when they drift (e.g. after triggers were disabled
+        for a bulk load). Only rows whose stored value is wrong are written.
+
+        Parameters:
+        - tenant_id: Restrict the repair to one tenant (default: all tenants)
+
+        Returns a dict of counter name -> number of rows repaired
+        """
+        initiative_count = (
+            select(func.count(Initiative.id))
+            .where(Initiative.goal_id == Goal.id)
+            .scalar_subquery()
+        )
+        idea_count = (
+            select(func.count(Idea.id))
+            .where(Idea.initiative_id == Initiative.id)
+            .scalar_subquery()
+        )
+        feedback_count = (
+            select(func.count())
+            .select_from(feedback_initiatives)
+            .where(feedback_initiatives.c.initiative_id == Initiative.id)
+            .scalar_subquery()
+        )
+        comment_count = (
+            select(func.count(Comment.id))
+            .where(Comment.entity_type == 'initiative', Comment.entity_id == Initiative.id)
+            .scalar_subquery()
+        )
+        customer_idea_count = (
+            select(func.count())
+            .select_from(ideas_customers)
+            .where(ideas_customers.c.customer_id == CustomerStats.customer_id)
+            .scalar_subquery()
+        )
+        customer_feedback_count = (
+            select(func.count())
+            .select_from(feedback_customers)
+            .where(feedback_customers.c.customer_id == CustomerStats.customer_id)
+            .scalar_subquery()
+        )
+
+        counters = {
+            'goals.initiative_count': (Goal, Goal.initiative_count, initiative_count),
+            'initiatives.idea_count': (Initiative, Initiative.idea_count, idea_count),
+            'initiatives.feedback_count': (Initiative, Initiative.feedback_count, feedback_count),
+            'initiatives.comment_count': (Initiative, Initiative.comment_count, comment_count),
+            'customer_stats.idea_count': (CustomerStats, CustomerStats.idea_count, customer_idea_count),
+            'customer_stats.feedback_count': (CustomerStats, CustomerStats.feedback_count, customer_feedback_count),
+        }
+
+        # Customers without a stats row get one first (counts are fixed below)
+        missing = (
+            select(Customer.id, Customer.tenant_id)
+            .where(~select(CustomerStats.customer_id).where(CustomerStats.customer_id == Customer.id).exists())
+        )
+        if tenant_id is not None:
+            missing = missing.where(Customer.tenant_id == tenant_id)
+        repaired = {
+            'customer_stats.rows': db.session.execute(
+                insert(CustomerStats).from_select(['customer_id', 'tenant_id'], missing)
+            ).rowcount
+        }
+
+        for name, (model, column, actual) in counters.items():
+            stmt = (
+                update(model)
+                .where(column != actual)
+                .values({column.key: actual})
+                .execution_options(synchronize_session=False)
+            )
+            if tenant_id is not None:
+                stmt = stmt.where(model.tenant_id == tenant_id)
+            repaired[name] = db.session.execute(stmt).rowcount
+
+        db.session.commit()
+        return repaired
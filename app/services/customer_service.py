@@ -0,0 +1,37 @@
+# app/services/customer_service.py
+from app.models import Customer, CustomerStats
+from sqlalchemy import select, func
+
+
+class CustomerService:
+    @staticmethod
+    def select_with_stats(tenant_id, *extra):
+        """
+        Build a SELECT of a tenant's customers with their idea and feedback counts
+
+        The counts come from the customer_stats table (one row per customer,
+        kept in step by triggers) rather than from counting junction rows.
+        It is outer-joined so a customer whose stats row is missing still
+        lists, with zero counts; `flask repair-counters` restores such rows.
+
+        Parameters:
+        - tenant_id: UUID of the current user's tenant
+        - extra: Additional columns to select (e.g. sort keys)
+
+        Returns the Select, ready for further filtering and pagination
+        """
+        return (
+            select(
+                Customer.id,
+                Customer.name,
+                Customer.revenue,
+                Customer.status,
+                func.coalesce(CustomerStats.idea_count, 0).label('idea_count'),
+                func.coalesce(CustomerStats.feedback_count, 0).label('feedback_count'),
+                Customer.created_at,
+                Customer.updated_at,
+                *extra
+            )
+            .outerjoin(CustomerStats, CustomerStats.customer_id == Customer.id)
+            .where(Customer.tenant_id == tenant_id)
+        )
@@ -0,0 +1,181 @@
+# app/services/dashboard_service.py
+from app.models import Tenant, Goal, Initiative, Idea, Feedback
+from app.extensions import db, dashboard_cache
+from app.response_cache import on_invalidate
+from app.services.async_read_service import AsyncReadService
+from app.database import get_async_engine, run_async
+from flask import current_app
+from sqlalchemy import select, literal, null, cast, func, union_all, String, Integer
+
+# Summary sections: name -> (model, column counted by value, name of the breakdown)
+SUMMARY_SECTIONS = {
+    'goals': (Goal, Goal.status, 'by_status'),
+    'initiatives': (Initiative, Initiative.status, 'by_status'),
+    'ideas': (Idea, Idea.priority, 'by_priority'),
+    'feedback': (Feedback, Feedback.sentiment, 'by_sentiment'),
+}
+
+# Entity type reported in recent activity for each section
+ACTIVITY_TYPES = {
+    'goals': 'goal',
+    'initiatives': 'initiative',
+    'ideas': 'idea',
+    'feedback': 'feedback',
+}
+
+class DashboardService:
+    @staticmethod
+    def summary_query(tenant_id, recent_limit):
+        """
+        Build the single query behind a tenant's dashboard summary
+        
+        Every part is a branch of one UNION ALL with the same columns
+        (section, key, count, id, title, at): a row for the tenant, one
+        GROUP BY per section for its breakdown, and the most recently
+        updated rows of each section (served by the (tenant_id, updated_at)
+        indexes).
+        """
+        branches = [
+            select(
+                literal('tenant', String).label('section'),
+                Tenant.plan_tier.label('key'),
+                cast(null(), Integer).label('count'),
+                Tenant.id.label('id'),
+                Tenant.domain_name.label('title'),
+                Tenant.created_at.label('at')
+            ).where(Tenant.id == tenant_id)
+        ]
+        
+        for section, (model, column, _) in SUMMARY_SECTIONS.items():
+            branches.append(
+                select(
+                    literal(section, String), column, func.count(),
+                    cast(null(), model.id.type), cast(null(), String), cast(null(), model.updated_at.type)
+                )
+                .where(model.tenant_id == tenant_id)
+                .group_by(column)
+            )
+        
+        for section, (model, _, _) in SUMMARY_SECTIONS.items():
+            recent = (
+                select(
+                    literal(f'recent_{section}', String).label('section'),
+                    cast(null(), String).label('key'),
+                    cast(null(), Integer).label('count'),
+                    model.id, model.title, model.updated_at
+                )
+                .where(model.tenant_id == tenant_id)
+                .order_by(model.updated_at.desc())
+                .limit(recent_limit)
+                .subquery()
+            )
+            branches.append(select(*recent.c))
+        
+        return union_all(*branches)
+    
+    @staticmethod
+    def load_summary(tenant_id):
+        """
+        Compute a tenant's dashboard summary with one database round trip
+        
+        Returns the summary dict, or None if the tenant does not exist
+        """
+        recent_limit = current_app.config['DASHBOARD_RECENT_LIMIT']
+        rows = db.session.execute(DashboardService.summary_query(tenant_id, recent_limit)).all()
+        return DashboardService.build_summary(rows, recent_limit)
+    
+    @staticmethod
+    def build_summary(rows, recent_limit):
+        """
+        Turn the rows of summary_query into the summary dict
+        
+        Returns the summary dict, or None if the tenant does not exist
+        """
+        summary = {'tenant': None}
+        for section, (_, _, breakdown) in SUMMARY_SECTIONS.items():
+            summary[section] = {'total': 0, breakdown: {}}
+        activity = []
+        
+        for section, key, count, row_id, title, at in rows:
+            if section == 'tenant':
+                summary['tenant'] = {'id': row_id, 'domain_name': title, 'plan_tier': key}
+            elif section in SUMMARY_SECTIONS:
+                breakdown = SUMMARY_SECTIONS[section][2]
+                summary[section]['total'] += count
+                summary[section][breakdown][key] = count
+            else:
+                activity.append({
+                    'type': ACTIVITY_TYPES[section[len('recent_'):]],
+                    'id': row_id,
+                    'title': title,
+                    'updated_at': at
+                })
+        
+        if summary['tenant'] is None:
+            return None
+        
+        # Merge the per-section recent rows into one timeline
+        activity.sort(key=lambda item: item['updated_at'], reverse=True)
+        summary['recent_activity'] = activity[:recent_limit]
+        return summary
+    
+    @staticmethod
+    def get_summary(tenant_id):
+        """
+        Return a tenant's dashboard summary, from the per-process cache if fresh
+        
+        Entries are dropped when a commit in this process writes a goal,
+        initiative, idea or feedback of the tenant, and expire after
+        DASHBOARD_SUMMARY_TTL seconds otherwise (covering writes made by
+        other workers). The returned dict is shared; do not modify it.
+        
+        Returns the summary dict, or None if the tenant does not exist
+        """
+        summary = dashboard_cache.get(tenant_id)
+        if summary is None:
+            summary = DashboardService.load_summary(tenant_id)
+            if summary is not None:
+                dashboard_cache.set(tenant_id, summary)
+        return summary
+    
+    @staticmethod
+    def load_page(tenant_id, section):
+        """
+        Load what a dashboard page shows: the summary and one section's list
+        
+        With the summary cached, the list is the only query and runs directly
+        on the session. Otherwise the summary and the list are read
+        concurrently on the async engine, so the page waits for the slower of
+        the two instead of their sum.
+        
+        Parameters:
+        - tenant_id: UUID of the current user's tenant
+        - section: 'goals', 'initiatives', 'ideas' or 'feedback'
+        
+        Returns a tuple of (summary, rows); summary is None if the tenant does not exist
+        """
+        list_query = AsyncReadService.section_query(section, tenant_id, current_app.config['DASHBOARD_LIST_LIMIT'])
+        
+        summary = dashboard_cache.get(tenant_id)
+        if summary is not None:
+            return summary, db.session.execute(list_query).all()
+        
+        recent_limit = current_app.config['DASHBOARD_RECENT_LIMIT']
+        data = run_async(AsyncReadService.gather(get_async_engine(), {
+            'summary': DashboardService.summary_query(tenant_id, recent_limit),
+            section: list_query,
+        }))
+        summary = DashboardService.build_summary(data['summary'], recent_limit)
+        if summary is not None:
+            dashboard_cache.set(tenant_id, summary)
+        return summary, data[section]
+
+
+@on_invalidate
+def _drop_cached_summary(tenant_id, resource):
+    if resource != 'dashboard':
+        return
+    if tenant_id is None:
+        dashboard_cache.clear()
+    else:
+        dashboard_cache.delete(tenant_id)
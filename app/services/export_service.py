@@ -0,0 +1,140 @@
+# app/services/export_service.py
+from app.models import Goal, Initiative, Idea, Feedback, Comment, User
+from app.extensions import db
+from app.pagination import Keyset
+from app.serializers import dumps
+from app.tenancy import scope_connection
+from sqlalchemy import select
+from datetime import date, datetime
+import csv
+import io
+import zlib
+
+# Rows fetched per round trip from the server-side cursor
+FETCH_ROWS = 1000
+
+
+def _goals(tenant_id):
+    return select(*Goal.__table__.c).where(Goal.tenant_id == tenant_id)
+
+def _initiatives(tenant_id):
+    return select(*Initiative.__table__.c).where(Initiative.tenant_id == tenant_id)
+
+def _ideas(tenant_id):
+    return select(*Idea.__table__.c).where(Idea.tenant_id == tenant_id)
+
+def _feedback(tenant_id):
+    return select(*Feedback.__table__.c).where(Feedback.tenant_id == tenant_id)
+
+def _comments(tenant_id):
+    # Comments have no tenant_id; they belong to their authors' tenant
+    return select(*Comment.__table__.c).where(
+        Comment.user_id.in_(select(User.id).where(User.tenant_id == tenant_id))
+    )
+
+# Exportable resources: name -> (query builder, keyset). Each keyset follows
+# an index on (tenant_id, <keys>) (comments: (user_id, <keys>)).
+EXPORT_RESOURCES = {
+    'goals': (_goals, Keyset(Goal.created_at, Goal.id)),
+    'initiatives': (_initiatives, Keyset(Initiative.priority.desc(), Initiative.created_at, Initiative.id)),
+    'ideas': (_ideas, Keyset(Idea.created_at, Idea.id)),
+    'feedback': (_feedback, Keyset(Feedback.created_at, Feedback.id)),
+    'comments': (_comments, Keyset(Comment.user_id, Comment.created_at, Comment.id)),
+}
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def _csv_chunk(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+    return buffer.getvalue().encode()
+
+def _csv_header(columns):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(columns)
+    return buffer.getvalue().encode()
+
+def _ndjson_chunk(rows):
+    return b''.join(dumps(row._asdict()) + b'\n' for row in rows)
+
+# Export formats: name -> (mimetype, file extension, header encoder, chunk encoder)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv', _csv_header, _csv_chunk),
+    'ndjson': ('application/x-ndjson', 'ndjson', None, _ndjson_chunk),
+}
+
+
+class ExportService:
+    @staticmethod
+    def _read_chunk(engine, stmt, encode, tenant_id):
+        # Short-lived connection per chunk: rows stream from a server-side
+        # cursor (yield_per) and are encoded as they arrive, and the
+        # transaction ends before any of the chunk is sent to the client
+        last = None
+        count = 0
+        
+        def rows(result):
+            nonlocal last, count
+            for row in result:
+                last = row
+                count += 1
+                yield row
+        
+        with engine.connect() as connection:
+            # Explicitly, as the body streams after the request's teardown
+            scope_connection(connection, tenant_id)
+            result = connection.execution_options(yield_per=FETCH_ROWS).execute(stmt)
+            data = encode(rows(result))
+        return data, last, count
+    
+    @staticmethod
+    def stream(tenant_id, resource, fmt, chunk_rows, compress=False):
+        """
+        Generate a tenant's full export of a resource as encoded bytes
+        
+        Rows are read in keyset chunks of chunk_rows, each in its own short
+        transaction, so memory is bounded by the chunk size and a slow client
+        never keeps a transaction (or a pooled connection) open between chunks.
+        
+        Parameters:
+        - tenant_id: UUID of the current user's tenant
+        - resource: Key of EXPORT_RESOURCES
+        - fmt: Key of EXPORT_FORMATS
+        - chunk_rows: Rows per chunk/transaction
+        - compress: Gzip the output
+        
+        Yields chunks of the response body
+        """
+        build_query, keyset = EXPORT_RESOURCES[resource]
+        _, _, encode_header, encode_chunk = EXPORT_FORMATS[fmt]
+        engine = db.engine
+        query = build_query(tenant_id)
+        compressor = zlib.compressobj(wbits=31) if compress else None  # 31: gzip container
+        
+        def output(data):
+            return compressor.compress(data) if compressor else data
+        
+        if encode_header:
+            yield output(encode_header([column.key for column in query.selected_columns]))
+        
+        cursor = None
+        while True:
+            stmt = query.order_by(*keyset.order_by).limit(chunk_rows)
+            if cursor:
+                stmt = stmt.where(keyset.after(cursor))
+            data, last, count = ExportService._read_chunk(engine, stmt, encode_chunk, tenant_id)
+            data = output(data)
+            if data:
+                yield data
+            if count < chunk_rows:
+                break
+            cursor = keyset.encode(last)
+        
+        if compressor:
+            yield compressor.flush()
@@ -0,0 +1,164 @@
+# app/services/feedback_service.py
+from app.models import Feedback, Customer, feedback_customers
+from app.extensions import db
+from sqlalchemy import select, insert
+from sqlalchemy.exc import SQLAlchemyError
+import orjson
+import uuid
+
+VALID_SENTIMENTS = ['positive', 'neutral', 'negative']
+
+class FeedbackService:
+    @staticmethod
+    def validate_new_feedback(data):
+        """
+        Validate the fields of a new feedback item
+        
+        Parameters:
+        - data: Payload for one feedback item
+        
+        Returns a tuple of (values, customer_ids, error); error is None if valid
+        """
+        if not isinstance(data, dict):
+            return None, None, 'Each line must be a JSON object'
+        
+        for field in ('title', 'sentiment'):
+            if not data.get(field):
+                return None, None, f'Missing required field: {field}'
+        
+        if not isinstance(data['title'], str) or len(data['title']) > 100:
+            return None, None, 'Title must be a string of at most 100 characters'
+        
+        if data['sentiment'] not in VALID_SENTIMENTS:
+            return None, None, f"Invalid sentiment. Must be one of: {', '.join(VALID_SENTIMENTS)}"
+        
+        customer_ids = data.get('customer_ids') or []
+        if not isinstance(customer_ids, list):
+            return None, None, 'customer_ids must be a list'
+        try:
+            customer_ids = {uuid.UUID(str(customer_id)) for customer_id in customer_ids}
+        except ValueError:
+            return None, None, 'Invalid customer ID format'
+        
+        return {
+            'title': data['title'],
+            'description': data.get('description', ''),
+            'sentiment': data['sentiment']
+        }, customer_ids, None
+    
+    @staticmethod
+    def iter_lines(stream, max_line_bytes):
+        """
+        Read a byte stream line by line without holding more than one line
+        
+        Yields (line_number, line) pairs for non-blank lines; line is None
+        when it exceeded max_line_bytes (the rest of it is skipped)
+        """
+        line_number = 0
+        while True:
+            line = stream.readline(max_line_bytes + 1)
+            if not line:
+                return
+            line_number += 1
+            if len(line) > max_line_bytes and not line.endswith(b'\n'):
+                # Discard the remainder of the oversized line
+                while line and not line.endswith(b'\n'):
+                    line = stream.readline(max_line_bytes)
+                yield line_number, None
+            elif line.strip():
+                yield line_number, line
+    
+    @staticmethod
+    def _write_batch(tenant_id, batch, summary, add_error):
+        # One IN query resolves every customer referenced by the batch,
+        # restricted to the tenant so foreign customers read as unknown
+        referenced = set().union(*(customer_ids for _, _, customer_ids in batch))
+        known = set()
+        if referenced:
+            known = set(db.session.execute(
+                select(Customer.id).where(Customer.tenant_id == tenant_id, Customer.id.in_(referenced))
+            ).scalars())
+        
+        records = []
+        record_lines = []
+        links = []
+        for line_number, values, customer_ids in batch:
+            if not customer_ids <= known:
+                add_error(line_number, 'Unknown customer ID(s)')
+                continue
+            record = dict(values, id=uuid.uuid4(), tenant_id=tenant_id)
+            records.append(record)
+            record_lines.append(line_number)
+            links.extend({'feedback_id': record['id'], 'customer_id': customer_id} for customer_id in customer_ids)
+        
+        if not records:
+            return
+        try:
+            db.session.execute(insert(Feedback), records)
+            if links:
+                db.session.execute(insert(feedback_customers), links)
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            # Lines already rejected above were reported once; only the
+            # written ones failed here
+            for line_number in record_lines:
+                add_error(line_number, 'Database error while writing batch')
+            return
+        summary['created'] += len(records)
+    
+    @staticmethod
+    def ingest_stream(tenant_id, stream, batch_size, max_line_bytes, max_errors):
+        """
+        Create feedback from an NDJSON stream, one JSON object per line
+        
+        Lines are parsed as they arrive and written in batches of batch_size,
+        each with multi-row INSERTs and its own commit, so memory use is
+        bounded by the batch size rather than the payload size. Invalid lines
+        are skipped and reported; a failed batch does not undo earlier ones.
+        
+        Parameters:
+        - tenant_id: UUID of the tenant that owns the new feedback
+        - stream: Binary file-like request body
+        - batch_size: Rows per INSERT/commit
+        - max_line_bytes: Longest accepted line
+        - max_errors: Most errors reported individually (all are counted)
+        
+        Returns a dict with 'lines', 'created', 'failed', 'errors'
+        ({line, error} per rejected line, 1-based) and 'errors_truncated'
+        """
+        summary = {'lines': 0, 'created': 0, 'failed': 0, 'errors': [], 'errors_truncated': False}
+        
+        def add_error(line_number, error):
+            summary['failed'] += 1
+            if len(summary['errors']) < max_errors:
+                summary['errors'].append({'line': line_number, 'error': error})
+            else:
+                summary['errors_truncated'] = True
+        
+        batch = []
+        for line_number, line in FeedbackService.iter_lines(stream, max_line_bytes):
+            summary['lines'] = line_number
+            if line is None:
+                add_error(line_number, f'Line exceeds {max_line_bytes} bytes')
+                continue
+            try:
+                data = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                add_error(line_number, 'Invalid JSON')
+                continue
+            
+            values, customer_ids, error = FeedbackService.validate_new_feedback(data)
+            if error:
+                add_error(line_number, error)
+                continue
+            
+            batch.append((line_number, values, customer_ids))
+            if len(batch) >= batch_size:
+                FeedbackService._write_batch(tenant_id, batch, summary, add_error)
+                batch = []
+        
+        if batch:
+            FeedbackService._write_batch(tenant_id, batch, summary, add_error)
+        
+        return summary
@@ -0,0 +1,99 @@
+# app/services/goal_service.py
+from app.models import Goal
+from app.extensions import db
+from sqlalchemy import insert
+from datetime import datetime
+import uuid
+
+class GoalService:
+    @staticmethod
+    def parse_target_date(value):
+        """
+        Parse a YYYY-MM-DD target date
+        
+        Returns a date, or None if value is empty; raises ValueError if malformed
+        """
+        if not value:
+            return None
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    
+    @staticmethod
+    def validate_new_goal(data):
+        """
+        Validate the fields of a new goal
+        
+        Parameters:
+        - data: Request payload for one goal
+        
+        Returns a tuple of (values, error); error is None if valid
+        """
+        if 'title' not in data:
+            return None, 'Missing required field: title'
+        
+        try:
+            target_date = GoalService.parse_target_date(data.get('target_date'))
+        except (ValueError, TypeError):
+            return None, 'Invalid date format. Use YYYY-MM-DD'
+        
+        return {
+            'title': data['title'],
+            'description': data.get('description', ''),
+            'target_date': target_date,
+            'status': data.get('status', 'In Progress')
+        }, None
+    
+    @staticmethod
+    def validate_goal_update(data):
+        """
+        Validate the fields of a partial goal update
+        
+        Parameters:
+        - data: Request payload; only the fields present are updated
+        
+        Returns a tuple of (values, error); error is None if valid
+        """
+        values = {field: data[field] for field in ('title', 'description', 'status') if field in data}
+        
+        if 'target_date' in data:
+            try:
+                values['target_date'] = GoalService.parse_target_date(data['target_date'])
+            except (ValueError, TypeError):
+                return None, 'Invalid date format. Use YYYY-MM-DD'
+        
+        return values, None
+    
+    @staticmethod
+    def bulk_create(tenant_id, rows):
+        """
+        Validate and insert many goals in one transaction
+        
+        Valid rows are written with a multi-row INSERT; invalid rows are
+        skipped and reported.
+        
+        Parameters:
+        - tenant_id: UUID of the tenant that owns the new goals
+        - rows: List of goal payloads
+        
+        Returns a dict with 'created' ({index, id} per inserted row) and
+        'errors' ({index, error} per rejected row)
+        """
+        created = []
+        errors = []
+        records = []
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                errors.append({'index': index, 'error': 'Each goal must be an object'})
+                continue
+            values, error = GoalService.validate_new_goal(row)
+            if error:
+                errors.append({'index': index, 'error': error})
+                continue
+            record = dict(values, id=uuid.uuid4(), tenant_id=tenant_id)
+            records.append(record)
+            created.append({'index': index, 'id': str(record['id'])})
+        
+        if records:
+            db.session.execute(insert(Goal), records)
+            db.session.commit()
+        
+        return {'created': created, 'errors': errors}
@@ -0,0 +1,141 @@
+# app/services/initiative_service.py
+from app.models import Initiative, Goal
+from app.extensions import db
+from sqlalchemy import select, insert
+import uuid
+
+VALID_STATUSES = ['active', 'planned', 'completed']
+
+class InitiativeService:
+    @staticmethod
+    def validate_new_initiative(data):
+        """
+        Validate the fields of a new initiative
+        
+        Parameters:
+        - data: Request payload for one initiative
+        
+        Returns a tuple of (values, error); values holds the column values to
+        insert (goal ownership is not checked here), error is None if valid
+        """
+        required_fields = ['title', 'status', 'priority']
+        for field in required_fields:
+            if field not in data:
+                return None, f'Missing required field: {field}'
+        
+        if data['status'] not in VALID_STATUSES:
+            return None, f"Invalid status. Must be one of: {', '.join(VALID_STATUSES)}"
+        
+        try:
+            priority = int(data['priority'])
+        except (ValueError, TypeError):
+            return None, 'Priority must be an integer between 1 and 5'
+        if not 1 <= priority <= 5:
+            return None, 'Priority must be between 1 and 5'
+        
+        goal_id = None
+        if data.get('goal_id'):
+            try:
+                goal_id = uuid.UUID(data['goal_id'])
+            except (ValueError, TypeError, AttributeError):
+                return None, 'Invalid goal_id format'
+        
+        return {
+            'title': data['title'],
+            'description': data.get('description', ''),
+            'status': data['status'],
+            'priority': priority,
+            'goal_id': goal_id
+        }, None
+    
+    @staticmethod
+    def validate_initiative_update(data):
+        """
+        Validate the fields of a partial initiative update
+        
+        Parameters:
+        - data: Request payload; only the fields present are updated
+        
+        Returns a tuple of (values, error); goal ownership is not checked
+        here, error is None if valid
+        """
+        values = {field: data[field] for field in ('title', 'description') if field in data}
+        
+        if 'status' in data:
+            if data['status'] not in VALID_STATUSES:
+                return None, f"Invalid status. Must be one of: {', '.join(VALID_STATUSES)}"
+            values['status'] = data['status']
+        
+        if 'priority' in data:
+            try:
+                priority = int(data['priority'])
+            except (ValueError, TypeError):
+                return None, 'Priority must be an integer between 1 and 5'
+            if not 1 <= priority <= 5:
+                return None, 'Priority must be between 1 and 5'
+            values['priority'] = priority
+        
+        if 'goal_id' in data:
+            if data['goal_id'] is None:
+                values['goal_id'] = None
+            else:
+                try:
+                    values['goal_id'] = uuid.UUID(data['goal_id'])
+                except (ValueError, TypeError, AttributeError):
+                    return None, 'Invalid goal_id format'
+        
+        return values, None
+    
+    @staticmethod
+    def bulk_create(tenant_id, rows):
+        """
+        Validate and insert many initiatives in one transaction
+        
+        Rows are validated with the same rules as a single create. Referenced
+        goals are checked against the tenant with one set-based query, and the
+        valid rows are written with a multi-row INSERT. Invalid rows are
+        skipped and reported.
+        
+        Parameters:
+        - tenant_id: UUID of the tenant that owns the new initiatives
+        - rows: List of initiative payloads
+        
+        Returns a dict with 'created' ({index, id} per inserted row) and
+        'errors' ({index, error} per rejected row)
+        """
+        errors = []
+        valid = []
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                errors.append({'index': index, 'error': 'Each initiative must be an object'})
+                continue
+            values, error = InitiativeService.validate_new_initiative(row)
+            if error:
+                errors.append({'index': index, 'error': error})
+            else:
+                valid.append((index, values))
+        
+        # Check every referenced goal belongs to the tenant in a single query
+        goal_ids = {values['goal_id'] for _, values in valid if values['goal_id']}
+        tenant_goal_ids = set()
+        if goal_ids:
+            tenant_goal_ids = set(db.session.scalars(
+                select(Goal.id).where(Goal.tenant_id == tenant_id, Goal.id.in_(goal_ids))
+            ))
+        
+        created = []
+        records = []
+        for index, values in valid:
+            if values['goal_id'] and values['goal_id'] not in tenant_goal_ids:
+                errors.append({'index': index, 'error': 'Goal not found'})
+                continue
+            record = dict(values, id=uuid.uuid4(), tenant_id=tenant_id)
+            records.append(record)
+            created.append({'index': index, 'id': str(record['id'])})
+        
+        if records:
+            db.session.execute(insert(Initiative), records)
+            db.session.commit()
+        
+        errors.sort(key=lambda error: error['index'])
+        return {'created': created, 'errors': errors}
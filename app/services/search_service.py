@@ -0,0 +1,263 @@
+# app/services/search_service.py
+from app.models import Idea, Feedback, Initiative
+from app.extensions import db
+from app.pagination import Keyset
+from sqlalchemy import select, literal, literal_column, union_all, func, cast, type_coerce, table, column, text, Double, String
+import html
+import uuid
+
+# Searchable entity types and their models
+SEARCH_ENTITIES = {
+    'idea': Idea,
+    'feedback': Feedback,
+    'initiative': Initiative,
+}
+
+# The database delimits matched terms with these Private Use Area characters
+# rather than markup, since the text around them is the user's own; the
+# result is HTML-escaped and only then are they turned into <mark> tags
+HIGHLIGHT_START = '\ue000'
+HIGHLIGHT_STOP = '\ue001'
+
+
+class SearchBackend:
+    """
+    Ranked full-text search over a tenant's ideas, feedback and initiatives.
+
+    Subclasses provide the matching query and the highlighting for one
+    database dialect; paging is shared. Matches are ordered by rank, then
+    type and id, and paginated with a keyset cursor over those three values.
+    Highlights are computed for the rows of the returned page only.
+    """
+
+    def matches(self, tenant_id, query, types):
+        """Subquery of (type, id, rank) for every matching row, higher rank first"""
+        raise NotImplementedError
+
+    def highlights(self, tenant_id, query, rows):
+        """Dict of (type, id) -> (title, snippet) with the matched terms marked"""
+        raise NotImplementedError
+
+    def search(self, tenant_id, query, types, cursor, limit):
+        """
+        Search a tenant's content
+
+        Parameters:
+        - tenant_id: UUID of the current user's tenant
+        - query: Search text as typed by the user
+        - types: Entity types to search (keys of SEARCH_ENTITIES)
+        - cursor: Cursor returned by a previous page, or None
+        - limit: Page size
+
+        Returns a tuple of (results, next_cursor); raises ValueError on a bad cursor
+        """
+        matches = self.matches(tenant_id, query, types)
+        keyset = Keyset(matches.c.rank.desc(), matches.c.type, matches.c.id)
+        rows = db.session.execute(keyset.apply(select(matches), cursor, limit)).all()
+        rows, next_cursor = keyset.page(rows, limit)
+
+        marked = self.highlights(tenant_id, query, rows) if rows else {}
+        results = []
+        for row in rows:
+            title, snippet = marked.get((row.type, row.id), (None, None))
+            results.append({
+                'type': row.type,
+                'id': self.entity_id(row.id),
+                'rank': row.rank,
+                'title': self.mark(title),
+                'snippet': self.mark(snippet)
+            })
+        return results, next_cursor
+
+    @staticmethod
+    def mark(highlighted):
+        """HTML-escape a highlighted text and wrap its matches in <mark> tags"""
+        if highlighted is None:
+            return None
+        return (
+            html.escape(highlighted)
+            .replace(HIGHLIGHT_START, '<mark>')
+            .replace(HIGHLIGHT_STOP, '</mark>')
+        )
+
+    @staticmethod
+    def entity_id(value):
+        return value
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Search on the generated `search_vector` tsvector columns.
+
+    The columns are defined (and indexed with GIN on tenant_id, search_vector)
+    in db-init/database-setup.sql only; they are not mapped on the models so
+    the ORM never tries to write them.
+    """
+
+    TS_CONFIG = 'english'
+    TITLE_OPTIONS = f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}", HighlightAll=true'
+    SNIPPET_OPTIONS = f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}", MaxFragments=2, MaxWords=20, MinWords=5'
+
+    def _tsquery(self, query):
+        # websearch syntax: quoted phrases, OR and -negation, never a syntax error
+        return func.websearch_to_tsquery(literal_column(f"'{self.TS_CONFIG}'"), query)
+
+    def matches(self, tenant_id, query, types):
+        tsquery = self._tsquery(query)
+        selects = []
+        for entity_type in types:
+            model = SEARCH_ENTITIES[entity_type]
+            vector = literal_column(f'{model.__tablename__}.search_vector')
+            selects.append(
+                select(
+                    literal(entity_type, String).label('type'),
+                    model.id.label('id'),
+                    # float8 so the rank survives the round trip through a cursor exactly
+                    cast(func.ts_rank_cd(vector, tsquery), Double).label('rank')
+                )
+                .select_from(model)
+                .where(model.tenant_id == tenant_id, vector.op('@@')(tsquery))
+            )
+        return union_all(*selects).subquery('matches')
+
+    def highlights(self, tenant_id, query, rows):
+        tsquery = self._tsquery(query)
+        config = literal_column(f"'{self.TS_CONFIG}'")
+        marked = {}
+        for entity_type in {row.type for row in rows}:
+            model = SEARCH_ENTITIES[entity_type]
+            ids = [row.id for row in rows if row.type == entity_type]
+            result = db.session.execute(
+                select(
+                    model.id,
+                    func.ts_headline(config, model.title, tsquery, self.TITLE_OPTIONS),
+                    func.ts_headline(config, func.coalesce(model.description, ''), tsquery, self.SNIPPET_OPTIONS)
+                ).where(model.tenant_id == tenant_id, model.id.in_(ids))
+            )
+            for entity_id, title, snippet in result:
+                marked[(entity_type, entity_id)] = (title, snippet)
+        return marked
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    Search on an FTS5 index, for running the search engine without Postgres.
+
+    The `search_index` virtual table and the triggers that keep it in step
+    with the searchable tables are created (and backfilled) on first use.
+    """
+
+    fts = table(
+        'search_index',
+        column('entity_type', String),
+        column('entity_id', String),
+        column('tenant_id', String)
+    )
+
+    def _ensure_index(self):
+        connection = db.session.connection()
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'")
+        ).first()
+        if exists:
+            return
+        connection.execute(text(
+            'CREATE VIRTUAL TABLE search_index USING fts5('
+            'title, description, entity_type UNINDEXED, entity_id UNINDEXED, tenant_id UNINDEXED)'
+        ))
+        for entity_type, model in SEARCH_ENTITIES.items():
+            name = model.__tablename__
+            connection.execute(text(
+                f"INSERT INTO search_index (title, description, entity_type, entity_id, tenant_id) "
+                f"SELECT title, description, '{entity_type}', id, tenant_id FROM {name}"
+            ))
+            connection.execute(text(
+                f"CREATE TRIGGER search_index_{name}_insert AFTER INSERT ON {name} BEGIN "
+                f"INSERT INTO search_index (title, description, entity_type, entity_id, tenant_id) "
+                f"VALUES (NEW.title, NEW.description, '{entity_type}', NEW.id, NEW.tenant_id); END"
+            ))
+            connection.execute(text(
+                f"CREATE TRIGGER search_index_{name}_update AFTER UPDATE OF title, description ON {name} BEGIN "
+                f"UPDATE search_index SET title = NEW.title, description = NEW.description "
+                f"WHERE entity_type = '{entity_type}' AND entity_id = NEW.id; END"
+            ))
+            connection.execute(text(
+                f"CREATE TRIGGER search_index_{name}_delete AFTER DELETE ON {name} BEGIN "
+                f"DELETE FROM search_index WHERE entity_type = '{entity_type}' AND entity_id = OLD.id; END"
+            ))
+        db.session.commit()
+
+    @staticmethod
+    def _match_expression(query):
+        # Quote every term so user input is never parsed as FTS5 syntax;
+        # terms are ANDed like websearch_to_tsquery does
+        terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+        return ' '.join(terms)
+
+    def matches(self, tenant_id, query, types):
+        self._ensure_index()
+        fts_table = literal_column('search_index')
+        # bm25 is lower-is-better; negate it so both backends rank descending.
+        # Title matches weigh twice as much as description matches.
+        rank = type_coerce(-func.bm25(fts_table, 2.0, 1.0), Double)
+        return (
+            select(
+                self.fts.c.entity_type.label('type'),
+                self.fts.c.entity_id.label('id'),
+                rank.label('rank')
+            )
+            .where(
+                fts_table.op('MATCH')(self._match_expression(query)),
+                self.fts.c.tenant_id == tenant_id.hex,
+                self.fts.c.entity_type.in_(types)
+            )
+            .cte('matches').prefix_with('MATERIALIZED')
+        )
+
+    def highlights(self, tenant_id, query, rows):
+        fts_table = literal_column('search_index')
+        result = db.session.execute(
+            select(
+                self.fts.c.entity_type,
+                self.fts.c.entity_id,
+                func.highlight(fts_table, 0, HIGHLIGHT_START, HIGHLIGHT_STOP),
+                func.snippet(fts_table, 1, HIGHLIGHT_START, HIGHLIGHT_STOP, '…', 16)
+            ).where(
+                fts_table.op('MATCH')(self._match_expression(query)),
+                self.fts.c.tenant_id == tenant_id.hex,
+                self.fts.c.entity_id.in_([row.id for row in rows])
+            )
+        )
+        return {(entity_type, entity_id): (title, snippet)
+                for entity_type, entity_id, title, snippet in result}
+
+    @staticmethod
+    def entity_id(value):
+        # The SQLAlchemy Uuid type stores ids as 32-character hex strings on SQLite
+        return uuid.UUID(value)
+
+
+_BACKENDS = {
+    'postgresql': PostgresSearchBackend(),
+    'sqlite': SQLiteSearchBackend(),
+}
+
+
+class SearchService:
+    @staticmethod
+    def get_backend():
+        """Return the search backend for the configured database's dialect"""
+        dialect = db.engine.dialect.name
+        backend = _BACKENDS.get(dialect)
+        if backend is None:
+            raise RuntimeError(f'Full-text search is not supported on {dialect}')
+        return backend
+
+    @staticmethod
+    def search(tenant_id, query, types, cursor, limit):
+        """
+        Ranked, highlighted search across a tenant's ideas, feedback and initiatives
+
+        See SearchBackend.search for the parameters and return value
+        """
+        return SearchService.get_backend().search(tenant_id, query, types, cursor, limit)
@@ -0,0 +1,275 @@
+# app/services/seed_service.py
+from app.extensions import db
+from app.services.counter_service import CounterService
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+import random
+
+# Tables in load order (parents before children), with the columns written
+SEED_TABLES = {
+    'tenants': ('id', 'domain_name', 'plan_tier', 'created_at', 'updated_at'),
+    'users': ('id', 'tenant_id', 'email', 'password_hash', 'role', 'created_at', 'updated_at'),
+    'goals': ('id', 'tenant_id', 'title', 'description', 'target_date', 'status', 'created_at', 'updated_at'),
+    'initiatives': ('id', 'tenant_id', 'goal_id', 'title', 'description', 'status', 'priority', 'created_at', 'updated_at'),
+    'customers': ('id', 'tenant_id', 'name', 'revenue', 'status', 'created_at', 'updated_at'),
+    'ideas': ('id', 'tenant_id', 'initiative_id', 'title', 'description', 'priority', 'effort', 'source', 'status', 'created_at', 'updated_at'),
+    'feedback': ('id', 'tenant_id', 'title', 'description', 'sentiment', 'created_at', 'updated_at'),
+    'ideas_customers': ('idea_id', 'customer_id'),
+    'feedback_customers': ('feedback_id', 'customer_id'),
+    'feedback_initiatives': ('feedback_id', 'initiative_id'),
+    'comments': ('id', 'user_id', 'content', 'entity_type', 'entity_id', 'created_at', 'updated_at'),
+}
+
+# Rows per idea of a tenant, used to turn a row target into tenant sizes:
+# the other tables are sized relative to the idea count (see _tenant_rows)
+ROWS_PER_IDEA = 8.9
+
+# Zipf exponents: tenant sizes, and how popular customers, initiatives and
+# commenters are within a tenant
+TENANT_SKEW = 1.1
+ITEM_SKEW = 1.2
+
+WORDS = (
+    'api export dashboard mobile search billing onboarding report sync alert '
+    'integration latency import audit permission invoice workflow calendar '
+    'notification roadmap sso webhook filter chart analytics offline theme'
+).split()
+
+IDEA_PRIORITIES = ['urgent', 'high', 'medium', 'low']
+IDEA_EFFORTS = ['xs', 's', 'm', 'l', 'xl']
+IDEA_SOURCES = ['customer', 'sales', 'support', 'internal', 'survey']
+IDEA_STATUSES = ['new', 'planned', 'completed', 'rejected']
+INITIATIVE_STATUSES = ['active', 'planned', 'completed']
+CUSTOMER_STATUSES = ['active', 'inactive', 'prospect']
+SENTIMENTS = ['positive', 'neutral', 'negative']
+GOAL_STATUSES = ['In Progress', 'Completed']
+
+
+def zipf_weights(count, skew):
+    """Cumulative Zipf weights for picking among count items, most popular first"""
+    return list(accumulate(1 / (rank ** skew) for rank in range(1, count + 1)))
+
+
+class _Generator:
+    """Row generator for one run; every value comes from a single seeded Random"""
+
+    def __init__(self, seed, password_hash, domain_prefix):
+        # Seeded with the prefix too, so runs under different prefixes get different ids
+        self.rng = random.Random(f'{domain_prefix}:{seed}')
+        self.password_hash = password_hash
+        self.start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        # Timestamps fall in the two years from start; days are formatted once
+        self.days = [(self.start + timedelta(days=day)).strftime('%Y-%m-%d') for day in range(730)]
+        self.phrases = {}
+
+    def uuid(self):
+        # 32 hex digits; accepted as uuid input by PostgreSQL
+        return '%032x' % self.rng.getrandbits(128)
+
+    def timestamp(self):
+        day, seconds = divmod(self.rng.randrange(730 * 86400), 86400)
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+        return f'{self.days[day]} {hours:02d}:{minutes:02d}:{seconds:02d}+00'
+
+    def text(self, low, high):
+        # Drawn from a bank of 1024 phrases per length range; building a
+        # fresh phrase per row would dominate generation time
+        bank = self.phrases.get((low, high))
+        if bank is None:
+            bank = self.phrases[(low, high)] = [
+                ' '.join(self.rng.choices(WORDS, k=self.rng.randint(low, high))) for _ in range(1024)
+            ]
+        return bank[self.rng.getrandbits(10)]
+
+    def pick(self, items, cum_weights, k=1):
+        return self.rng.choices(items, cum_weights=cum_weights, k=k)
+
+    def distinct(self, items, cum_weights, k):
+        """Up to k distinct items, chosen with Zipf skew (junction tables need unique pairs)"""
+        return set(self.pick(items, cum_weights, k))
+
+    def thread_length(self):
+        # Heavy-tailed: most entities have no comments, a few have long threads
+        return min(int(self.rng.paretovariate(1.5)) - 1, 200)
+
+
+def _row(*values):
+    return '\t'.join('\\N' if value is None else str(value) for value in values) + '\n'
+
+
+def _tenant_rows(gen, index, ideas, domain_prefix):
+    """
+    Yield (table, rows) for one tenant, tables in SEED_TABLES order
+
+    rows is a list of COPY text lines. Generated text never contains tabs,
+    newlines or backslashes, so no escaping is needed.
+    """
+    rng = gen.rng
+    tenant_id = gen.uuid()
+    domain = f'{domain_prefix}-{index}.example.com'
+    created = gen.timestamp()
+    plan_tier = 'enterprise' if ideas > 10000 else rng.choice(['basic', 'pro'])
+    yield 'tenants', [_row(tenant_id, domain, plan_tier, created, created)]
+
+    user_ids = [gen.uuid() for _ in range(max(1, ideas // 100))]
+    yield 'users', [
+        _row(user_id, tenant_id, f'user{number}@{domain}', gen.password_hash,
+             'admin' if number == 0 else 'user', created, created)
+        for number, user_id in enumerate(user_ids)
+    ]
+
+    goal_ids = [gen.uuid() for _ in range(max(1, ideas // 50))]
+    rows = []
+    for number, goal_id in enumerate(goal_ids):
+        at = gen.timestamp()
+        target = gen.days[rng.randrange(len(gen.days))]
+        rows.append(_row(goal_id, tenant_id, f'Goal {number} {gen.text(1, 3)}', gen.text(5, 30),
+                         target, rng.choice(GOAL_STATUSES), at, at))
+    yield 'goals', rows
+
+    initiative_ids = [gen.uuid() for _ in range(max(1, ideas // 10))]
+    goal_weights = zipf_weights(len(goal_ids), ITEM_SKEW)
+    rows = []
+    for number, initiative_id in enumerate(initiative_ids):
+        at = gen.timestamp()
+        goal_id = gen.pick(goal_ids, goal_weights)[0] if rng.random() < 0.8 else None
+        rows.append(_row(initiative_id, tenant_id, goal_id, f'Initiative {number} {gen.text(1, 3)}',
+                         gen.text(5, 40), rng.choice(INITIATIVE_STATUSES), rng.randint(1, 5), at, at))
+    yield 'initiatives', rows
+
+    customer_ids = [gen.uuid() for _ in range(max(1, ideas // 5))]
+    rows = []
+    for number, customer_id in enumerate(customer_ids):
+        at = gen.timestamp()
+        # Revenue is skewed too: a few large accounts, many small ones
+        revenue = None if rng.random() < 0.1 else '%.2f' % min(rng.paretovariate(1.2) * 1000, 10 ** 9)
+        rows.append(_row(customer_id, tenant_id, f'Customer {number}', revenue,
+                         rng.choice(CUSTOMER_STATUSES), at, at))
+    yield 'customers', rows
+
+    initiative_weights = zipf_weights(len(initiative_ids), ITEM_SKEW)
+    customer_weights = zipf_weights(len(customer_ids), ITEM_SKEW)
+
+    idea_ids = [gen.uuid() for _ in range(ideas)]
+    rows = []
+    for number, idea_id in enumerate(idea_ids):
+        at = gen.timestamp()
+        initiative_id = gen.pick(initiative_ids, initiative_weights)[0] if rng.random() < 0.6 else None
+        rows.append(_row(idea_id, tenant_id, initiative_id, f'Idea {number} {gen.text(2, 5)}', gen.text(10, 60),
+                         rng.choice(IDEA_PRIORITIES), rng.choice(IDEA_EFFORTS), rng.choice(IDEA_SOURCES),
+                         rng.choice(IDEA_STATUSES), at, at))
+    yield 'ideas', rows
+
+    feedback_ids = [gen.uuid() for _ in range(ideas * 6 // 5)]
+    rows = []
+    for number, feedback_id in enumerate(feedback_ids):
+        at = gen.timestamp()
+        rows.append(_row(feedback_id, tenant_id, f'Feedback {number} {gen.text(2, 5)}', gen.text(10, 80),
+                         rng.choice(SENTIMENTS), at, at))
+    yield 'feedback', rows
+
+    # Customers per idea and per feedback are Zipf-distributed over the
+    # tenant's customers: a few customers are attached to most items
+    yield 'ideas_customers', [
+        _row(idea_id, customer_id)
+        for idea_id in idea_ids
+        for customer_id in gen.distinct(customer_ids, customer_weights, rng.randint(0, 3))
+    ]
+    yield 'feedback_customers', [
+        _row(feedback_id, customer_id)
+        for feedback_id in feedback_ids
+        for customer_id in gen.distinct(customer_ids, customer_weights, rng.randint(0, 2))
+    ]
+    yield 'feedback_initiatives', [
+        _row(feedback_id, gen.pick(initiative_ids, initiative_weights)[0])
+        for feedback_id in feedback_ids
+        if rng.random() < 0.3
+    ]
+
+    user_weights = zipf_weights(len(user_ids), ITEM_SKEW)
+    rows = []
+    for entity_type, entity_ids in (('idea', idea_ids), ('feedback', feedback_ids), ('initiative', initiative_ids)):
+        for entity_id in entity_ids:
+            for user_id in gen.pick(user_ids, user_weights, gen.thread_length()):
+                at = gen.timestamp()
+                rows.append(_row(gen.uuid(), user_id, gen.text(3, 40), entity_type, entity_id, at, at))
+    yield 'comments', rows
+
+
+class SeedService:
+    @staticmethod
+    def tenant_sizes(rows, tenants):
+        """
+        Split a row target over tenants with Zipf skew
+
+        A few tenants get most of the rows and most get very few.
+
+        Returns the idea count of each tenant, largest first
+        """
+        weights = [1 / (rank ** TENANT_SKEW) for rank in range(1, tenants + 1)]
+        total = sum(weights)
+        return [max(1, int(rows / ROWS_PER_IDEA * weight / total)) for weight in weights]
+
+    @staticmethod
+    def generate(seed, rows, tenants, password_hash, domain_prefix='seed'):
+        """
+        Generate a synthetic dataset deterministically from a seed
+
+        Parameters:
+        - seed: Random seed; the same seed and sizes give the same rows
+        - rows: Approximate total number of rows across all tables
+        - tenants: Number of tenants (sized with Zipf skew)
+        - password_hash: Hash stored for every user
+        - domain_prefix: Tenants get domains <prefix>-<n>.example.com
+
+        Yields (table, rows) with rows as COPY text lines, each tenant's
+        tables in SEED_TABLES order
+        """
+        gen = _Generator(seed, password_hash, domain_prefix)
+        for index, ideas in enumerate(SeedService.tenant_sizes(rows, tenants)):
+            yield from _tenant_rows(gen, index, ideas, domain_prefix)
+
+    @staticmethod
+    def load(seed, rows, tenants, password_hash, domain_prefix='seed', progress=None):
+        """
+        Generate a dataset and load it into PostgreSQL with COPY
+
+        Runs in one transaction. User triggers on the loaded tables are
+        disabled for the load (the counter and customer_stats triggers
+        would otherwise fire per row) and the counters are recomputed once
+        at the end.
+
+        Parameters:
+        - seed, rows, tenants, password_hash, domain_prefix: See generate()
+        - progress: Optional callable(table, row_count) called after each COPY
+
+        Returns a dict of table -> rows loaded
+        """
+        loaded = dict.fromkeys(SEED_TABLES, 0)
+        connection = db.session.connection()
+
+        # COPY goes through the psycopg connection under the session's
+        # transaction, so the load commits or rolls back as a whole
+        with connection.connection.driver_connection.cursor() as cursor:
+            for table in SEED_TABLES:
+                cursor.execute(f'ALTER TABLE {table} DISABLE TRIGGER USER')
+
+            for table, lines in SeedService.generate(seed, rows, tenants, password_hash, domain_prefix):
+                if not lines:
+                    continue
+                columns = ', '.join(SEED_TABLES[table])
+                with cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy:
+                    # Written in pieces of ~1 MB rather than one call per row
+                    for start in range(0, len(lines), 8192):
+                        copy.write(''.join(lines[start:start + 8192]))
+                loaded[table] += len(lines)
+                if progress:
+                    progress(table, len(lines))
+
+            for table in SEED_TABLES:
+                cursor.execute(f'ALTER TABLE {table} ENABLE TRIGGER USER')
+
+        CounterService.recompute_counters()
+        db.session.commit()
+        return loaded
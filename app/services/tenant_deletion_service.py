@@ -0,0 +1,306 @@
+# app/services/tenant_deletion_service.py
+from app.models import Tenant, User, Goal, Initiative, Customer, Idea, Feedback, Comment, TenantDeletion
+from app.extensions import db
+from app.services.auth_service import AuthService
+from app.tenancy import set_current_tenant
+from flask import current_app
+from sqlalchemy import select, delete, update, func, or_, and_
+from sqlalchemy.exc import IntegrityError
+from datetime import timedelta
+import atexit
+import os
+import queue
+import threading
+import time
+
+# A running job whose heartbeat (updated_at, moved every batch) is older than
+# this is taken to have died with its process and may be resumed. updated_at
+# is set by the database's trigger, so it is compared on the database clock:
+# a naive Python timestamp would be read in the session's time zone
+STALE_AFTER = timedelta(minutes=5)
+
+
+def _tenant_rows(model):
+    def batch(deletion, size):
+        return model.id.in_(select(model.id).where(model.tenant_id == deletion.tenant_id).limit(size))
+    return batch
+
+def _tenant_comments(deletion, size):
+    # Comments have no tenant_id; they belong to their authors' tenant
+    return Comment.id.in_(
+        select(Comment.id)
+        .where(Comment.user_id.in_(select(User.id).where(User.tenant_id == deletion.tenant_id)))
+        .limit(size)
+    )
+
+def _tenant_users(deletion, size):
+    # All but the admin who asked, who is deleted last, with the tenant row,
+    # so they can follow (and resume) the job until it completes
+    return User.id.in_(
+        select(User.id)
+        .where(User.tenant_id == deletion.tenant_id, User.id.is_distinct_from(deletion.requested_by))
+        .limit(size)
+    )
+
+# Deleted in this order, each table before the ones it references, so a batch
+# never cascades into (or nulls out) rows a later step is about to delete:
+# ideas before initiatives (ideas.initiative_id is SET NULL), initiatives
+# before goals, comments before their authors. Junction rows and customer_stats
+# go with their parents through ON DELETE CASCADE, a bounded amount per batch.
+DELETION_STEPS = [
+    ('comments', Comment, _tenant_comments),
+    ('feedback', Feedback, _tenant_rows(Feedback)),
+    ('ideas', Idea, _tenant_rows(Idea)),
+    ('initiatives', Initiative, _tenant_rows(Initiative)),
+    ('goals', Goal, _tenant_rows(Goal)),
+    ('customers', Customer, _tenant_rows(Customer)),
+    ('users', User, _tenant_users),
+]
+
+# One daemon thread per process runs the jobs one at a time, so it never
+# holds up a worker's shutdown; created again after a fork, which inherits
+# the variables but not the thread
+_worker = None
+_worker_pid = None
+_worker_lock = threading.Lock()
+_jobs = None
+_stopping = None
+
+
+def _work(app, jobs, stopping):
+    # Resume unfinished jobs (this or another process's) on start and then
+    # every TENANT_DELETION_RESUME_SECONDS; run requested ones in between
+    interval = app.config['TENANT_DELETION_RESUME_SECONDS'] or None
+    deletion_id = None
+    while not stopping.is_set():
+        with app.app_context():
+            try:
+                if deletion_id is None:
+                    deletion_ids = [deletion.id for deletion in TenantDeletionService.resumable()]
+                else:
+                    deletion_ids = [deletion_id]
+                for job_id in deletion_ids:
+                    if stopping.is_set():
+                        break
+                    TenantDeletionService.run(job_id, stop=stopping)
+            except Exception:
+                current_app.logger.exception('Tenant deletion worker failed')
+        try:
+            deletion_id = jobs.get(timeout=interval)
+        except queue.Empty:
+            deletion_id = None
+
+
+def _get_jobs(app):
+    global _worker, _worker_pid, _jobs, _stopping
+    if _worker is None or _worker_pid != os.getpid():
+        with _worker_lock:
+            if _worker is None or _worker_pid != os.getpid():
+                _jobs, _stopping = queue.Queue(), threading.Event()
+                _worker = threading.Thread(
+                    target=_work, args=(app, _jobs, _stopping), name='tenant-deletion', daemon=True
+                )
+                _worker.start()
+                _worker_pid = os.getpid()
+                atexit.register(_stop_worker)
+    return _jobs
+
+
+def _stop_worker(timeout=10):
+    # At exit, let the current batch finish so the job is left 'pending' for
+    # the next process rather than 'running' until its heartbeat goes stale
+    if _worker is None or _worker_pid != os.getpid():
+        return
+    _stopping.set()
+    _jobs.put(None)
+    _worker.join(timeout)
+
+
+class TenantDeletionService:
+    @staticmethod
+    def get(tenant_id):
+        """Returns the offboarding job of a tenant, or None"""
+        return TenantDeletion.query.filter_by(tenant_id=tenant_id).first()
+    
+    @staticmethod
+    def request_deletion(tenant_id, requested_by=None):
+        """
+        Create the offboarding job of a tenant, or return its existing one
+        
+        Parameters:
+        - tenant_id: UUID of the tenant to delete
+        - requested_by: UUID of the user asking for it
+        
+        Returns the TenantDeletion, or None if there is neither a tenant nor a job
+        """
+        deletion = TenantDeletionService.get(tenant_id)
+        if deletion is not None:
+            return deletion
+        
+        tenant = db.session.get(Tenant, tenant_id)
+        if tenant is None:
+            return None
+        
+        deletion = TenantDeletion(tenant_id=tenant_id, domain_name=tenant.domain_name, requested_by=requested_by)
+        db.session.add(deletion)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Requested concurrently; tenant_id is unique, so use the other request's job
+            db.session.rollback()
+            deletion = TenantDeletionService.get(tenant_id)
+        return deletion
+    
+    @staticmethod
+    def start_worker(app):
+        """
+        Start this process's background thread, if it is not running yet
+        
+        On start, and every TENANT_DELETION_RESUME_SECONDS after, it resumes
+        jobs that failed, were stopped, or whose process died; call it when a
+        server worker starts so none is left unfinished.
+        """
+        _get_jobs(app)
+    
+    @staticmethod
+    def start_background(deletion_id):
+        """Run a job on this process's background thread, without waiting for it"""
+        _get_jobs(current_app._get_current_object()).put(deletion_id)
+    
+    @staticmethod
+    def claim(deletion_id):
+        """
+        Mark a job as running, unless it is complete or running elsewhere
+        
+        Pending and failed jobs can be claimed, and so can running ones whose
+        heartbeat is older than STALE_AFTER. The check and the update are one
+        statement, so two processes never run the same job.
+        
+        Returns True if the job was claimed
+        """
+        claimed = db.session.execute(
+            update(TenantDeletion)
+            .where(
+                TenantDeletion.id == deletion_id,
+                or_(
+                    TenantDeletion.status.in_(['pending', 'failed']),
+                    and_(
+                        TenantDeletion.status == 'running',
+                        TenantDeletion.updated_at < func.now() - STALE_AFTER
+                    )
+                )
+            )
+            .values(status='running', error=None)
+            .returning(TenantDeletion.id)
+            .execution_options(synchronize_session=False)
+        ).first()
+        db.session.commit()
+        return claimed is not None
+    
+    @staticmethod
+    def run(deletion_id, progress=None, stop=None):
+        """
+        Delete a tenant's rows in bounded batches, then the tenant itself
+        
+        Every batch deletes up to TENANT_DELETION_BATCH_SIZE rows of one
+        table and records its progress in the job, in one short transaction;
+        locks are held for one batch only, and a job that stops partway
+        (failure, restart) resumes where it left off since each step just
+        deletes whatever rows remain.
+        
+        Parameters:
+        - deletion_id: UUID of the TenantDeletion
+        - progress: Optional callable(table, rows) called after each batch
+        - stop: Optional threading.Event; once set, the job is put back to
+          'pending' before its next batch
+        
+        Returns the final status, or None if the job could not be claimed
+        """
+        if not TenantDeletionService.claim(deletion_id):
+            return None
+        
+        deletion = db.session.execute(
+            select(TenantDeletion.tenant_id, TenantDeletion.requested_by).where(TenantDeletion.id == deletion_id)
+        ).one()
+        tenant_id = deletion.tenant_id
+        # Under row-level security a transaction only sees the tenant it is scoped to
+        set_current_tenant(tenant_id)
+        batch_size = current_app.config['TENANT_DELETION_BATCH_SIZE']
+        pause = current_app.config['TENANT_DELETION_PAUSE_MS'] / 1000
+        
+        def record(values):
+            db.session.execute(
+                update(TenantDeletion)
+                .where(TenantDeletion.id == deletion_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        
+        try:
+            for table, model, batch in DELETION_STEPS:
+                while True:
+                    if stop is not None and stop.is_set():
+                        record({'status': 'pending'})
+                        db.session.commit()
+                        return 'pending'
+                    
+                    deleted = db.session.execute(
+                        delete(model.__table__)
+                        .where(batch(deletion, batch_size))
+                        .returning(model.__table__.c.id)
+                    ).scalars().all()
+                    record({'current_table': table, 'rows_deleted': TenantDeletion.rows_deleted + len(deleted)})
+                    db.session.commit()
+                    
+                    if model is User:
+                        for user_id in deleted:
+                            AuthService.invalidate_principal(user_id)
+                    if progress:
+                        progress(table, len(deleted))
+                    if len(deleted) < batch_size:
+                        break
+                    if pause:
+                        time.sleep(pause)
+            
+            # The requesting admin goes last; anything created since its step
+            # ran goes with the tenant row through ON DELETE CASCADE
+            requester = db.session.execute(
+                delete(User.__table__)
+                .where(User.__table__.c.id == deletion.requested_by, User.__table__.c.tenant_id == tenant_id)
+                .returning(User.__table__.c.id)
+            ).scalars().all()
+            db.session.execute(delete(Tenant.__table__).where(Tenant.__table__.c.id == tenant_id))
+            record({
+                'status': 'completed',
+                'current_table': None,
+                'rows_deleted': TenantDeletion.rows_deleted + len(requester),
+                'completed_at': func.now()
+            })
+            db.session.commit()
+            for user_id in requester:
+                AuthService.invalidate_principal(user_id)
+            return 'completed'
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.exception('Tenant deletion %s failed', deletion_id)
+            try:
+                record({'status': 'failed', 'error': str(e)[:1000]})
+                db.session.commit()
+            except Exception:
+                # Still 'running'; resumed once its heartbeat is stale
+                db.session.rollback()
+                current_app.logger.exception('Could not record the failure of tenant deletion %s', deletion_id)
+            return 'failed'
+    
+    @staticmethod
+    def resumable():
+        """Jobs that are not complete: pending, failed, or running with a stale heartbeat"""
+        return TenantDeletion.query.filter(
+            or_(
+                TenantDeletion.status.in_(['pending', 'failed']),
+                and_(
+                    TenantDeletion.status == 'running',
+                    TenantDeletion.updated_at < func.now() - STALE_AFTER
+                )
+            )
+        ).order_by(TenantDeletion.created_at).all()
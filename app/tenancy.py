@@ -0,0 +1,239 @@
+# app/tenancy.py
+from contextlib import contextmanager
+from contextvars import ContextVar
+from flask import abort
+from flask_sqlalchemy.query import Query
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, select, update, delete, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import make_url
+
+# Tenant of the authenticated user for the request being handled in this
+# thread; set by AuthService.get_current_user, or wherever the tenant is
+# otherwise known (sign-in, registration, tenant deletion)
+_current_tenant = ContextVar('current_tenant', default=None)
+
+# Set while unscoped() is active: work that spans tenants (sign-in by email,
+# registration checks, maintenance commands) runs as the BYPASSRLS role
+_unscoped = ContextVar('unscoped', default=False)
+
+SET_TENANT = text("SELECT set_config('app.tenant_id', :tenant_id, true)")
+
+
+class TenantQuery(Query):
+    """
+    Query class of every model (db.Model.query), adding lookups that carry the
+    tenant in the same WHERE clause as the primary key.
+
+    A row of another tenant is then indistinguishable from a missing one: it
+    is never loaded, and the route answers 404 without a separate check.
+    """
+
+    def _entity(self):
+        return self.column_descriptions[0]['entity']
+
+    def get_for_tenant(self, ident, tenant_id):
+        """
+        Load a row by id, only if it belongs to the tenant
+
+        Parameters:
+        - ident: Primary key (UUID)
+        - tenant_id: UUID of the current user's tenant
+
+        Returns the instance or None
+        """
+        entity = self._entity()
+        return self.filter(entity.id == ident, entity.tenant_id == tenant_id).one_or_none()
+
+    def get_for_tenant_or_404(self, ident, tenant_id, description=None):
+        """Like get_for_tenant, aborting with 404 if there is no such row in the tenant"""
+        instance = self.get_for_tenant(ident, tenant_id)
+        if instance is None:
+            abort(404, description=description)
+        return instance
+
+    def exists_for_tenant(self, ident, tenant_id):
+        """
+        Check that a row exists in the tenant, reading only its id
+
+        For validating references (e.g. an initiative's goal_id) without
+        loading the referenced row.
+        """
+        entity = self._entity()
+        return self.session.scalar(
+            select(entity.id).where(entity.id == ident, entity.tenant_id == tenant_id)
+        ) is not None
+
+    def _scoped(self, statement, ident, tenant_id):
+        entity = self._entity()
+        return statement.where(entity.id == ident, entity.tenant_id == tenant_id)
+
+    def update_for_tenant(self, ident, tenant_id, values, columns):
+        """
+        Apply a partial update to one row of the tenant in a single statement
+
+        Runs UPDATE ... WHERE id AND tenant_id RETURNING <columns>, so the
+        response can be built from the returned row without loading the
+        instance first or refreshing it after the commit. Column defaults
+        such as updated_at's onupdate still apply. With no values to set, the
+        row is only selected.
+
+        Parameters:
+        - ident: Primary key (UUID)
+        - tenant_id: UUID of the current user's tenant
+        - values: Dict of column values to set
+        - columns: Columns to return (e.g. SERIALIZER.columns(Model))
+
+        Returns the Row, or None if there is no such row in the tenant
+        """
+        if not values:
+            return self.session.execute(self._scoped(select(*columns), ident, tenant_id)).first()
+        statement = (
+            self._scoped(update(self._entity()), ident, tenant_id)
+            .values(**values)
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(statement).first()
+
+    def delete_for_tenant(self, ident, tenant_id):
+        """
+        Delete one row of the tenant in a single DELETE ... RETURNING id
+
+        Dependent rows are left to the database's ON DELETE rules and
+        triggers rather than loaded into the session.
+
+        Returns True if a row was deleted
+        """
+        entity = self._entity()
+        statement = (
+            self._scoped(delete(entity), ident, tenant_id)
+            .returning(entity.id)
+            .execution_options(synchronize_session=False)
+        )
+        return self.session.execute(statement).first() is not None
+
+
+def current_tenant():
+    """Tenant of the authenticated user of the current request, or None"""
+    return _current_tenant.get()
+
+
+def set_current_tenant(tenant_id):
+    """
+    Record the current request's tenant for row-level security
+
+    With TENANT_RLS enabled every transaction of the request starts with
+    app.tenant_id set to this tenant (SET LOCAL semantics, so it ends with
+    the transaction and never leaks to the next user of the connection).
+    """
+    if _current_tenant.get() == tenant_id:
+        return
+    _current_tenant.set(tenant_id)
+
+    if Tenancy.rls_enabled:
+        from app.extensions import db
+
+        # A transaction opened before the user was known (e.g. to load them)
+        # has already passed after_begin
+        if db.session().in_transaction():
+            db.session.execute(SET_TENANT, {'tenant_id': str(tenant_id)})
+
+
+@contextmanager
+def unscoped():
+    """
+    Run the enclosed queries across all tenants
+
+    With TENANT_RLS enabled the policies fail closed, so a transaction with
+    no tenant sees no rows. Inside this block every transaction instead
+    switches to TENANT_RLS_BYPASS_ROLE (SET LOCAL ROLE, ending with the
+    transaction), which row-level security does not apply to. Keep it to
+    lookups that genuinely precede knowing the tenant.
+    """
+    token = _unscoped.set(True)
+    try:
+        if Tenancy.rls_enabled:
+            from app.extensions import db
+
+            if db.session().in_transaction():
+                db.session.execute(_set_bypass_role())
+        yield
+    finally:
+        _unscoped.reset(token)
+
+    if Tenancy.rls_enabled:
+        from app.extensions import db
+
+        if db.session().in_transaction():
+            db.session.execute(text('RESET ROLE'))
+
+
+def _set_bypass_role():
+    return text(f'SET LOCAL ROLE {Tenancy.bypass_role}')
+
+
+def scope_connection(connection, tenant_id=None):
+    """
+    Scope a connection's current transaction for row-level security
+
+    The ORM session does this itself when a transaction begins; connections
+    taken straight from an engine (async reads, export chunks) call it
+    before their first query.
+
+    Parameters:
+    - connection: Connection in a transaction
+    - tenant_id: Tenant to scope to (default: the current request's tenant)
+    """
+    if not Tenancy.rls_enabled:
+        return
+    if _unscoped.get():
+        connection.execute(_set_bypass_role())
+        return
+    tenant_id = tenant_id or _current_tenant.get()
+    if tenant_id is not None:
+        connection.execute(SET_TENANT, {'tenant_id': str(tenant_id)})
+
+
+def _after_begin(session, transaction, connection):
+    scope_connection(connection)
+
+
+class Tenancy:
+    """
+    Optional tenant isolation in the database itself.
+
+    With TENANT_RLS enabled (PostgreSQL only), each transaction of an
+    authenticated request sets the app.tenant_id setting, which the
+    row-level security policies in db-init/rls/row-level-security.sql
+    compare every row's tenant_id against. The application-side scoping
+    (TenantQuery, tenant_id filters) stays in place; RLS backs it up for any
+    query that forgets it.
+
+    The policies fail closed: a transaction that set no tenant sees and
+    writes nothing. Code that runs before the tenant is known, or across
+    tenants, either sets it explicitly (set_current_tenant) or runs under
+    unscoped().
+    """
+
+    rls_enabled = False
+    bypass_role = None
+    _listening = False
+
+    def init_app(self, app):
+        enabled = app.config['TENANT_RLS']
+        if enabled and make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name() != 'postgresql':
+            raise ValueError('TENANT_RLS needs PostgreSQL')
+        Tenancy.rls_enabled = enabled
+        if enabled:
+            # Interpolated into SET ROLE, which takes no bind parameters
+            Tenancy.bypass_role = postgresql.dialect().identifier_preparer.quote(app.config['TENANT_RLS_BYPASS_ROLE'])
+
+        app.teardown_request(self._teardown)
+        if enabled and not Tenancy._listening:
+            event.listen(Session, 'after_begin', _after_begin)
+            Tenancy._listening = True
+
+    @staticmethod
+    def _teardown(exception):
+        _current_tenant.set(None)
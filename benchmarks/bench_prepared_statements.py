@@ -0,0 +1,61 @@
+# benchmarks/bench_prepared_statements.py
+"""
+Compare psycopg ClientCursor (client-side binding) against server-side binding
+with prepared statements on the list endpoints.
+
+Runs against the database in DATABASE_URL, which must already contain the
+tenant given by --domain.
+
+    python -m benchmarks.bench_prepared_statements --domain example.com
+"""
+import argparse
+import json
+from benchmarks.common import make_app, make_client, auth_headers, summarize, time_calls
+
+ENDPOINTS = [
+    '/api/goals?limit=50',
+    '/api/initiatives?limit=50',
+    '/api/initiatives?limit=50&status=active',
+    '/api/users?limit=50',
+]
+
+MODES = {
+    'client_cursor': {'DB_PREPARED_STATEMENTS': False},
+    'prepared': {'DB_PREPARED_STATEMENTS': True},
+}
+
+
+def run(domain, iterations, warmup, prepare_threshold):
+    results = {}
+    for mode, overrides in MODES.items():
+        app = make_app(DB_PREPARE_THRESHOLD=prepare_threshold, **overrides)
+        client = make_client(app)
+        headers = auth_headers(app, domain)
+        results[mode] = {}
+        for endpoint in ENDPOINTS:
+            def call():
+                response = client.get(endpoint, headers=headers)
+                assert response.status_code == 200, response.status_code
+            results[mode][endpoint] = summarize(time_calls(call, iterations, warmup))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--domain', required=True, help='Domain name of a seeded tenant')
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--warmup', type=int, default=50)
+    parser.add_argument('--prepare-threshold', type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.domain, args.iterations, args.warmup, args.prepare_threshold)
+    print(json.dumps(results, indent=2))
+
+    for endpoint in ENDPOINTS:
+        before = results['client_cursor'][endpoint]['p50_ms']
+        after = results['prepared'][endpoint]['p50_ms']
+        print(f'{endpoint:45} client_cursor p50 {before:8.3f} ms  prepared p50 {after:8.3f} ms  ({before / after:5.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
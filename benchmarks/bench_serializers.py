@@ -0,0 +1,89 @@
+# benchmarks/bench_serializers.py
+"""
+Serialize 10k initiatives the old way (hand-built dicts with str()/isoformat()
+passed to Flask's JSON encoder) and with INITIATIVE_SERIALIZER + orjson, and
+report the CPU time per list response. Needs no database.
+
+    python -m benchmarks.bench_serializers --rows 10000
+"""
+import argparse
+import json
+import random
+import uuid
+from datetime import datetime, timedelta
+from flask import json as flask_json
+from app.models import Initiative
+from app.serializers import INITIATIVE_SERIALIZER, dumps
+from benchmarks.common import make_app, summarize, time_calls
+
+
+def make_initiatives(count):
+    rng = random.Random(42)
+    goal_ids = [uuid.uuid4() for _ in range(20)] + [None]
+    start = datetime(2024, 1, 1)
+    return [
+        Initiative(
+            id=uuid.uuid4(),
+            tenant_id=uuid.uuid4(),
+            goal_id=rng.choice(goal_ids),
+            title=f'Initiative {index}',
+            description='Lorem ipsum dolor sit amet ' * rng.randint(1, 20),
+            status=rng.choice(['active', 'planned', 'completed']),
+            priority=rng.randint(1, 5),
+            idea_count=rng.randint(0, 50),
+            feedback_count=rng.randint(0, 50),
+            comment_count=rng.randint(0, 50),
+            created_at=start + timedelta(minutes=index),
+            updated_at=start + timedelta(minutes=index, seconds=30),
+        )
+        for index in range(count)
+    ]
+
+
+def hand_built(initiatives):
+    return flask_json.dumps({
+        'initiatives': [
+            {
+                'id': str(initiative.id),
+                'title': initiative.title,
+                'description': initiative.description,
+                'status': initiative.status,
+                'priority': initiative.priority,
+                'goal_id': str(initiative.goal_id) if initiative.goal_id else None,
+                'idea_count': initiative.idea_count,
+                'feedback_count': initiative.feedback_count,
+                'comment_count': initiative.comment_count,
+                'created_at': initiative.created_at.isoformat(),
+                'updated_at': initiative.updated_at.isoformat()
+            } for initiative in initiatives
+        ],
+        'next_cursor': None
+    })
+
+
+def precompiled(initiatives):
+    return dumps({'initiatives': INITIATIVE_SERIALIZER.many(initiatives), 'next_cursor': None})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--iterations', type=int, default=30)
+    args = parser.parse_args()
+
+    app = make_app(SQLALCHEMY_DATABASE_URI='sqlite://')
+    with app.app_context():
+        initiatives = make_initiatives(args.rows)
+        results = {
+            'hand_built_jsonify': summarize(time_calls(lambda: hand_built(initiatives), args.iterations, warmup=3)),
+            'serializer_orjson': summarize(time_calls(lambda: precompiled(initiatives), args.iterations, warmup=3)),
+        }
+
+    print(json.dumps(results, indent=2))
+    before = results['hand_built_jsonify']['p50_ms']
+    after = results['serializer_orjson']['p50_ms']
+    print(f'{args.rows} initiatives: {before:.1f} ms -> {after:.1f} ms per response ({before / after:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
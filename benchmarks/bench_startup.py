@@ -0,0 +1,135 @@
+# benchmarks/bench_startup.py
+"""
+Start gunicorn with gunicorn.conf.py in each serving mode and report time to
+ready, the latency of the first and following requests to each endpoint, and
+the memory of every worker (RSS, and PSS, which splits pages shared
+copy-on-write between the processes sharing them). Linux only (reads /proc).
+
+    cold            no preload: every worker imports the app and warms up lazily
+    preload         app imported and warmed up once in the master, then forked
+    preload_freeze  as preload, with the preloaded heap gc.freeze()d
+
+Runs against the database in DATABASE_URL, which must already contain the
+tenant given by --domain.
+
+    python -m benchmarks.bench_startup --domain example.com --workers 4
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from benchmarks.common import make_app, auth_headers, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENDPOINTS = [
+    '/',
+    '/api/goals?limit=50',
+    '/api/dashboard/summary',
+]
+
+MODES = {
+    'cold': {'GUNICORN_PRELOAD': 'false', 'GUNICORN_GC_FREEZE': 'false'},
+    'preload': {'GUNICORN_PRELOAD': 'true', 'GUNICORN_GC_FREEZE': 'false'},
+    'preload_freeze': {'GUNICORN_PRELOAD': 'true', 'GUNICORN_GC_FREEZE': 'true'},
+}
+
+
+def get(url, headers=None):
+    start = time.perf_counter()
+    with urllib.request.urlopen(urllib.request.Request(url, headers=headers or {})) as response:
+        response.read()
+        assert response.status == 200, response.status
+    return time.perf_counter() - start
+
+
+def wait_ready(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            get(url)
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise SystemExit(f'gunicorn did not become ready within {timeout}s')
+
+
+def worker_memory(master_pid):
+    """Memory of each child of the master in kB, from /proc/<pid>/smaps_rollup"""
+    with open(f'/proc/{master_pid}/task/{master_pid}/children') as children:
+        pids = [int(pid) for pid in children.read().split()]
+    workers = []
+    for pid in pids:
+        fields = {}
+        with open(f'/proc/{pid}/smaps_rollup') as rollup:
+            for line in rollup:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    fields[parts[0].rstrip(':')] = int(parts[1])
+        workers.append({
+            'pid': pid,
+            'rss_kb': fields.get('Rss', 0),
+            'pss_kb': fields.get('Pss', 0),
+            'private_kb': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+        })
+    return workers
+
+
+def run_mode(overrides, args, headers):
+    port = args.port
+    env = dict(
+        os.environ,
+        GUNICORN_BIND=f'127.0.0.1:{port}',
+        GUNICORN_WORKERS=str(args.workers),
+        GUNICORN_WORKER_CLASS=args.worker_class,
+        GUNICORN_THREADS=str(args.threads),
+        **overrides
+    )
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        base = f'http://127.0.0.1:{port}'
+        start = time.perf_counter()
+        wait_ready(base + '/health')
+        result = {'ready_s': round(time.perf_counter() - start, 3), 'endpoints': {}}
+
+        for endpoint in ENDPOINTS:
+            first = get(base + endpoint, headers)
+            rest = [get(base + endpoint, headers) for _ in range(args.iterations)]
+            result['endpoints'][endpoint] = {'first_ms': round(first * 1000, 3), **summarize(rest)}
+
+        result['workers'] = worker_memory(process.pid)
+        result['total_pss_kb'] = sum(worker['pss_kb'] for worker in result['workers'])
+        return result
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--domain', required=True, help='Domain name of a seeded tenant')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--worker-class', default='gthread')
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--iterations', type=int, default=50, help='Requests per endpoint after the first')
+    parser.add_argument('--port', type=int, default=5099)
+    args = parser.parse_args()
+
+    headers = auth_headers(make_app(), args.domain)
+    results = {mode: run_mode(overrides, args, headers) for mode, overrides in MODES.items()}
+    print(json.dumps(results, indent=2))
+
+    for mode, result in results.items():
+        first = '  '.join(f"{endpoint} {stats['first_ms']:8.1f} ms" for endpoint, stats in result['endpoints'].items())
+        print(f"{mode:15} ready {result['ready_s']:6.2f} s  PSS {result['total_pss_kb'] / 1024:7.1f} MB  first: {first}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/common.py
+"""Shared helpers for the benchmark scripts in this directory."""
+import statistics
+import time
+from flask_jwt_extended import create_access_token
+from werkzeug.test import Client
+from app import create_app
+from app.config import Config
+from app.models import Tenant, User
+
+
+def make_app(**overrides):
+    """Build the app from Config with selected settings overridden"""
+    config_class = type('BenchmarkConfig', (Config,), overrides)
+    return create_app(config_class)
+
+
+def make_client(app):
+    # werkzeug's client is used directly; it does not depend on Flask's test
+    # client, which is incompatible with the pinned werkzeug release
+    return Client(app, use_cookies=False)
+
+
+def auth_headers(app, domain_name):
+    """Authorization header for the first admin user of the given tenant"""
+    with app.app_context():
+        tenant = Tenant.query.filter_by(domain_name=domain_name).first()
+        if tenant is None:
+            raise SystemExit(f'No tenant with domain {domain_name!r}; seed the database first')
+        user = User.query.filter_by(tenant_id=tenant.id, role='admin').first()
+        token = create_access_token(identity=str(user.id), additional_claims={'tenant_id': str(tenant.id)})
+    return {'Authorization': f'Bearer {token}'}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples):
+    """Latency summary in milliseconds for a list of durations in seconds"""
+    return {
+        'count': len(samples),
+        'mean_ms': round(statistics.fmean(samples) * 1000, 3),
+        'p50_ms': round(percentile(samples, 50) * 1000, 3),
+        'p95_ms': round(percentile(samples, 95) * 1000, 3),
+        'p99_ms': round(percentile(samples, 99) * 1000, 3),
+    }
+
+
+def time_calls(fn, iterations, warmup=0):
+    """Call fn repeatedly and return the per-call durations in seconds"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
@@ -0,0 +1,296 @@
+# benchmarks/loadtest.py
+"""
+Drive a realistic request mix (logins, goal and initiative lists, creates,
+updates and deletes) through the app from concurrent clients, and record the
+p50/p95/p99 latency, throughput and SQL statements (from the Server-Timing
+header) of every operation.
+
+The app is built with create_app against the database in DATABASE_URL. A
+tenant of the chosen size is seeded first, deterministically from --seed, and
+reused by later runs. Results are written to --output; with --baseline, they
+are compared against an earlier results file and the run fails (exit code 1)
+when an operation got slower than --tolerance allows or runs more statements.
+
+    python -m benchmarks.loadtest --size medium --concurrency 8 --duration 30 --output results.json
+    python -m benchmarks.loadtest --size medium --baseline results.json
+"""
+import argparse
+import json
+import logging
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from sqlalchemy import insert
+from sqlalchemy.engine import make_url
+from app.auth.utils import password_hasher
+from app.extensions import db
+from app.models import Tenant, User, Goal, Initiative
+from benchmarks.common import make_app, make_client, auth_headers, summarize
+
+PASSWORD = 'loadtest-password'
+
+# Rows seeded per tenant size
+TENANT_SIZES = {
+    'small': {'users': 5, 'goals': 20, 'initiatives': 50},
+    'medium': {'users': 50, 'goals': 200, 'initiatives': 2000},
+    'large': {'users': 500, 'goals': 2000, 'initiatives': 20000},
+}
+
+# Relative frequency of each operation in the mix
+MIX = {
+    'login': 1,
+    'list_goals': 6,
+    'list_initiatives': 6,
+    'create_goal': 2,
+    'update_goal': 2,
+    'delete_goal': 1,
+    'create_initiative': 1,
+}
+
+STATEMENTS = re.compile(r'desc="(\d+) statements"')
+
+
+def seeded_uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def seed_tenant(app, size, seed):
+    """
+    Create the load test tenant of the given size unless it exists
+
+    Returns the tenant's domain name, user emails and seeded goal ids
+    """
+    counts = TENANT_SIZES[size]
+    domain = f'loadtest-{size}.example.com'
+    rng = random.Random(seed)
+    emails = [f'user{index}@{domain}' for index in range(counts['users'])]
+
+    with app.app_context():
+        tenant = Tenant.query.filter_by(domain_name=domain).first()
+        if tenant is not None:
+            goal_ids = list(db.session.execute(db.select(Goal.id).where(Goal.tenant_id == tenant.id)).scalars())
+            return domain, emails, goal_ids
+
+        tenant_id = seeded_uuid(rng)
+        now = datetime(2024, 1, 1)
+        password_hash = password_hasher.hash(PASSWORD)  # Shared; hashing per user would dominate seeding
+
+        db.session.execute(insert(Tenant), [{'id': tenant_id, 'domain_name': domain, 'plan_tier': 'enterprise'}])
+        db.session.execute(insert(User), [
+            {
+                'id': seeded_uuid(rng),
+                'tenant_id': tenant_id,
+                'email': email,
+                'password_hash': password_hash,
+                'role': 'admin' if index == 0 else 'user',
+            }
+            for index, email in enumerate(emails)
+        ])
+
+        goal_ids = [seeded_uuid(rng) for _ in range(counts['goals'])]
+        db.session.execute(insert(Goal), [
+            {
+                'id': goal_id,
+                'tenant_id': tenant_id,
+                'title': f'Goal {index}',
+                'description': 'Seeded goal ' * rng.randint(1, 10),
+                'target_date': date(2025, 1, 1) + timedelta(days=rng.randint(0, 365)),
+                'status': rng.choice(['In Progress', 'Completed']),
+                'created_at': now + timedelta(minutes=index),
+                'updated_at': now + timedelta(minutes=index),
+            }
+            for index, goal_id in enumerate(goal_ids)
+        ])
+        db.session.execute(insert(Initiative), [
+            {
+                'id': seeded_uuid(rng),
+                'tenant_id': tenant_id,
+                'goal_id': rng.choice(goal_ids) if rng.random() < 0.8 else None,
+                'title': f'Initiative {index}',
+                'description': 'Seeded initiative ' * rng.randint(1, 10),
+                'status': rng.choice(['active', 'planned', 'completed']),
+                'priority': rng.randint(1, 5),
+                'created_at': now + timedelta(minutes=index),
+                'updated_at': now + timedelta(minutes=index),
+            }
+            for index in range(counts['initiatives'])
+        ])
+        db.session.commit()
+    return domain, emails, goal_ids
+
+
+class Worker:
+    """One client running the mix; keeps the goals it created for updates and deletes"""
+
+    def __init__(self, app, headers, emails, goal_ids, seed):
+        self.client = make_client(app)
+        self.headers = headers
+        self.emails = emails
+        self.goal_ids = goal_ids
+        self.created = []
+        self.rng = random.Random(seed)
+        self.samples = {operation: [] for operation in MIX}
+
+    def request(self, method, path, **kwargs):
+        start = time.perf_counter()
+        response = self.client.open(path, method=method, headers=self.headers, **kwargs)
+        duration = time.perf_counter() - start
+        match = STATEMENTS.search(response.headers.get('Server-Timing', ''))
+        return response, duration, int(match.group(1)) if match else None
+
+    def run_operation(self, operation):
+        rng = self.rng
+        if operation == 'login':
+            return self.request('POST', '/auth/login', json={'email': rng.choice(self.emails), 'password': PASSWORD})
+        if operation == 'list_goals':
+            return self.request('GET', '/api/goals?limit=50')
+        if operation == 'list_initiatives':
+            return self.request('GET', '/api/initiatives?limit=50')
+        if operation == 'create_goal':
+            result = self.request('POST', '/api/goals', json={'title': f'Load test goal {rng.random():.6f}'})
+            if result[0].status_code == 201:
+                self.created.append(result[0].json['id'])
+            return result
+        if operation == 'update_goal':
+            goal_id = rng.choice(self.created or self.goal_ids)
+            return self.request('PUT', f'/api/goals/{goal_id}', json={'status': rng.choice(['In Progress', 'Completed'])})
+        if operation == 'delete_goal':
+            return self.request('DELETE', f'/api/goals/{self.created.pop()}')
+        if operation == 'create_initiative':
+            return self.request('POST', '/api/initiatives', json={
+                'title': f'Load test initiative {rng.random():.6f}',
+                'status': 'planned',
+                'priority': rng.randint(1, 5),
+                'goal_id': str(rng.choice(self.goal_ids)) if self.goal_ids else None,
+            })
+        raise ValueError(operation)
+
+    def next_operation(self):
+        operation = self.rng.choices(list(MIX), list(MIX.values()))[0]
+        if operation == 'delete_goal' and not self.created:
+            operation = 'create_goal'
+        return operation
+
+    def warm_up(self, requests):
+        for _ in range(requests):
+            self.run_operation(self.next_operation())
+
+    def run(self, deadline):
+        while time.monotonic() < deadline:
+            operation = self.next_operation()
+            response, duration, statements = self.run_operation(operation)
+            self.samples[operation].append((duration, response.status_code, statements))
+
+
+def run(args):
+    app = make_app()
+    logging.getLogger('app.requests').setLevel(logging.WARNING)  # One log line per request otherwise
+
+    domain, emails, goal_ids = seed_tenant(app, args.size, args.seed)
+    headers = auth_headers(app, domain)
+
+    workers = [Worker(app, headers, emails, goal_ids, args.seed + index) for index in range(args.concurrency)]
+    for worker in workers:
+        worker.warm_up(args.warmup)
+
+    start = time.monotonic()
+    deadline = start + args.duration
+    threads = [threading.Thread(target=worker.run, args=(deadline,)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    operations = {}
+    for operation in MIX:
+        samples = [sample for worker in workers for sample in worker.samples[operation]]
+        if not samples:
+            continue
+        statements = [count for _, _, count in samples if count is not None]
+        operations[operation] = {
+            **summarize([duration for duration, _, _ in samples]),
+            'errors': sum(1 for _, status, _ in samples if status >= 400),
+            'throughput_rps': round(len(samples) / elapsed, 2),
+            'statements_max': max(statements) if statements else None,
+            'statements_mean': round(sum(statements) / len(statements), 2) if statements else None,
+        }
+
+    total = sum(result['count'] for result in operations.values())
+    return {
+        'meta': {
+            'size': args.size,
+            'seed': args.seed,
+            'concurrency': args.concurrency,
+            'duration_s': round(elapsed, 3),
+            'database': make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name(),
+            'requests': total,
+            'throughput_rps': round(total / elapsed, 2),
+        },
+        'operations': operations,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print each operation against the baseline; returns the list of regressions"""
+    regressions = []
+    for operation, current in results['operations'].items():
+        before = baseline.get('operations', {}).get(operation)
+        if before is None:
+            continue
+        p95_limit = before['p95_ms'] * (1 + tolerance)
+        slower = current['p95_ms'] > p95_limit
+        more_statements = (
+            current['statements_max'] is not None and before['statements_max'] is not None
+            and current['statements_max'] > before['statements_max']
+        )
+        flag = 'REGRESSION' if slower or more_statements else 'ok'
+        print(
+            f"{operation:18} p95 {before['p95_ms']:9.2f} -> {current['p95_ms']:9.2f} ms  "
+            f"statements {before['statements_max']} -> {current['statements_max']}  {flag}"
+        )
+        if slower:
+            regressions.append(f'{operation}: p95 {current["p95_ms"]} ms > {p95_limit:.2f} ms')
+        if more_statements:
+            regressions.append(f'{operation}: {current["statements_max"]} statements > {before["statements_max"]}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', choices=TENANT_SIZES, default='small', help='Size of the seeded tenant')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds to measure')
+    parser.add_argument('--warmup', type=int, default=20, help='Unmeasured requests per client first')
+    parser.add_argument('--output', default='loadtest-results.json')
+    parser.add_argument('--baseline', help='Earlier results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed p95 increase over the baseline (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    results = run(args)
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2)
+
+    print(json.dumps(results['meta'], indent=2))
+    for operation, result in results['operations'].items():
+        print(
+            f"{operation:18} n={result['count']:6}  p50 {result['p50_ms']:8.2f}  p95 {result['p95_ms']:8.2f}  "
+            f"p99 {result['p99_ms']:8.2f} ms  {result['throughput_rps']:8.1f} rps  "
+            f"statements {result['statements_max']}  errors {result['errors']}"
+        )
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        if regressions:
+            print('\n'.join(['Regressions:'] + regressions))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,9 @@
 -- Create extension for UUID generation
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Lets GIN indexes combine tenant_id with a tsvector column
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
 -- Tenants table for multi-tenant support
 CREATE TABLE tenants (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -29,6 +32,7 @@ CREATE TABLE goals (
     title VARCHAR(100) NOT NULL,
     description TEXT,
     target_date DATE,
+    initiative_count INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -42,6 +46,13 @@ CREATE TABLE initiatives (
     description TEXT,
     status VARCHAR(20) NOT NULL CHECK (status IN ('active', 'planned', 'completed')),
     priority INTEGER NOT NULL CHECK (priority BETWEEN 1 AND 5),
+    idea_count INTEGER NOT NULL DEFAULT 0,
+    feedback_count INTEGER NOT NULL DEFAULT 0,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -68,6 +79,10 @@ CREATE TABLE ideas (
     effort VARCHAR(5) NOT NULL CHECK (effort IN ('xs', 's', 'm', 'l', 'xl')),
     source VARCHAR(50) NOT NULL,
     status VARCHAR(20) NOT NULL CHECK (status IN ('new', 'planned', 'completed', 'rejected')),
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -79,6 +94,10 @@ CREATE TABLE feedback (
     title VARCHAR(100) NOT NULL,
     description TEXT,
     sentiment VARCHAR(20) NOT NULL CHECK (sentiment IN ('positive', 'neutral', 'negative')),
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -94,6 +113,22 @@ CREATE TABLE comments (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Tenant offboarding jobs (DELETE /api/tenants/<id>). No foreign key to
+-- tenants: the job record outlives the tenant it deleted.
+CREATE TABLE tenant_deletions (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    tenant_id UUID NOT NULL UNIQUE,
+    domain_name VARCHAR(255) NOT NULL,
+    requested_by UUID,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'failed')),
+    current_table VARCHAR(50),
+    rows_deleted BIGINT NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP WITH TIME ZONE
+);
+
 -- Junction table for Ideas and Customers (many-to-many)
 CREATE TABLE ideas_customers (
     idea_id UUID REFERENCES ideas(id) ON DELETE CASCADE,
@@ -117,6 +152,7 @@ CREATE TABLE feedback_initiatives (
 
 -- Add indexes for performance
 CREATE INDEX idx_users_tenant_id ON users(tenant_id);
+CREATE INDEX idx_users_email ON users(email);
 CREATE INDEX idx_goals_tenant_id ON goals(tenant_id);
 CREATE INDEX idx_initiatives_tenant_id ON initiatives(tenant_id);
 CREATE INDEX idx_initiatives_goal_id ON initiatives(goal_id);
@@ -133,6 +169,29 @@ CREATE INDEX idx_feedback_customers_customer_id ON feedback_customers(customer_i
 CREATE INDEX idx_feedback_initiatives_feedback_id ON feedback_initiatives(feedback_id);
 CREATE INDEX idx_feedback_initiatives_initiative_id ON feedback_initiatives(initiative_id);
 
+-- Composite indexes matching the keyset pagination order of the list endpoints
+CREATE INDEX idx_users_tenant_created_at ON users(tenant_id, created_at, id);
+CREATE INDEX idx_goals_tenant_created_at ON goals(tenant_id, created_at, id);
+CREATE INDEX idx_initiatives_tenant_priority ON initiatives(tenant_id, priority DESC, created_at, id);
+
+-- Keyset order of the streaming exports (goals and initiatives reuse the indexes above)
+CREATE INDEX idx_ideas_tenant_created_at ON ideas(tenant_id, created_at, id);
+CREATE INDEX idx_feedback_tenant_created_at ON feedback(tenant_id, created_at, id);
+CREATE INDEX idx_comments_user_created_at ON comments(user_id, created_at, id);
+
+-- Covering indexes for the per-tenant collection version (count, max(updated_at)) behind ETags
+CREATE INDEX idx_goals_tenant_updated_at ON goals(tenant_id, updated_at);
+CREATE INDEX idx_initiatives_tenant_updated_at ON initiatives(tenant_id, updated_at);
+
+-- Recent activity on the dashboard summary (goals and initiatives use the indexes above)
+CREATE INDEX idx_ideas_tenant_updated_at ON ideas(tenant_id, updated_at);
+CREATE INDEX idx_feedback_tenant_updated_at ON feedback(tenant_id, updated_at);
+
+-- Full-text search (/api/search): tenant-scoped GIN indexes on the generated tsvectors
+CREATE INDEX idx_ideas_search ON ideas USING GIN (tenant_id, search_vector);
+CREATE INDEX idx_feedback_search ON feedback USING GIN (tenant_id, search_vector);
+CREATE INDEX idx_initiatives_search ON initiatives USING GIN (tenant_id, search_vector);
+
 -- Add triggers to update the updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -150,22 +209,138 @@ CREATE TRIGGER update_customers_updated_at BEFORE UPDATE ON customers FOR EACH R
 CREATE TRIGGER update_ideas_updated_at BEFORE UPDATE ON ideas FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_feedback_updated_at BEFORE UPDATE ON feedback FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_comments_updated_at BEFORE UPDATE ON comments FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+CREATE TRIGGER update_tenant_deletions_updated_at BEFORE UPDATE ON tenant_deletions FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Keep the denormalized rollup counters in step with their child rows.
+-- These run for ORM writes, bulk inserts and COPY alike; `flask repair-counters`
+-- recomputes them if they ever drift.
+CREATE OR REPLACE FUNCTION maintain_goal_initiative_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.goal_id IS NOT DISTINCT FROM NEW.goal_id THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.goal_id IS NOT NULL THEN
+        UPDATE goals SET initiative_count = initiative_count - 1 WHERE id = OLD.goal_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.goal_id IS NOT NULL THEN
+        UPDATE goals SET initiative_count = initiative_count + 1 WHERE id = NEW.goal_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_initiative_idea_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.initiative_id IS NOT DISTINCT FROM NEW.initiative_id THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.initiative_id IS NOT NULL THEN
+        UPDATE initiatives SET idea_count = idea_count - 1 WHERE id = OLD.initiative_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.initiative_id IS NOT NULL THEN
+        UPDATE initiatives SET idea_count = idea_count + 1 WHERE id = NEW.initiative_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_initiative_feedback_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE initiatives SET feedback_count = feedback_count - 1 WHERE id = OLD.initiative_id;
+    ELSE
+        UPDATE initiatives SET feedback_count = feedback_count + 1 WHERE id = NEW.initiative_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_initiative_comment_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.entity_type = NEW.entity_type AND OLD.entity_id = NEW.entity_id THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.entity_type = 'initiative' THEN
+        UPDATE initiatives SET comment_count = comment_count - 1 WHERE id = OLD.entity_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.entity_type = 'initiative' THEN
+        UPDATE initiatives SET comment_count = comment_count + 1 WHERE id = NEW.entity_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER maintain_goal_initiative_count AFTER INSERT OR DELETE OR UPDATE OF goal_id ON initiatives FOR EACH ROW EXECUTE FUNCTION maintain_goal_initiative_count();
+CREATE TRIGGER maintain_initiative_idea_count AFTER INSERT OR DELETE OR UPDATE OF initiative_id ON ideas FOR EACH ROW EXECUTE FUNCTION maintain_initiative_idea_count();
+CREATE TRIGGER maintain_initiative_feedback_count AFTER INSERT OR DELETE ON feedback_initiatives FOR EACH ROW EXECUTE FUNCTION maintain_initiative_feedback_count();
+CREATE TRIGGER maintain_initiative_comment_count AFTER INSERT OR DELETE OR UPDATE OF entity_type, entity_id ON comments FOR EACH ROW EXECUTE FUNCTION maintain_initiative_comment_count();
+
+-- Comments reference their idea, feedback or initiative by (entity_type, entity_id)
+-- without a foreign key, so delete them along with the entity. Statement-level,
+-- so a DELETE ... RETURNING from the API or a cascade removes them in one pass.
+CREATE OR REPLACE FUNCTION delete_entity_comments()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM comments
+    WHERE entity_type = TG_ARGV[0] AND entity_id IN (SELECT id FROM deleted_rows);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER delete_idea_comments AFTER DELETE ON ideas REFERENCING OLD TABLE AS deleted_rows FOR EACH STATEMENT EXECUTE FUNCTION delete_entity_comments('idea');
+CREATE TRIGGER delete_feedback_comments AFTER DELETE ON feedback REFERENCING OLD TABLE AS deleted_rows FOR EACH STATEMENT EXECUTE FUNCTION delete_entity_comments('feedback');
+CREATE TRIGGER delete_initiative_comments AFTER DELETE ON initiatives REFERENCING OLD TABLE AS deleted_rows FOR EACH STATEMENT EXECUTE FUNCTION delete_entity_comments('initiative');
+
+-- Per-customer idea/feedback counts, kept in step with the junction tables by
+-- the triggers below instead of re-counting them on every read.
+-- `flask repair-counters` recomputes them if they ever drift.
+CREATE TABLE customer_stats (
+    customer_id UUID PRIMARY KEY REFERENCES customers(id) ON DELETE CASCADE,
+    tenant_id UUID NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+    idea_count INTEGER NOT NULL DEFAULT 0,
+    feedback_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION create_customer_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO customer_stats (customer_id, tenant_id) VALUES (NEW.id, NEW.tenant_id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_customer_idea_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE customer_stats SET idea_count = idea_count - 1 WHERE customer_id = OLD.customer_id;
+    ELSE
+        UPDATE customer_stats SET idea_count = idea_count + 1 WHERE customer_id = NEW.customer_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_customer_feedback_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE customer_stats SET feedback_count = feedback_count - 1 WHERE customer_id = OLD.customer_id;
+    ELSE
+        UPDATE customer_stats SET feedback_count = feedback_count + 1 WHERE customer_id = NEW.customer_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER create_customer_stats AFTER INSERT ON customers FOR EACH ROW EXECUTE FUNCTION create_customer_stats();
+CREATE TRIGGER maintain_customer_idea_count AFTER INSERT OR DELETE ON ideas_customers FOR EACH ROW EXECUTE FUNCTION maintain_customer_idea_count();
+CREATE TRIGGER maintain_customer_feedback_count AFTER INSERT OR DELETE ON feedback_customers FOR EACH ROW EXECUTE FUNCTION maintain_customer_feedback_count();
 
--- Add computed columns for customer stats (using views)
-CREATE VIEW customer_stats AS
-SELECT 
-    c.id, 
-    c.tenant_id,
-    c.name,
-    c.revenue,
-    c.status,
-    COUNT(DISTINCT ic.idea_id) AS idea_count,
-    COUNT(DISTINCT fc.feedback_id) AS feedback_count
-FROM 
-    customers c
-LEFT JOIN 
-    ideas_customers ic ON c.id = ic.customer_id
-LEFT JOIN 
-    feedback_customers fc ON c.id = fc.customer_id
-GROUP BY 
-    c.id, c.tenant_id, c.name, c.revenue, c.status;
\ No newline at end of file
+-- Customer list sort orders (keyset pagination); revenue sorts NULL as 0
+CREATE INDEX idx_customers_tenant_revenue ON customers(tenant_id, COALESCE(revenue, 0) DESC, id);
+CREATE INDEX idx_customers_tenant_status ON customers(tenant_id, status, id);
\ No newline at end of file
@@ -0,0 +1,55 @@
+-- Optional row-level security, backing up the application's tenant scoping.
+-- Not run by the container's init (it only reads files at the top of
+-- db-init/); apply it by hand after database-setup.sql:
+--
+--   psql -U $POSTGRES_USER -d $POSTGRES_DB -f db-init/rls/row-level-security.sql
+--
+-- and run the app with TENANT_RLS=true, connected as a role that does not own
+-- the tables (owners and superusers bypass these policies). Each transaction
+-- of an authenticated request then runs
+--   SELECT set_config('app.tenant_id', '<tenant uuid>', true)
+-- and only sees and writes rows of that tenant.
+--
+-- The policies fail closed: a transaction that never set app.tenant_id sees
+-- no rows and can write none. The few lookups that come before the tenant is
+-- known or span tenants (sign-in by email alone, registration's email check,
+-- flask repair-counters) run under SET LOCAL ROLE echo_rls_bypass, a NOLOGIN
+-- role with BYPASSRLS (TENANT_RLS_BYPASS_ROLE). Grant it to the app's role:
+--
+--   GRANT echo_rls_bypass TO <app role>;
+--
+-- flask seed disables triggers and so still has to connect as the owner.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'echo_rls_bypass') THEN
+        CREATE ROLE echo_rls_bypass NOLOGIN BYPASSRLS;
+    END IF;
+END
+$$;
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA public TO echo_rls_bypass;
+GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO echo_rls_bypass;
+
+CREATE OR REPLACE FUNCTION current_tenant_id()
+RETURNS UUID AS $$
+    SELECT NULLIF(current_setting('app.tenant_id', true), '')::uuid;
+$$ LANGUAGE sql STABLE;
+
+DO $$
+DECLARE
+    table_name TEXT;
+BEGIN
+    FOREACH table_name IN ARRAY ARRAY['users', 'goals', 'initiatives', 'customers', 'customer_stats', 'ideas', 'feedback']
+    LOOP
+        EXECUTE format('ALTER TABLE %I ENABLE ROW LEVEL SECURITY', table_name);
+        EXECUTE format('DROP POLICY IF EXISTS tenant_isolation ON %I', table_name);
+        EXECUTE format(
+            'CREATE POLICY tenant_isolation ON %I '
+            'USING (tenant_id = current_tenant_id()) '
+            'WITH CHECK (tenant_id = current_tenant_id())',
+            table_name
+        );
+    END LOOP;
+END
+$$;
@@ -0,0 +1,93 @@
+# gunicorn.conf.py
+"""
+Production serving profile, read by gunicorn from the working directory:
+
+    gunicorn --config gunicorn.conf.py
+
+The app is imported once in the master (preload_app), warmed up (ORM mappers
+configured, templates compiled) and then forked, so workers start serving
+immediately and share the preloaded heap copy-on-write. Each worker drops the
+connection pools it inherited and opens its own.
+
+Settings come from the environment:
+- GUNICORN_BIND: Address to listen on (default 0.0.0.0:$WEB_PORT, or 0.0.0.0:5000)
+- GUNICORN_WORKERS: Worker processes (default 4)
+- GUNICORN_WORKER_CLASS: sync, gthread, gevent, ... (default gthread)
+- GUNICORN_THREADS: Threads per worker for gthread (default 4)
+- GUNICORN_TIMEOUT: Seconds before a silent worker is restarted (default 30)
+- GUNICORN_PRELOAD: Import and warm up the app before forking (default true)
+- GUNICORN_GC_FREEZE: gc.freeze() the preloaded heap before forking, so
+  garbage collection in workers does not touch (and copy) its pages (default true)
+- PROMETHEUS_MULTIPROC_DIR: Directory where workers write their metrics for
+  /metrics to sum (default <tmp>/echo-prometheus; emptied at startup)
+"""
+import gc
+import glob
+import os
+import tempfile
+
+
+# Compose passes unset build args through as empty strings, so an empty
+# value falls back to the default like a missing one
+def _env(name, default):
+    return os.environ.get(name) or default
+
+
+def _env_flag(name, default):
+    return _env(name, default).lower() in ('1', 'true', 'yes')
+
+
+wsgi_app = 'app:create_app()'
+
+bind = _env('GUNICORN_BIND', f"0.0.0.0:{_env('WEB_PORT', '5000')}")
+workers = int(_env('GUNICORN_WORKERS', '4'))
+worker_class = _env('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(_env('GUNICORN_THREADS', '4'))
+timeout = int(_env('GUNICORN_TIMEOUT', '30'))
+preload_app = _env_flag('GUNICORN_PRELOAD', 'true')
+accesslog = '-'
+
+GC_FREEZE = _env_flag('GUNICORN_GC_FREEZE', 'true')
+
+# Each worker keeps its own metrics; in multiprocess mode prometheus_client
+# writes them to files so /metrics can add up all workers. This has to be set
+# before the app (and so prometheus_client) is imported, and files left by a
+# previous run would otherwise be summed in.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'echo-prometheus'))
+os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+for path in glob.glob(os.path.join(os.environ['PROMETHEUS_MULTIPROC_DIR'], '*.db')):
+    os.remove(path)
+
+
+def when_ready(server):
+    # Runs in the master after the app is loaded and before any worker forks
+    if not preload_app:
+        return
+
+    from app import warm_up
+    warm_up(server.app.wsgi())
+
+    if GC_FREEZE:
+        # Move everything allocated so far into the permanent generation;
+        # workers' collections then skip it instead of writing to its pages
+        gc.collect()
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from app.database import dispose_engines
+        dispose_engines(server.app.wsgi())
+
+
+def post_worker_init(worker):
+    # Start the tenant deletion thread, which resumes jobs left unfinished by
+    # a worker that died or was restarted
+    from app.services.tenant_deletion_service import TenantDeletionService
+    TenantDeletionService.start_worker(worker.wsgi)
+
+
+def child_exit(server, worker):
+    # Drop the worker's live gauges (pool connections in use) from the totals
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
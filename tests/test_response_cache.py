@@ -0,0 +1,114 @@
+# tests/test_response_cache.py
+import uuid
+
+import pytest
+from sqlalchemy import insert
+
+from app import create_app
+from app.config import Config
+from app.extensions import db, response_cache
+from app.models import Tenant, Goal, Initiative
+from app.response_cache import RedisBackend, ALL_TENANTS
+
+
+class FakeRedis:
+    """Local stand-in for the redis-py calls RedisBackend makes"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+class TestConfig(Config):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SECRET_KEY = 'test'
+    JWT_SECRET_KEY = 'test-jwt-secret-key-of-32-bytes!'
+    RESPONSE_CACHE_BACKEND = 'none'
+    TENANT_RLS = False
+    TESTING = True
+
+
+@pytest.fixture
+def tenants():
+    app = create_app(TestConfig)
+    with app.app_context():
+        db.create_all()
+        response_cache.backend = RedisBackend(client=FakeRedis())
+        first, second = Tenant(domain_name='first.example.com'), Tenant(domain_name='second.example.com')
+        db.session.add_all([first, second])
+        db.session.commit()
+        yield first.id, second.id
+        response_cache.backend = None
+        db.session.remove()
+
+
+def generations(tenant_id):
+    resources = ('goals', 'initiatives', 'dashboard')
+    keys = [f'gen:{tenant_id}:{resource}' for resource in resources]
+    return dict(zip(resources, response_cache.backend.get_generations(keys)))
+
+
+def assert_bumped_only(tenant_id, other_id, before):
+    assert generations(tenant_id) == {resource: count + 1 for resource, count in before.items()}
+    assert generations(other_id) == {'goals': 0, 'initiatives': 0, 'dashboard': 0}
+    assert generations(ALL_TENANTS) == {'goals': 0, 'initiatives': 0, 'dashboard': 0}
+
+
+def test_orm_flush_bumps_only_the_writers_tenant(tenants):
+    tenant_id, other_id = tenants
+    before = generations(tenant_id)
+
+    db.session.add(Goal(tenant_id=tenant_id, title='Grow'))
+    db.session.commit()
+
+    assert_bumped_only(tenant_id, other_id, before)
+
+
+def test_update_for_tenant_bumps_only_the_writers_tenant(tenants):
+    tenant_id, other_id = tenants
+    goal = Goal(tenant_id=tenant_id, title='Grow')
+    db.session.add(goal)
+    db.session.commit()
+    goal_id = goal.id
+    before = generations(tenant_id)
+
+    row = Goal.query.update_for_tenant(goal_id, tenant_id, {'title': 'Grow faster'}, [Goal.id])
+    db.session.commit()
+
+    assert row is not None
+    assert_bumped_only(tenant_id, other_id, before)
+
+
+def test_bulk_insert_bumps_only_the_writers_tenant(tenants):
+    tenant_id, other_id = tenants
+    before = generations(tenant_id)
+
+    db.session.execute(insert(Initiative), [
+        {'id': uuid.uuid4(), 'tenant_id': tenant_id, 'title': f'Initiative {n}', 'status': 'planned', 'priority': 3}
+        for n in range(3)
+    ])
+    db.session.commit()
+
+    assert_bumped_only(tenant_id, other_id, before)
+
+
+def test_cached_entries_round_trip_and_count_lookups(tenants):
+    backend = response_cache.backend
+
+    assert backend.get('resp:missing') is None
+    backend.set('resp:present', ('"abc"', b'[]'), 30)
+
+    assert backend.get('resp:present') == ('"abc"', b'[]')
+    assert backend.stats() == {'hits': 1, 'misses': 1}